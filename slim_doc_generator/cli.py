@@ -1,6 +1,7 @@
 """
 Command-line interface for the SLIM Documentation Generator.
 """
+import functools
 import logging
 import os
 import sys
@@ -8,15 +9,14 @@ from typing import Optional
 
 import click
 
-from slim_doc_generator.generator import SlimDocGenerator
-from slim_doc_generator.site_reviser import SiteReviser
-from slim_doc_generator.enhancer.ai_enhancer import AIEnhancer
-
 
+@functools.lru_cache(maxsize=2)
 def setup_logging(verbose: bool = False) -> logging.Logger:
     """
     Set up logging configuration.
     
+    Configuration is applied once per verbosity level; repeated calls return the same logger.
+    
     Args:
         verbose: Whether to enable verbose logging
         
@@ -54,6 +54,8 @@ def setup_logging(verbose: bool = False) -> logging.Logger:
               help='Generate only the template without any modifications')
 @click.option('--revise-site', is_flag=True,
               help='Revise the site landing page based on documentation content')
+@click.option('--no-cache', is_flag=True,
+              help='Ignore and do not write cached results from previous runs')
 def main(
     repo_path: Optional[str],
     output_dir: str,
@@ -62,7 +64,8 @@ def main(
     config: Optional[str],
     verbose: bool,
     template_only: bool,
-    revise_site: bool
+    revise_site: bool,
+    no_cache: bool
 ) -> int:
     """
     Generate documentation for a repository using the SLIM docsite template.
@@ -85,19 +88,23 @@ def main(
                 click.echo(f"Error: The directory {output_dir} does not exist. Please specify an existing documentation site.")
                 return 1
             
+            # Import here so that other commands and --help don't pay for these modules
+            from slim_doc_generator.site_reviser import SiteReviser
+            
             # Initialize AI enhancer if requested
             ai_enhancer = None
             if use_ai:
                 try:
+                    from slim_doc_generator.enhancer.ai_enhancer import AIEnhancer
                     logger.info(f"Initializing AI enhancer with model: {use_ai}")
-                    ai_enhancer = AIEnhancer(use_ai, logger)
+                    ai_enhancer = AIEnhancer(use_ai, logger, use_cache=not no_cache)
                 except Exception as e:
                     logger.error(f"Failed to initialize AI enhancer: {str(e)}")
                     click.echo(f"Error: Failed to initialize AI enhancer: {str(e)}")
                     return 1
             
             # Just run site reviser on existing output directory
-            site_reviser = SiteReviser(output_dir, logger, ai_enhancer)
+            site_reviser = SiteReviser(output_dir, logger, ai_enhancer, use_cache=not no_cache)
             if site_reviser.revise():
                 logger.info(f"Successfully revised site landing page at {output_dir}")
                 click.echo(f"Successfully revised site landing page at {output_dir}")
@@ -113,6 +120,9 @@ def main(
             logger.info("No repository path provided - activating template-only mode")
             click.echo("Template-only mode activated: Will generate the template without any modifications")
         
+        # Import here so that --help and --revise-site don't load the analyzer and its git dependency
+        from slim_doc_generator.generator import SlimDocGenerator
+        
         # Create generator
         generator = SlimDocGenerator(
             target_repo_path=repo_path,
@@ -122,7 +132,8 @@ def main(
             config_file=config,
             verbose=verbose,
             template_only=template_only,
-            revise_site=revise_site
+            revise_site=revise_site,
+            use_cache=not no_cache
         )
         
         # Generate documentation
@@ -1,10 +1,379 @@
 """
 API documentation generator.
 """
+import ast
+import functools
+import hashlib
+import heapq
+import io
+import json
 import logging
+import multiprocessing
 import os
 import re
-from typing import Dict, List, Optional, Tuple
+import subprocess
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Pattern, Tuple
+
+# Below this many files, source extraction runs in-process on a small thread pool; starting
+# worker processes only pays off for large repositories
+_MIN_FILES_FOR_PROCESS_POOL = 500
+_MAX_READER_THREADS = 8
+
+# Extraction patterns are compiled once at import time and match raw bytes; every keyword and
+# identifier they look for is ASCII, so only the captured spans are ever decoded.
+
+# The Python patterns are only a fallback for unparseable modules. They are anchored to top-level
+# definitions and use bounded character classes so a missing docstring can't backtrack over the file.
+_PY_DOCSTRING_BODY = rb'[^"]*(?:"(?!"")[^"]*)*'
+_PY_CLASS_RE = re.compile(
+    rb'^class[ \t]+(\w+)(?:\([^)]*\))?[ \t]*:[ \t]*(?:\n[ \t]+"""(' + _PY_DOCSTRING_BODY + rb')""")?',
+    re.MULTILINE
+)
+_PY_FUNC_RE = re.compile(
+    rb'^(?:async[ \t]+)?def[ \t]+(\w+)[ \t]*\([^)]*\)[^:\n]*:[ \t]*(?:\n[ \t]+"""(' + _PY_DOCSTRING_BODY + rb')""")?',
+    re.MULTILINE
+)
+_JS_CLASS_RE = re.compile(rb'class\s+(\w+)(?:\s+extends\s+\w+)?(?:\s+implements\s+\w+)?\s*{')
+# Function forms are alternatives of one pattern so each file is scanned once; the name is in
+# whichever group matched
+_JS_FUNC_RE = re.compile(
+    rb'function\s+(\w+)\s*\('  # function declarations
+    rb'|const\s+(\w+)\s*=\s*(?:async\s*)?\(.*?\)\s*=>'  # arrow functions
+    rb'|(\w+)\s*:\s*(?:async\s*)?\(.*?\)\s*=>'  # object method shorthand
+)
+_JAVA_CLASS_RE = re.compile(rb'(?:public|protected|private)?\s+(?:abstract|final)?\s*class\s+(\w+)')
+_JAVA_METHOD_RE = re.compile(
+    rb'(?:public|protected|private|static|\s)+[\w\<\>\[\]]+\s+(\w+)\s*\([^\)]*\)\s*(?:throws[\w\s,]+)?'
+)
+# Doc comments followed by the declaration they document; the comment body stops at the first "*/"
+_JSDOC_BEFORE_RE = re.compile(
+    rb'/\*\*((?:[^*]|\*(?!/))*)\*/\s*'
+    rb'(?:export\s+)?(?:default\s+)?(?:async\s+)?(?:(?:function|class|const|let|var)\s+)?(\w+)'
+)
+_JAVADOC_BEFORE_RE = re.compile(
+    rb'/\*\*((?:[^*]|\*(?!/))*)\*/\s*'
+    rb'(?:@\w+(?:\([^)]*\))?\s*)*'
+    rb'(?:(?:public|protected|private|static|abstract|final|synchronized)\s+)*'
+    rb'(?:class\s+|interface\s+|enum\s+|[\w\<\>\[\]]+\s+)?(\w+)'
+)
+
+# Lowercase names of files treated as existing API documentation
+_API_DOC_FILENAMES = frozenset({"api.md", "api-reference.md", "api-docs.md", "reference.md"})
+
+_FRONTMATTER_RE = re.compile(r'\A---\n.*?\n---\n', re.DOTALL)
+
+_SOURCE_EXTENSIONS = ('.py', '.js', '.ts', '.jsx', '.tsx', '.java')
+
+# Files per source module that get a detailed section in the API reference
+_MAX_DETAILED_FILES_PER_MODULE = 10
+
+# Source files larger than this are skipped; others are only read up to the head limit
+_MAX_SOURCE_FILE_BYTES = 2_000_000
+_SOURCE_HEAD_BYTES = 256 * 1024
+
+# Bump whenever generated output changes so stale cache entries are discarded
+_CACHE_VERSION = 12
+
+
+def _element_cache_path() -> str:
+    """
+    Get the path of the on-disk code element cache.
+    
+    Returns:
+        Path to the cache file under the user's cache directory
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "slim-doc-generator", "extract.json")
+
+
+def _decode(raw: bytes) -> str:
+    """
+    Decode a span of source bytes for display.
+    
+    Args:
+        raw: Bytes captured from a source file
+        
+    Returns:
+        Decoded text, with invalid UTF-8 sequences replaced
+    """
+    return raw.decode('utf-8', 'replace')
+
+
+def _doc_comment_summary(comment: bytes) -> str:
+    """
+    Get the first description line from the body of a JSDoc/JavaDoc comment.
+    
+    Args:
+        comment: Bytes between the opening "/**" and the closing "*/"
+        
+    Returns:
+        First non-empty line before any block tags, or an empty string
+    """
+    for line in _decode(comment).splitlines():
+        line = line.strip().lstrip('*').strip()
+        if line.startswith('@'):
+            break
+        if line:
+            return line
+    return ""
+
+
+@functools.lru_cache(maxsize=8)
+def _index_headings(content: str) -> Tuple[Tuple[int, str, int], ...]:
+    """
+    Index the markdown headings of a document in a single pass.
+    
+    Headings inside fenced code blocks are ignored. The result is cached so several
+    sections can be looked up in the same document without scanning it again.
+    
+    Args:
+        content: Markdown content
+        
+    Returns:
+        Tuple of (level, title, offset) for each heading, in document order
+    """
+    headings = []
+    in_code_block = False
+    offset = 0
+    
+    for line in content.splitlines(keepends=True):
+        stripped = line.lstrip()
+        if stripped.startswith(('```', '~~~')):
+            in_code_block = not in_code_block
+        elif not in_code_block and line.startswith('#'):
+            marker, _, title = line.rstrip().partition(' ')
+            if marker == '#' * len(marker) and len(marker) <= 6 and title.strip():
+                headings.append((len(marker), title.strip(), offset))
+        offset += len(line)
+    
+    return tuple(headings)
+
+
+def _iter_source_files(directory: str) -> Iterator[str]:
+    """
+    Recursively yield paths of source files under a directory.
+    
+    Args:
+        directory: Directory to search in
+        
+    Yields:
+        Paths of files with a supported source extension
+    """
+    pending = [directory]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.endswith(_SOURCE_EXTENSIONS):
+                        yield entry.path
+        except OSError:
+            # Unreadable directories are skipped, as os.walk does
+            continue
+
+
+def _extract_code_elements(file_path: str) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+    """
+    Extract classes and functions from a source file.
+    
+    This runs in worker processes, so it takes only the path and looks up its logger itself
+    rather than receiving one.
+    
+    Args:
+        file_path: Path to the source file
+        
+    Returns:
+        Tuple of (classes, functions) where each is a list of (name, description) tuples
+    """
+    logger = logging.getLogger("slim-doc-generator")
+    classes = []
+    functions = []
+    
+    try:
+        # Very large files are almost always generated or vendored code
+        if os.path.getsize(file_path) > _MAX_SOURCE_FILE_BYTES:
+            logger.debug(f"Skipping large source file {file_path}")
+            return classes, functions
+        
+        file_ext = os.path.splitext(file_path)[1]
+        
+        # The Python parser needs the whole module; pattern-based extractors only need the head.
+        # Files stay undecoded: ast handles encoding declarations itself, and the patterns match bytes.
+        with open(file_path, 'rb') as f:
+            file_content = f.read() if file_ext == '.py' else f.read(_SOURCE_HEAD_BYTES)
+        
+        # Process based on file type
+        if file_ext == '.py':
+            classes, functions = _extract_python_elements(file_content)
+        elif file_ext in {'.js', '.ts', '.jsx', '.tsx'}:
+            classes, functions = _extract_javascript_elements(file_content)
+        elif file_ext == '.java':
+            classes, functions = _extract_java_elements(file_content)
+    
+    except Exception as e:
+        logger.warning(f"Error extracting code elements from {file_path}: {str(e)}")
+    
+    return classes, functions
+
+
+def _extract_python_elements(content: bytes) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+    """
+    Extract classes and functions from Python code.
+    
+    Args:
+        content: Raw Python source
+        
+    Returns:
+        Tuple of (classes, functions) where each is a list of (name, description) tuples
+    """
+    try:
+        tree = ast.parse(content)
+    except SyntaxError:
+        # Not valid Python for this interpreter, fall back to pattern matching
+        return _extract_python_elements_with_regex(content)
+    
+    classes = []
+    functions = []
+    
+    # Only top-level definitions are documented; methods belong to their class
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            classes.append((node.name, _docstring_summary(node)))
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            if not node.name.startswith('_'):  # Skip private functions
+                functions.append((node.name, _docstring_summary(node)))
+    
+    return classes, functions
+
+
+def _docstring_summary(node: ast.AST) -> str:
+    """
+    Get the first line of a node's docstring.
+    
+    Args:
+        node: Class or function definition node
+        
+    Returns:
+        First docstring line, or an empty string if there is no docstring
+    """
+    docstring = ast.get_docstring(node)
+    if not docstring:
+        return ""
+    return docstring.split('\n', 1)[0].strip()
+
+
+def _extract_python_elements_with_regex(content: bytes) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+    """
+    Extract classes and functions from Python code that cannot be parsed.
+    
+    Args:
+        content: Raw Python source
+        
+    Returns:
+        Tuple of (classes, functions) where each is a list of (name, description) tuples
+    """
+    classes = []
+    functions = []
+    
+    # Extract classes
+    class_matches = _PY_CLASS_RE.finditer(content)
+    for match in class_matches:
+        class_name = _decode(match.group(1))
+        class_desc = _decode(match.group(2)).strip().split('\n', 1)[0] if match.group(2) else ""
+        classes.append((class_name, class_desc))
+    
+    # Extract functions (excluding methods in classes)
+    func_matches = _PY_FUNC_RE.finditer(content)
+    for match in func_matches:
+        func_name = _decode(match.group(1))
+        if not func_name.startswith('_'):  # Skip private functions
+            func_desc = _decode(match.group(2)).strip().split('\n', 1)[0] if match.group(2) else ""
+            functions.append((func_name, func_desc))
+    
+    return classes, functions
+
+
+def _extract_javascript_elements(content: bytes) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+    """
+    Extract classes and functions from JavaScript/TypeScript code.
+    
+    Args:
+        content: Raw JavaScript/TypeScript source
+        
+    Returns:
+        Tuple of (classes, functions) where each is a list of (name, description) tuples
+    """
+    classes = []
+    functions = []
+    
+    # Map each documented name to its JSDoc description in a single pass
+    jsdoc_by_name = _index_doc_comments(_JSDOC_BEFORE_RE, content)
+    
+    # Extract classes
+    for match in _JS_CLASS_RE.finditer(content):
+        class_name = _decode(match.group(1))
+        classes.append((class_name, jsdoc_by_name.get(class_name, "")))
+    
+    # Extract functions
+    for match in _JS_FUNC_RE.finditer(content):
+        func_name = _decode(match.group(match.lastindex))
+        if not func_name.startswith('_'):  # Skip private functions
+            functions.append((func_name, jsdoc_by_name.get(func_name, "")))
+    
+    return classes, functions
+
+
+def _extract_java_elements(content: bytes) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+    """
+    Extract classes and methods from Java code.
+    
+    Args:
+        content: Raw Java source
+        
+    Returns:
+        Tuple of (classes, methods) where each is a list of (name, description) tuples
+    """
+    classes = []
+    methods = []
+    
+    # Map each documented name to its JavaDoc description in a single pass
+    javadoc_by_name = _index_doc_comments(_JAVADOC_BEFORE_RE, content)
+    
+    # Extract classes
+    for match in _JAVA_CLASS_RE.finditer(content):
+        class_name = _decode(match.group(1))
+        classes.append((class_name, javadoc_by_name.get(class_name, "")))
+    
+    # Extract methods
+    for match in _JAVA_METHOD_RE.finditer(content):
+        method_name = _decode(match.group(1))
+        if not method_name.startswith('_'):  # Skip private methods
+            methods.append((method_name, javadoc_by_name.get(method_name, "")))
+    
+    return classes, methods
+
+
+def _index_doc_comments(pattern: Pattern, content: bytes) -> Dict[str, str]:
+    """
+    Map documented names to the description from their doc comment.
+    
+    Args:
+        pattern: Compiled bytes pattern capturing a doc comment body and the name it documents
+        content: Raw source code
+        
+    Returns:
+        Dictionary mapping names to the first description line of their doc comment
+    """
+    descriptions = {}
+    for match in pattern.finditer(content):
+        # The first doc comment for a name wins, as with a forward search
+        name = _decode(match.group(2))
+        if name not in descriptions:
+            descriptions[name] = _doc_comment_summary(match.group(1))
+    return descriptions
 
 
 class ApiGenerator:
@@ -12,16 +381,23 @@ class ApiGenerator:
     Generates API documentation from repository source code.
     """
     
-    def __init__(self, repo_path: str, logger: logging.Logger):
+    def __init__(self, repo_path: str, logger: logging.Logger, cache_dir: Optional[str] = None,
+                 use_cache: bool = True):
         """
         Initialize the API generator.
         
         Args:
             repo_path: Path to the repository
             logger: Logger instance
+            cache_dir: Optional directory for caching the generated page between runs
+            use_cache: Whether to read and write cached results
         """
         self.repo_path = repo_path
         self.logger = logger
+        # Absolute repository prefix, so per-file paths are built by concatenation
+        self._repo_root = os.path.abspath(repo_path).rstrip(os.sep) + os.sep
+        self.cache_dir = cache_dir
+        self.use_cache = use_cache
     
     def generate(self, repo_info: Dict) -> str:
         """
@@ -33,28 +409,140 @@ class ApiGenerator:
         Returns:
             Generated content as string
         """
-        content = []
-        content.append("# API Reference\n")
-        content.append("This page provides documentation for the API of this project.\n")
+        cache_key = self._page_cache_key(repo_info) if self.use_cache and self.cache_dir else None
+        if cache_key:
+            cached_content = self._load_cached_page(cache_key)
+            if cached_content is not None:
+                self.logger.info("Using cached API documentation")
+                return cached_content
+        
+        content = self._generate_page(repo_info)
+        
+        if cache_key:
+            self._save_cached_page(cache_key, content)
+        
+        return content
+    
+    def _generate_page(self, repo_info: Dict) -> str:
+        """
+        Generate the API reference page without consulting the cache.
+        
+        Args:
+            repo_info: Repository information dictionary
+            
+        Returns:
+            Generated content as string
+        """
+        content = io.StringIO()
+        content.write("# API Reference\n\n")
+        content.write("This page provides documentation for the API of this project.\n\n")
         
         # First, check for existing API documentation
         api_docs = self._find_api_documentation(repo_info)
         if api_docs:
-            content.append(api_docs)
-            return "\n".join(content)
+            content.write(api_docs + "\n")
+            return content.getvalue()
         
         # If no existing API docs found, generate from source
         api_content = self._generate_from_source(repo_info)
         if api_content:
-            content.append(api_content)
+            content.write(api_content + "\n")
         else:
-            content.append("\n*No API documentation is available at this time.*\n")
-            content.append("\nConsider adding API documentation to your project by:\n")
-            content.append("- Adding a dedicated API.md file in your docs directory")
-            content.append("- Using docstrings in your code")
-            content.append("- Implementing API documentation tools like Swagger, JSDoc, or Sphinx")
+            content.write("\n*No API documentation is available at this time.*\n\n")
+            content.write("\nConsider adding API documentation to your project by:\n\n")
+            content.write("- Adding a dedicated API.md file in your docs directory\n")
+            content.write("- Using docstrings in your code\n")
+            content.write("- Implementing API documentation tools like Swagger, JSDoc, or Sphinx\n")
         
-        return "\n".join(content)
+        return content.getvalue()
+    
+    def _page_cache_key(self, repo_info: Dict) -> Optional[str]:
+        """
+        Compute the cache key for the generated API page.
+        
+        The key covers the repository information, the checked-out commit and the
+        modification time and size of every modified or untracked file, so it only
+        matches while the sources are unchanged. Git's status alone isn't enough: a file
+        that is edited again while already modified keeps the same status line.
+        
+        Args:
+            repo_info: Repository information dictionary
+            
+        Returns:
+            Hex digest of the key, or None if the repository state can't be determined
+        """
+        if not os.path.exists(os.path.join(self.repo_path, '.git')):
+            return None
+        
+        try:
+            head = subprocess.check_output(
+                ['git', '-C', self.repo_path, 'rev-parse', 'HEAD'], stderr=subprocess.DEVNULL
+            )
+            status = subprocess.check_output(
+                ['git', '-C', self.repo_path, 'status', '--porcelain', '-z', '--untracked-files=all'],
+                stderr=subprocess.DEVNULL
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            self.logger.debug(f"Not caching API documentation, git state unavailable: {str(e)}")
+            return None
+        
+        digest = hashlib.blake2b()
+        digest.update(str(_CACHE_VERSION).encode())
+        digest.update(json.dumps(repo_info, sort_keys=True, default=sorted).encode('utf-8'))
+        digest.update(head.strip())
+        digest.update(status)
+        
+        # Each entry is "XY path"; renames and copies are followed by the original path
+        entries = iter(status.split(b'\0')[:-1])
+        for entry in entries:
+            if entry[:1] in (b'R', b'C'):
+                next(entries, None)
+            path = os.fsdecode(entry[3:])
+            try:
+                stat = os.stat(os.path.join(self.repo_path, path))
+                signature = f"{path}\0{stat.st_mtime_ns}\0{stat.st_size}\0"
+            except OSError:
+                signature = f"{path}\0missing\0"
+            digest.update(signature.encode('utf-8', 'surrogateescape'))
+        
+        return digest.hexdigest()
+    
+    def _load_cached_page(self, cache_key: str) -> Optional[str]:
+        """
+        Load the cached API page if it was generated for the given key.
+        
+        Args:
+            cache_key: Cache key for the current repository state
+            
+        Returns:
+            Cached content, or None on a cache miss
+        """
+        try:
+            with open(os.path.join(self.cache_dir, 'api.json'), 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get("key") == cache_key:
+                return cached.get("content")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.debug(f"Ignoring unreadable API documentation cache: {str(e)}")
+        
+        return None
+    
+    def _save_cached_page(self, cache_key: str, content: str) -> None:
+        """
+        Write the generated API page to the cache.
+        
+        Args:
+            cache_key: Cache key for the current repository state
+            content: Generated API page
+        """
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(os.path.join(self.cache_dir, 'api.json'), 'w', encoding='utf-8') as f:
+                json.dump({"key": cache_key, "content": content}, f)
+        except Exception as e:
+            self.logger.debug(f"Could not write API documentation cache: {str(e)}")
     
     def _find_api_documentation(self, repo_info: Dict) -> Optional[str]:
         """
@@ -69,17 +557,24 @@ class ApiGenerator:
         # Check for API documentation in doc directories
         for doc_dir in repo_info.get("doc_dirs", []):
             dir_path = os.path.join(self.repo_path, doc_dir)
-            if os.path.exists(dir_path):
-                for file in os.listdir(dir_path):
-                    if file.lower() in {"api.md", "api-reference.md", "api-docs.md", "reference.md"}:
-                        try:
-                            with open(os.path.join(dir_path, file), 'r', encoding='utf-8') as f:
-                                api_content = f.read()
-                                # Remove frontmatter if present
-                                api_content = re.sub(r'^---\n.*?\n---\n', '', api_content, flags=re.DOTALL)
-                                return api_content
-                        except Exception as e:
-                            self.logger.warning(f"Error reading API documentation: {str(e)}")
+            try:
+                entries = os.scandir(dir_path)
+            except OSError:
+                continue
+            
+            with entries:
+                for entry in entries:
+                    if entry.name.lower() not in _API_DOC_FILENAMES:
+                        continue
+                    try:
+                        with open(entry.path, 'r', encoding='utf-8') as f:
+                            api_content = f.read()
+                            # Remove frontmatter if present
+                            if api_content.startswith('---\n'):
+                                api_content = _FRONTMATTER_RE.sub('', api_content, count=1)
+                            return api_content
+                    except Exception as e:
+                        self.logger.warning(f"Error reading API documentation: {str(e)}")
         
         # Check for API section in README
         readme_path = repo_info.get("key_files", {}).get("readme")
@@ -108,219 +603,220 @@ class ApiGenerator:
         Returns:
             Generated API documentation
         """
-        content = []
+        content = io.StringIO()
+        modules = []
+        repo_files = self._list_repo_source_files()
         
         # Look for modules, classes, and functions in source directories
         for src_dir in repo_info.get("src_dirs", []):
-            dir_path = os.path.join(self.repo_path, src_dir)
+            dir_path = self._repo_root + src_dir
             
-            if not os.path.exists(dir_path) or not os.path.isdir(dir_path):
+            if not os.path.isdir(dir_path):
                 continue
             
             # Find source files
-            source_files = []
-            for root, _, files in os.walk(dir_path):
-                for file in files:
-                    _, ext = os.path.splitext(file)
-                    if ext in {'.py', '.js', '.ts', '.jsx', '.tsx', '.java'}:
-                        rel_path = os.path.relpath(os.path.join(root, file), self.repo_path)
-                        source_files.append(rel_path)
+            if repo_files is not None:
+                prefix = os.path.normpath(src_dir) + os.sep
+                source_files = [file_path for file_path in repo_files if file_path.startswith(prefix)]
+            else:
+                source_files = [os.path.normpath(path[len(self._repo_root):]) for path in _iter_source_files(dir_path)]
             
-            if not source_files:
-                continue
-                
-            content.append(f"\n## {os.path.basename(src_dir).capitalize()} Module\n")
+            if source_files:
+                modules.append((src_dir, source_files))
+        
+        all_files = sorted({file_path for _, source_files in modules for file_path in source_files})
+        elements = dict(zip(all_files, self._extract_code_elements_cached(all_files)))
+        
+        for src_dir, source_files in modules:
+            content.write(f"\n## {os.path.basename(src_dir).capitalize()} Module\n\n")
+            
+            # Document the files with the most public definitions in detail to avoid
+            # overwhelming the API reference, and list the remaining files compactly
+            source_files = sorted(source_files)
+            detailed_files = set(heapq.nlargest(
+                _MAX_DETAILED_FILES_PER_MODULE,
+                source_files,
+                key=lambda file_path: sum(len(items) for items in elements[file_path])
+            ))
             
-            # Include up to 10 files to avoid overwhelming the API reference
-            for i, file_path in enumerate(sorted(source_files)[:10]):
+            for file_path in source_files:
+                if file_path not in detailed_files:
+                    continue
+                
                 filename = os.path.basename(file_path)
-                content.append(f"\n### {filename}\n")
-                content.append(f"Path: `{file_path}`\n")
+                content.write(f"\n### {filename}\n\n")
+                content.write(f"Path: `{file_path}`\n\n")
                 
-                # Extract classes and functions
-                classes, functions = self._extract_code_elements(os.path.join(self.repo_path, file_path))
+                classes, functions = elements[file_path]
                 
                 if classes:
-                    content.append("**Classes:**\n")
+                    content.write("**Classes:**\n\n")
                     for cls_name, cls_desc in classes:
-                        content.append(f"- `{cls_name}`" + (f": {cls_desc}" if cls_desc else ""))
+                        content.write(f"- `{cls_name}`" + (f": {cls_desc}" if cls_desc else "") + "\n")
                 
                 if functions:
-                    content.append("\n**Functions:**\n")
+                    content.write("\n**Functions:**\n\n")
                     for func_name, func_desc in functions:
-                        content.append(f"- `{func_name}()`" + (f": {func_desc}" if func_desc else ""))
+                        content.write(f"- `{func_name}()`" + (f": {func_desc}" if func_desc else "") + "\n")
             
-            # If there are more files, indicate that
-            if len(source_files) > 10:
-                content.append(f"\n*...and {len(source_files) - 10} more files*\n")
+            other_files = [file_path for file_path in source_files if file_path not in detailed_files]
+            if other_files:
+                content.write("\n### Other Files\n\n")
+                for file_path in other_files:
+                    classes, functions = elements[file_path]
+                    count = len(classes) + len(functions)
+                    suffix = f" ({count} public definition{'s' if count != 1 else ''})" if count else ""
+                    content.write(f"- `{file_path}`{suffix}\n")
         
-        return "\n".join(content)
+        return content.getvalue()
     
-    def _extract_code_elements(self, file_path: str) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+    def _list_repo_source_files(self) -> Optional[List[str]]:
         """
-        Extract classes and functions from a source file.
+        List the repository's source files with a single `git ls-files` call.
+        
+        Tracked and untracked files are included, files ignored by git are not.
         
-        Args:
-            file_path: Path to the source file
-            
         Returns:
-            Tuple of (classes, functions) where each is a list of (name, description) tuples
+            Source file paths relative to the repository, or None if the repository
+            isn't a git checkout or git is unavailable
         """
-        classes = []
-        functions = []
+        if not os.path.exists(os.path.join(self.repo_path, '.git')):
+            return None
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                file_content = f.read()
+            raw = subprocess.check_output(
+                ['git', '-C', self.repo_path, 'ls-files', '-z', '--cached', '--others', '--exclude-standard',
+                 '--'] + [f'*{ext}' for ext in _SOURCE_EXTENSIONS],
+                stderr=subprocess.DEVNULL
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            self.logger.debug(f"Could not list files with git, scanning directories instead: {str(e)}")
+            return None
+        
+        # Paths are NUL-terminated and unquoted with -z; a file can be listed once per
+        # merge stage while a conflict is unresolved
+        paths = dict.fromkeys(raw.split(b'\0')[:-1])
+        return [os.path.normpath(os.fsdecode(path)) for path in paths]
+    
+    def _extract_code_elements_cached(self, file_paths: List[str]) -> List[Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]]:
+        """
+        Extract classes and functions from several source files, reusing cached results.
+        
+        Results are cached per file and keyed by the file's modification time and size,
+        so only new or changed files are parsed again on later runs.
+        
+        Args:
+            file_paths: Paths to the source files, relative to the repository
             
-            file_ext = os.path.splitext(file_path)[1]
+        Returns:
+            List of (classes, functions) tuples in the same order as file_paths
+        """
+        cache = self._load_element_cache() if self.use_cache else {}
+        results = {}
+        stale = []
+        
+        for file_path in file_paths:
+            abs_path = self._repo_root + file_path
+            try:
+                stat = os.stat(abs_path)
+            except OSError:
+                # Let the extraction report the problem, but don't cache the result
+                stale.append((file_path, abs_path, None))
+                continue
             
-            # Process based on file type
-            if file_ext == '.py':
-                classes, functions = self._extract_python_elements(file_content)
-            elif file_ext in {'.js', '.ts', '.jsx', '.tsx'}:
-                classes, functions = self._extract_javascript_elements(file_content)
-            elif file_ext == '.java':
-                classes, functions = self._extract_java_elements(file_content)
+            entry = cache.get(abs_path)
+            if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                results[file_path] = (
+                    [tuple(item) for item in entry["classes"]],
+                    [tuple(item) for item in entry["functions"]]
+                )
+            else:
+                stale.append((file_path, abs_path, stat))
         
-        except Exception as e:
-            self.logger.warning(f"Error extracting code elements from {file_path}: {str(e)}")
+        if stale:
+            extracted = self._extract_code_elements_parallel([abs_path for _, abs_path, _ in stale])
+            for (file_path, abs_path, stat), (classes, functions) in zip(stale, extracted):
+                results[file_path] = (classes, functions)
+                if stat is not None:
+                    cache[abs_path] = {
+                        "mtime_ns": stat.st_mtime_ns,
+                        "size": stat.st_size,
+                        "classes": classes,
+                        "functions": functions
+                    }
+            if self.use_cache:
+                self._save_element_cache(cache)
         
-        return classes, functions
+        return [results[file_path] for file_path in file_paths]
     
-    def _extract_python_elements(self, content: str) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+    def _load_element_cache(self) -> Dict:
         """
-        Extract classes and functions from Python code.
+        Load the on-disk cache of extracted code elements.
         
-        Args:
-            content: Python code content
-            
         Returns:
-            Tuple of (classes, functions) where each is a list of (name, description) tuples
+            Dictionary mapping absolute file paths to cache entries
         """
-        classes = []
-        functions = []
-        
-        # Extract classes
-        class_matches = re.finditer(r'class\s+(\w+)(?:\(.*?\))?:\s*(?:"""(.*?)""")?', content, re.DOTALL)
-        for match in class_matches:
-            class_name = match.group(1)
-            class_desc = match.group(2).strip() if match.group(2) else ""
-            classes.append((class_name, class_desc))
-        
-        # Extract functions (excluding methods in classes)
-        func_matches = re.finditer(r'^def\s+(\w+)\s*\(.*?\):\s*(?:"""(.*?)""")?', content, re.MULTILINE | re.DOTALL)
-        for match in func_matches:
-            func_name = match.group(1)
-            if not func_name.startswith('_'):  # Skip private functions
-                func_desc = match.group(2).strip() if match.group(2) else ""
-                functions.append((func_name, func_desc))
-        
-        return classes, functions
-    
-    def _extract_javascript_elements(self, content: str) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+        try:
+            with open(_element_cache_path(), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == _CACHE_VERSION:
+                return data.get("files", {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.debug(f"Ignoring unreadable code element cache: {str(e)}")
+        
+        return {}
+    
+    def _save_element_cache(self, cache: Dict) -> None:
         """
-        Extract classes and functions from JavaScript/TypeScript code.
+        Write the cache of extracted code elements to disk.
         
         Args:
-            content: JavaScript/TypeScript code content
-            
-        Returns:
-            Tuple of (classes, functions) where each is a list of (name, description) tuples
+            cache: Dictionary mapping absolute file paths to cache entries
         """
-        classes = []
-        functions = []
-        
-        # Extract classes
-        class_matches = re.finditer(r'class\s+(\w+)(?:\s+extends\s+\w+)?(?:\s+implements\s+\w+)?\s*{', content)
-        for match in class_matches:
-            class_name = match.group(1)
-            # Try to find JSDoc comment before class
-            jsdoc_match = re.search(r'/\*\*(.*?)\*/\s*class\s+' + re.escape(class_name), content, re.DOTALL)
-            class_desc = ""
-            if jsdoc_match:
-                # Extract description from JSDoc
-                jsdoc = jsdoc_match.group(1)
-                desc_match = re.search(r'^\s*\*\s+(.*?)(?:\s*@|\s*\*/$)', jsdoc, re.MULTILINE | re.DOTALL)
-                if desc_match:
-                    class_desc = desc_match.group(1).strip()
+        cache_path = _element_cache_path()
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
             
-            classes.append((class_name, class_desc))
-        
-        # Extract functions
-        patterns = [
-            r'function\s+(\w+)\s*\(',  # function declarations
-            r'const\s+(\w+)\s*=\s*(?:async\s*)?\(.*?\)\s*=>',  # arrow functions
-            r'(\w+)\s*:\s*(?:async\s*)?\(.*?\)\s*=>'  # object method shorthand
-        ]
-        
-        for pattern in patterns:
-            func_matches = re.finditer(pattern, content)
-            for match in func_matches:
-                func_name = match.group(1)
-                if not func_name.startswith('_'):  # Skip private functions
-                    # Try to find JSDoc comment before function
-                    jsdoc_match = re.search(r'/\*\*(.*?)\*/\s*(?:function|const|let|var)?\s*' + re.escape(func_name), content, re.DOTALL)
-                    func_desc = ""
-                    if jsdoc_match:
-                        # Extract description from JSDoc
-                        jsdoc = jsdoc_match.group(1)
-                        desc_match = re.search(r'^\s*\*\s+(.*?)(?:\s*@|\s*\*/$)', jsdoc, re.MULTILINE | re.DOTALL)
-                        if desc_match:
-                            func_desc = desc_match.group(1).strip()
-                    
-                    functions.append((func_name, func_desc))
-        
-        return classes, functions
-    
-    def _extract_java_elements(self, content: str) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+            # Write to a temporary file first so concurrent runs never see a partial cache
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": _CACHE_VERSION, "files": cache}, f)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            self.logger.debug(f"Could not write code element cache: {str(e)}")
+    
+    def _extract_code_elements_parallel(self, abs_paths: List[str]) -> List[Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]]:
         """
-        Extract classes and methods from Java code.
+        Extract classes and functions from several source files concurrently.
         
         Args:
-            content: Java code content
+            abs_paths: Absolute paths to the source files
             
         Returns:
-            Tuple of (classes, methods) where each is a list of (name, description) tuples
+            List of (classes, functions) tuples in the same order as abs_paths
         """
-        classes = []
-        methods = []
-        
-        # Extract classes
-        class_matches = re.finditer(r'(?:public|protected|private)?\s+(?:abstract|final)?\s*class\s+(\w+)', content)
-        for match in class_matches:
-            class_name = match.group(1)
-            # Try to find JavaDoc comment before class
-            javadoc_match = re.search(r'/\*\*(.*?)\*/\s*(?:public|protected|private)?\s+(?:abstract|final)?\s*class\s+' + re.escape(class_name), content, re.DOTALL)
-            class_desc = ""
-            if javadoc_match:
-                # Extract description from JavaDoc
-                javadoc = javadoc_match.group(1)
-                desc_match = re.search(r'^\s*\*\s+(.*?)(?:\s*@|\s*\*/$)', javadoc, re.MULTILINE | re.DOTALL)
-                if desc_match:
-                    class_desc = desc_match.group(1).strip()
-            
-            classes.append((class_name, class_desc))
-        
-        # Extract methods
-        method_pattern = r'(?:public|protected|private|static|\s)+[\w\<\>\[\]]+\s+(\w+)\s*\([^\)]*\)\s*(?:throws[\w\s,]+)?'
-        method_matches = re.finditer(method_pattern, content)
-        for match in method_matches:
-            method_name = match.group(1)
-            if not method_name.startsWith('_'):  # Skip private methods
-                # Try to find JavaDoc comment before method
-                javadoc_match = re.search(r'/\*\*(.*?)\*/\s*(?:public|protected|private|static|\s)+[\w\<\>\[\]]+\s+' + re.escape(method_name), content, re.DOTALL)
-                method_desc = ""
-                if javadoc_match:
-                    # Extract description from JavaDoc
-                    javadoc = javadoc_match.group(1)
-                    desc_match = re.search(r'^\s*\*\s+(.*?)(?:\s*@|\s*\*/$)', javadoc, re.MULTILINE | re.DOTALL)
-                    if desc_match:
-                        method_desc = desc_match.group(1).strip()
-                
-                methods.append((method_name, method_desc))
+        # Starting worker processes costs more than parsing a few hundred files, and gains nothing
+        # on a single CPU. Workers are spawned rather than forked, since the generator may be
+        # running on a thread pool.
+        workers = os.cpu_count() or 1
+        if len(abs_paths) >= _MIN_FILES_FOR_PROCESS_POOL and workers > 1:
+            try:
+                context = multiprocessing.get_context("spawn")
+                with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+                    return list(executor.map(
+                        _extract_code_elements, abs_paths, chunksize=max(1, len(abs_paths) // (workers * 4))
+                    ))
+            except Exception as e:
+                self.logger.debug(f"Process pool unavailable, extracting in threads: {str(e)}")
+        
+        if len(abs_paths) <= 1:
+            return [_extract_code_elements(path) for path in abs_paths]
         
-        return classes, methods
+        # File reads release the GIL, so threads still overlap the I/O latency
+        with ThreadPoolExecutor(max_workers=min(_MAX_READER_THREADS, len(abs_paths))) as executor:
+            return list(executor.map(_extract_code_elements, abs_paths))
     
     def _extract_section(self, content: str, section_name: str, end_section_name: str = "") -> Optional[str]:
         """
@@ -334,26 +830,22 @@ class ApiGenerator:
         Returns:
             Extracted section or None if section not found
         """
-        # Pattern to match the section heading (both ## and ### levels)
-        pattern = rf"^(##|###)\s+{section_name}.*?$"
-        match = re.search(pattern, content, re.MULTILINE)
+        headings = _index_headings(content)
         
-        if match:
-            start_pos = match.start()
-            heading_level = match.group(1)
+        # Look for the section heading (both ## and ### levels)
+        for index, (level, title, start_pos) in enumerate(headings):
+            if level not in (2, 3) or not title.startswith(section_name):
+                continue
             
             # Find the end of the section (next heading of same or higher level)
-            end_pattern = rf"^{heading_level}(?:#)?\s+"
-            if end_section_name:
-                end_pattern += rf"{end_section_name}.*?$"
-            
-            end_match = re.search(end_pattern, content[start_pos+1:], re.MULTILINE)
+            for end_level, end_title, end_pos in headings[index + 1:]:
+                if end_section_name:
+                    if end_title.startswith(end_section_name):
+                        return content[start_pos:end_pos].strip()
+                elif end_level <= level:
+                    return content[start_pos:end_pos].strip()
             
-            if end_match:
-                end_pos = start_pos + 1 + end_match.start()
-                return content[start_pos:end_pos].strip()
-            else:
-                # If no end section found, go until the end of file
-                return content[start_pos:].strip()
+            # If no end section found, go until the end of file
+            return content[start_pos:].strip()
         
         return None
\ No newline at end of file
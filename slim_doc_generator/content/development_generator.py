@@ -1,10 +1,62 @@
 """
 Development documentation generator.
 """
+import io
+import json
 import logging
 import os
 import re
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Match, Optional, Tuple
+
+from slim_doc_generator.utils.helpers import file_signature, read_text_files
+
+# Lowercase names of files treated as existing development documentation
+_DEV_DOC_FILENAMES = frozenset({"development.md", "developers.md", "dev-guide.md", "hacking.md"})
+
+# Configuration files that indicate each linter or formatter is in use
+_ESLINT_FILES = frozenset({'.eslintrc.js', '.eslintrc', '.eslintrc.json'})
+_PRETTIER_FILES = frozenset({'.prettierrc', '.prettierrc.js', '.prettierrc.json'})
+_FLAKE8_FILES = frozenset({'.flake8', 'setup.cfg'})
+
+_FRONTMATTER_RE = re.compile(r'^---\n.*?\n---\n', re.DOTALL)
+
+# README sections that hold development notes; the first one in the README is used
+_README_SECTION_RE = re.compile(
+    r"^(##|###)\s+(?:Development|Developing|For Developers|Hacking).*?$", re.MULTILINE
+)
+# A section ends at the next heading of its own level or one level deeper
+_SECTION_END_RES = {
+    level: re.compile(rf"^{level}(?:#)?\s+", re.MULTILINE) for level in ("##", "###")
+}
+
+# Generated pages kept per generator instance
+_MAX_CACHED_PAGES = 32
+
+# Directories whose subdirectories are listed in the project structure overview
+_KEY_PARENT_DIRS = frozenset({'src', 'docs', 'tests', 'examples'})
+
+_UNITTEST_FILE_SUFFIXES = ('_test.py', 'test_.py')
+
+
+def _detect_python_test_runner(files: Iterable[str]) -> Optional[str]:
+    """
+    Detect the Python test runner from repository file names in a single pass.
+    
+    Args:
+        files: Repository file paths
+        
+    Returns:
+        "pytest" if a pytest configuration file exists, "unittest" if test modules
+        exist, or None otherwise
+    """
+    runner = None
+    for f in files:
+        if f.startswith('pytest'):
+            return 'pytest'
+        if runner is None and (f.endswith(_UNITTEST_FILE_SUFFIXES) or f.startswith('test_')):
+            runner = 'unittest'
+    return runner
 
 
 class DevelopmentGenerator:
@@ -22,41 +74,132 @@ class DevelopmentGenerator:
         """
         self.repo_path = repo_path
         self.logger = logger
+        self._pages: Dict[Tuple, str] = {}
+    
+    def prefetch(self, repo_info: Dict) -> Dict[str, str]:
+        """
+        Read the files the development page is built from.
+        
+        File reads release the GIL, so callers can prefetch for several generators
+        concurrently and pass the result to generate().
+        
+        Args:
+            repo_info: Repository information dictionary
+            
+        Returns:
+            File contents keyed by path
+        """
+        return read_text_files(self._source_paths(repo_info))
     
-    def generate(self, repo_info: Dict) -> str:
+    def generate(self, repo_info: Dict, prefetched: Optional[Dict[str, str]] = None) -> str:
         """
         Generate development documentation based on repository contents.
         
+        Pages are cached per instance, keyed by the repository information and the
+        state of the files they are read from.
+        
         Args:
             repo_info: Repository information dictionary
+            prefetched: Optional file contents returned by prefetch()
             
         Returns:
             Generated content as string
         """
-        content = []
-        content.append("# Development\n")
-        content.append("This page provides information for developers working on this project.\n")
+        cache_key = self._page_cache_key(repo_info)
+        page = self._pages.get(cache_key)
+        if page is None:
+            page = self._generate_page(repo_info, prefetched or {})
+            if len(self._pages) >= _MAX_CACHED_PAGES:
+                # Evict the oldest entry
+                del self._pages[next(iter(self._pages))]
+            self._pages[cache_key] = page
+        return page
+    
+    def _page_cache_key(self, repo_info: Dict) -> Tuple:
+        """
+        Compute the cache key for the generated page.
+        
+        Doc directories are part of the key so that adding or removing a development
+        guide invalidates it, along with any guides they currently contain.
+        
+        Args:
+            repo_info: Repository information dictionary
+            
+        Returns:
+            Hashable key covering the repository information and source files
+        """
+        source_paths = [os.path.join(self.repo_path, 'package.json')]
+        source_paths.extend(os.path.join(self.repo_path, doc_dir) for doc_dir in repo_info.get("doc_dirs", []))
+        source_paths.extend(self._source_paths(repo_info))
+        
+        return (
+            json.dumps(repo_info, sort_keys=True, default=sorted),
+            file_signature(source_paths)
+        )
+    
+    def _source_paths(self, repo_info: Dict) -> List[str]:
+        """
+        List the documents the development section may be read from.
+        
+        Args:
+            repo_info: Repository information dictionary
+            
+        Returns:
+            Paths of development guides in the doc directories, followed by the README
+        """
+        source_paths = []
+        for doc_dir in repo_info.get("doc_dirs", []):
+            try:
+                with os.scandir(os.path.join(self.repo_path, doc_dir)) as entries:
+                    source_paths.extend(
+                        entry.path for entry in entries if entry.name.lower() in _DEV_DOC_FILENAMES
+                    )
+            except OSError:
+                continue
+        
+        readme_path = repo_info.get("key_files", {}).get("readme")
+        if readme_path:
+            source_paths.append(os.path.join(self.repo_path, readme_path))
+        
+        return source_paths
+    
+    def _generate_page(self, repo_info: Dict, prefetched: Dict[str, str]) -> str:
+        """
+        Generate the development page without consulting the cache.
+        
+        Args:
+            repo_info: Repository information dictionary
+            prefetched: File contents read ahead of time, keyed by path
+            
+        Returns:
+            Generated content as string
+        """
+        content = io.StringIO()
+        content.write("# Development\n\n")
+        content.write("This page provides information for developers working on this project.\n\n")
         
         # Check for development section in README or other documents
-        dev_section = self._extract_development_section(repo_info)
+        dev_section = self._extract_development_section(repo_info, prefetched)
         if dev_section:
-            content.append(dev_section)
-            return "\n".join(content)
+            content.write(dev_section)
+            return content.getvalue()
         
         # If no development section found, generate based on repo structure
+        files = frozenset(repo_info.get("files", ()))
         self._add_project_structure(content, repo_info)
-        self._add_development_workflow(content, repo_info)
-        self._add_testing_info(content, repo_info)
-        self._add_coding_standards(content, repo_info)
+        self._add_development_workflow(content, repo_info, files)
+        self._add_testing_info(content, repo_info, files)
+        self._add_coding_standards(content, files)
         
-        return "\n".join(content)
+        return content.getvalue()
     
-    def _extract_development_section(self, repo_info: Dict) -> Optional[str]:
+    def _extract_development_section(self, repo_info: Dict, prefetched: Dict[str, str]) -> Optional[str]:
         """
         Extract development section from README or other documents.
         
         Args:
             repo_info: Repository information dictionary
+            prefetched: File contents read ahead of time, keyed by path
             
         Returns:
             Extracted development section or None if not found
@@ -64,252 +207,267 @@ class DevelopmentGenerator:
         # First look for development.md or similar
         for doc_dir in repo_info.get("doc_dirs", []):
             dir_path = os.path.join(self.repo_path, doc_dir)
-            if os.path.exists(dir_path):
-                for file in os.listdir(dir_path):
-                    if file.lower() in {"development.md", "developers.md", "dev-guide.md", "hacking.md"}:
-                        try:
-                            with open(os.path.join(dir_path, file), 'r', encoding='utf-8') as f:
-                                content = f.read()
-                                # Remove frontmatter if present
-                                content = re.sub(r'^---\n.*?\n---\n', '', content, flags=re.DOTALL)
-                                return content
-                        except Exception as e:
-                            self.logger.warning(f"Error reading development documentation: {str(e)}")
+            try:
+                entries = os.scandir(dir_path)
+            except OSError:
+                continue
+            
+            with entries:
+                for entry in entries:
+                    if entry.name.lower() not in _DEV_DOC_FILENAMES or not entry.is_file():
+                        continue
+                    try:
+                        content = prefetched.get(entry.path)
+                        if content is None:
+                            content = Path(entry.path).read_text(encoding='utf-8', errors='replace')
+                        # Remove frontmatter if present
+                        return _FRONTMATTER_RE.sub('', content)
+                    except Exception as e:
+                        self.logger.warning(f"Error reading development documentation: {str(e)}")
         
         # Check for development section in README
         readme_path = repo_info.get("key_files", {}).get("readme")
         if readme_path:
             try:
-                with open(os.path.join(self.repo_path, readme_path), 'r', encoding='utf-8') as f:
-                    readme_content = f.read()
+                readme_file = os.path.join(self.repo_path, readme_path)
+                readme_content = prefetched.get(readme_file)
+                if readme_content is None:
+                    readme_content = Path(readme_file).read_text(encoding='utf-8', errors='replace')
                 
                 # Look for development section
-                section_names = ["Development", "Developing", "For Developers", "Hacking"]
-                for section_name in section_names:
-                    section = self._extract_section(readme_content, section_name)
-                    if section:
-                        return section
+                section = self._section_from_match(readme_content, _README_SECTION_RE.search(readme_content))
+                if section:
+                    return section
             
             except Exception as e:
                 self.logger.warning(f"Error extracting development section from README: {str(e)}")
         
         return None
     
-    def _add_project_structure(self, content: List[str], repo_info: Dict) -> None:
+    def _add_project_structure(self, content: io.StringIO, repo_info: Dict) -> None:
         """
         Add project structure information.
         
         Args:
-            content: List to append content to
+            content: Buffer to write content to
             repo_info: Repository information dictionary
         """
-        content.append("\n## Project Structure\n")
-        content.append("Below is an overview of the key directories and files in this project:\n")
-        content.append("```")
-        
-        # Add directories first
-        for dir_path in sorted(repo_info.get("directories", [])):
-            # Only include top-level directories or key subdirectories
-            if '/' not in dir_path or dir_path.split('/')[0] in {'src', 'docs', 'tests', 'examples'}:
-                content.append(f"{dir_path}/")
+        content.write("\n## Project Structure\n\n")
+        content.write("Below is an overview of the key directories and files in this project:\n\n")
+        content.write("```\n")
+        
+        # Add directories first, only including top-level directories or key subdirectories.
+        # Filtering before sorting keeps the sort small on repositories with deep trees.
+        directories = [
+            dir_path for dir_path in repo_info.get("directories", ())
+            if '/' not in dir_path or dir_path.partition('/')[0] in _KEY_PARENT_DIRS
+        ]
+        directories.sort()
+        for dir_path in directories:
+            content.write(f"{dir_path}/\n")
         
         # Add key files
-        key_files = [f for f in repo_info.get("files", []) if '/' not in f and f.startswith(('.', 'README', 'LICENSE'))]
-        for file in sorted(key_files):
-            content.append(file)
+        key_files = [f for f in repo_info.get("files", ()) if '/' not in f and f.startswith(('.', 'README', 'LICENSE'))]
+        key_files.sort()
+        for file in key_files:
+            content.write(f"{file}\n")
         
-        content.append("```\n")
+        content.write("```\n\n")
         
         # Add description of key directories
         if repo_info.get("src_dirs"):
-            content.append("### Source Code\n")
+            content.write("### Source Code\n\n")
             for dir_path in repo_info["src_dirs"]:
-                content.append(f"- `{dir_path}/`: Contains the main source code")
+                content.write(f"- `{dir_path}/`: Contains the main source code\n")
                 # Optionally add more details about what's in this directory
         
         if repo_info.get("test_dirs"):
-            content.append("\n### Tests\n")
+            content.write("\n### Tests\n\n")
             for dir_path in repo_info["test_dirs"]:
-                content.append(f"- `{dir_path}/`: Contains tests for the project")
+                content.write(f"- `{dir_path}/`: Contains tests for the project\n")
     
-    def _add_development_workflow(self, content: List[str], repo_info: Dict) -> None:
+    def _add_development_workflow(self, content: io.StringIO, repo_info: Dict, files: FrozenSet[str]) -> None:
         """
         Add development workflow information.
         
         Args:
-            content: List to append content to
+            content: Buffer to write content to
             repo_info: Repository information dictionary
+            files: Set of repository file paths
         """
-        content.append("\n## Development Workflow\n")
+        content.write("\n## Development Workflow\n\n")
         
         # Add setup instructions
-        content.append("### Setup Development Environment\n")
-        content.append("To set up your development environment, follow these steps:\n")
-        content.append("```bash")
-        content.append(f"# Clone the repository")
-        content.append(f"git clone {repo_info.get('repo_url', '[REPO_URL]')}")
-        content.append(f"cd {os.path.basename(repo_info['project_name'])}")
-        content.append("")
+        content.write("### Setup Development Environment\n\n")
+        content.write("To set up your development environment, follow these steps:\n\n")
+        content.write("```bash\n")
+        content.write(f"# Clone the repository\n")
+        content.write(f"git clone {repo_info.get('repo_url', '[REPO_URL]')}\n")
+        content.write(f"cd {os.path.basename(repo_info['project_name'])}\n")
+        content.write("\n")
         
         # Add specific setup instructions based on repository structure
-        if "package.json" in repo_info.get("files", []):
-            content.append("# Install dependencies")
-            content.append("npm install")
-        elif "requirements.txt" in repo_info.get("files", []):
-            content.append("# Create a virtual environment")
-            content.append("python -m venv venv")
-            content.append("source venv/bin/activate  # On Windows: venv\\Scripts\\activate")
-            content.append("")
-            content.append("# Install dependencies")
-            content.append("pip install -r requirements.txt")
-        elif "setup.py" in repo_info.get("files", []):
-            content.append("# Create a virtual environment")
-            content.append("python -m venv venv")
-            content.append("source venv/bin/activate  # On Windows: venv\\Scripts\\activate")
-            content.append("")
-            content.append("# Install in development mode")
-            content.append("pip install -e .")
-        
-        content.append("```\n")
+        if "package.json" in files:
+            content.write("# Install dependencies\n")
+            content.write("npm install\n")
+        elif "requirements.txt" in files:
+            content.write("# Create a virtual environment\n")
+            content.write("python -m venv venv\n")
+            content.write("source venv/bin/activate  # On Windows: venv\\Scripts\\activate\n")
+            content.write("\n")
+            content.write("# Install dependencies\n")
+            content.write("pip install -r requirements.txt\n")
+        elif "setup.py" in files:
+            content.write("# Create a virtual environment\n")
+            content.write("python -m venv venv\n")
+            content.write("source venv/bin/activate  # On Windows: venv\\Scripts\\activate\n")
+            content.write("\n")
+            content.write("# Install in development mode\n")
+            content.write("pip install -e .\n")
+        
+        content.write("```\n\n")
         
         # Add workflow instructions
-        content.append("### Development Workflow\n")
-        content.append("1. Create a new branch for your feature or bugfix")
-        content.append("2. Make your changes")
-        content.append("3. Write or update tests")
-        content.append("4. Run the tests to ensure they pass")
-        content.append("5. Submit a pull request\n")
+        content.write("### Development Workflow\n\n")
+        content.write("1. Create a new branch for your feature or bugfix\n")
+        content.write("2. Make your changes\n")
+        content.write("3. Write or update tests\n")
+        content.write("4. Run the tests to ensure they pass\n")
+        content.write("5. Submit a pull request\n\n")
         
         # Add git commands
-        content.append("```bash")
-        content.append("# Create a new branch")
-        content.append("git checkout -b feature/your-feature-name")
-        content.append("")
-        content.append("# Make your changes...")
-        content.append("")
-        content.append("# Commit your changes")
-        content.append("git add .")
-        content.append('git commit -m "Add your feature"')
-        content.append("")
-        content.append("# Push your changes")
-        content.append("git push origin feature/your-feature-name")
-        content.append("```\n")
+        content.write("```bash\n")
+        content.write("# Create a new branch\n")
+        content.write("git checkout -b feature/your-feature-name\n")
+        content.write("\n")
+        content.write("# Make your changes...\n")
+        content.write("\n")
+        content.write("# Commit your changes\n")
+        content.write("git add .\n")
+        content.write('git commit -m "Add your feature"\n')
+        content.write("\n")
+        content.write("# Push your changes\n")
+        content.write("git push origin feature/your-feature-name\n")
+        content.write("```\n\n")
     
-    def _add_testing_info(self, content: List[str], repo_info: Dict) -> None:
+    def _add_testing_info(self, content: io.StringIO, repo_info: Dict, files: FrozenSet[str]) -> None:
         """
         Add testing information.
         
         Args:
-            content: List to append content to
+            content: Buffer to write content to
             repo_info: Repository information dictionary
+            files: Set of repository file paths
         """
-        content.append("\n## Testing\n")
+        content.write("\n## Testing\n\n")
         
         # Look for test directories
         if not repo_info.get("test_dirs"):
-            content.append("*No testing information available.*")
+            content.write("*No testing information available.*\n")
             return
         
-        content.append("This project includes tests to ensure code quality and functionality. Here's how to run the tests:\n")
+        content.write("This project includes tests to ensure code quality and functionality. Here's how to run the tests:\n\n")
         
         # Determine test framework based on repository structure
-        if "package.json" in repo_info.get("files", []):
-            content.append("```bash")
-            content.append("# Run tests")
-            content.append("npm test")
-            content.append("```\n")
+        python_test_runner = None if "package.json" in files else _detect_python_test_runner(files)
+        if "package.json" in files:
+            content.write("```bash\n")
+            content.write("# Run tests\n")
+            content.write("npm test\n")
+            content.write("```\n\n")
             
             # Check package.json for more test commands
             package_json_path = os.path.join(self.repo_path, 'package.json')
             if os.path.exists(package_json_path):
                 try:
-                    import json
-                    with open(package_json_path, 'r', encoding='utf-8') as f:
-                        package_data = json.load(f)
+                    raw = Path(package_json_path).read_bytes()
+                    
+                    # Only parse manifests that can define scripts; json.loads takes the raw bytes
+                    package_data = json.loads(raw) if b'"scripts"' in raw else {}
                     
                     if 'scripts' in package_data:
                         test_scripts = {k: v for k, v in package_data['scripts'].items() if 'test' in k}
                         if len(test_scripts) > 1:
-                            content.append("Additional test commands available:\n")
+                            content.write("Additional test commands available:\n\n")
                             for script, command in test_scripts.items():
                                 if script != 'test':
-                                    content.append(f"```bash\n# {script}\nnpm run {script}\n```\n")
+                                    content.write(f"```bash\n# {script}\nnpm run {script}\n```\n\n")
                 
                 except Exception as e:
                     self.logger.warning(f"Error reading package.json for test scripts: {str(e)}")
         
-        elif any(f.startswith('pytest') for f in repo_info.get("files", [])):
-            content.append("```bash")
-            content.append("# Run tests with pytest")
-            content.append("pytest")
-            content.append("```\n")
+        elif python_test_runner == 'pytest':
+            content.write("```bash\n")
+            content.write("# Run tests with pytest\n")
+            content.write("pytest\n")
+            content.write("```\n\n")
             
-            content.append("For more detailed test output:\n")
-            content.append("```bash")
-            content.append("pytest -v")
-            content.append("```\n")
+            content.write("For more detailed test output:\n\n")
+            content.write("```bash\n")
+            content.write("pytest -v\n")
+            content.write("```\n\n")
         
-        elif any(f.endswith('_test.py') or f.endswith('test_.py') or f.startswith('test_') for f in repo_info.get("files", [])):
-            content.append("```bash")
-            content.append("# Run Python tests")
-            content.append("python -m unittest discover")
-            content.append("```\n")
+        elif python_test_runner == 'unittest':
+            content.write("```bash\n")
+            content.write("# Run Python tests\n")
+            content.write("python -m unittest discover\n")
+            content.write("```\n\n")
         
         else:
-            content.append("Refer to test directory documentation for instructions on running tests.")
+            content.write("Refer to test directory documentation for instructions on running tests.\n")
     
-    def _add_coding_standards(self, content: List[str], repo_info: Dict) -> None:
+    def _add_coding_standards(self, content: io.StringIO, files: FrozenSet[str]) -> None:
         """
         Add coding standards information.
         
         Args:
-            content: List to append content to
-            repo_info: Repository information dictionary
+            content: Buffer to write content to
+            files: Set of repository file paths
         """
-        content.append("\n## Coding Standards\n")
+        content.write("\n## Coding Standards\n\n")
         
         # Look for coding standards in repository
-        has_eslint = any(f == '.eslintrc.js' or f == '.eslintrc' or f == '.eslintrc.json' for f in repo_info.get("files", []))
-        has_prettier = any(f == '.prettierrc' or f == '.prettierrc.js' or f == '.prettierrc.json' for f in repo_info.get("files", []))
-        has_flake8 = any(f == '.flake8' or f == 'setup.cfg' for f in repo_info.get("files", []))
-        has_black = 'pyproject.toml' in repo_info.get("files", [])
+        has_eslint = not files.isdisjoint(_ESLINT_FILES)
+        has_prettier = not files.isdisjoint(_PRETTIER_FILES)
+        has_flake8 = not files.isdisjoint(_FLAKE8_FILES)
+        has_black = 'pyproject.toml' in files
         
         if has_eslint or has_prettier or has_flake8 or has_black:
-            content.append("This project maintains consistent coding standards using the following tools:\n")
+            content.write("This project maintains consistent coding standards using the following tools:\n\n")
             
             if has_eslint:
-                content.append("### ESLint\n")
-                content.append("This project uses ESLint to enforce consistent code style in JavaScript files.\n")
-                content.append("```bash")
-                content.append("# Run ESLint")
-                content.append("npm run lint")
-                content.append("```\n")
+                content.write("### ESLint\n\n")
+                content.write("This project uses ESLint to enforce consistent code style in JavaScript files.\n\n")
+                content.write("```bash\n")
+                content.write("# Run ESLint\n")
+                content.write("npm run lint\n")
+                content.write("```\n\n")
             
             if has_prettier:
-                content.append("### Prettier\n")
-                content.append("Prettier is used to format code consistently.\n")
-                content.append("```bash")
-                content.append("# Format code with Prettier")
-                content.append("npm run format")
-                content.append("```\n")
+                content.write("### Prettier\n\n")
+                content.write("Prettier is used to format code consistently.\n\n")
+                content.write("```bash\n")
+                content.write("# Format code with Prettier\n")
+                content.write("npm run format\n")
+                content.write("```\n\n")
             
             if has_flake8:
-                content.append("### Flake8\n")
-                content.append("Flake8 is used to check Python code style.\n")
-                content.append("```bash")
-                content.append("# Run Flake8")
-                content.append("flake8")
-                content.append("```\n")
+                content.write("### Flake8\n\n")
+                content.write("Flake8 is used to check Python code style.\n\n")
+                content.write("```bash\n")
+                content.write("# Run Flake8\n")
+                content.write("flake8\n")
+                content.write("```\n\n")
             
             if has_black:
-                content.append("### Black\n")
-                content.append("Black is used to format Python code consistently.\n")
-                content.append("```bash")
-                content.append("# Format code with Black")
-                content.append("black .")
-                content.append("```\n")
+                content.write("### Black\n\n")
+                content.write("Black is used to format Python code consistently.\n\n")
+                content.write("```bash\n")
+                content.write("# Format code with Black\n")
+                content.write("black .\n")
+                content.write("```\n\n")
         else:
-            content.append("Refer to the repository's contribution guidelines for information on coding standards and style.")
+            content.write("Refer to the repository's contribution guidelines for information on coding standards and style.\n")
     
     def _extract_section(self, content: str, section_name: str) -> Optional[str]:
         """
@@ -323,19 +481,29 @@ class DevelopmentGenerator:
             Extracted section or None if section not found
         """
         # Pattern to match the section heading (both ## and ### levels)
-        pattern = rf"^(##|###)\s+{section_name}.*?$"
-        match = re.search(pattern, content, re.MULTILINE)
+        match = re.search(rf"^(##|###)\s+{re.escape(section_name)}.*?$", content, re.MULTILINE)
+        return self._section_from_match(content, match)
+    
+    def _section_from_match(self, content: str, match: Optional[Match]) -> Optional[str]:
+        """
+        Extract the section whose heading was matched.
         
+        Args:
+            content: Content the heading was found in
+            match: Match of the section heading, with the heading marker in group 1
+            
+        Returns:
+            Extracted section or None if no heading was matched
+        """
         if match:
             start_pos = match.start()
             heading_level = match.group(1)
             
             # Find the end of the section (next heading of same or higher level)
-            end_pattern = rf"^{heading_level}(?:#)?\s+"
-            end_match = re.search(end_pattern, content[start_pos+1:], re.MULTILINE)
+            end_match = _SECTION_END_RES[heading_level].search(content, match.end())
             
             if end_match:
-                end_pos = start_pos + 1 + end_match.start()
+                end_pos = end_match.start()
                 return content[start_pos:end_pos].strip()
             else:
                 # If no end section found, go until the end of file
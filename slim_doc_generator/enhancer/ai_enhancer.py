@@ -1,10 +1,200 @@
 """
 AI enhancement functionality for documentation content.
 """
+import asyncio
+import hashlib
+import inspect
+import json
 import logging
 import os
+import random
 import sys
-from typing import Dict, Optional
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Sampling temperature used for every enhancement request
+_TEMPERATURE = 0.3
+
+# Instructions shared by every enhancement request
+_SYSTEM_CONTEXT = (
+    "You are a technical documentation specialist helping to improve software documentation. "
+    "Your job is to enhance the provided documentation while maintaining factual accuracy. "
+    "Improve clarity, organization, and comprehensiveness. "
+    "Add examples where helpful. Format using markdown." \
+    "Fix any error for docusaurus website."
+)
+
+# Instructions for requests that carry out several tasks at once
+_TASKS_SYSTEM_CONTEXT = (
+    "You are updating several files of a Docusaurus documentation website. "
+    "The shared_context field holds the source material for every task. "
+    "Carry out each task independently, following its instructions. "
+    "Respond with only a JSON object that maps each task id to the complete result of that task, "
+    "with no other text."
+)
+
+# Section-specific enhancement instructions
+_PROMPT_TEMPLATES = {
+    "overview": "Format markdown. Fix errors. Enhance this project overview to be more comprehensive and user-friendly "
+              "while maintaining accuracy. Add clear sections for features, use cases, and key "
+              "concepts if they're not already present: ",
+
+    "installation": "Format markdown. Fix errors. Improve this installation guide by adding clear prerequisites, "
+                  "troubleshooting tips, and platform-specific instructions while "
+                  "maintaining accuracy: ",
+
+    "api": "Format markdown. Fix errors. Enhance this API documentation by adding more detailed descriptions, usage "
+          "examples, and parameter explanations while maintaining technical accuracy: ",
+
+    "development": "Format markdown. Fix errors. Improve this development guide by adding more context, best practices, "
+                 "and workflow descriptions while maintaining accuracy: ",
+
+    "contributing": "Format markdown. Fix errors. Enhance these contributing guidelines by adding more specific examples, "
+                  "workflow descriptions, and best practices while maintaining accuracy: "
+}
+
+# Instructions for sections without a specific template
+_DEFAULT_PROMPT = "Enhance this documentation while maintaining accuracy and improving clarity: "
+
+# Bounds on the completion tokens requested for a section
+_MIN_MAX_TOKENS = 1024
+_MAX_MAX_TOKENS = 4096
+
+# Default number of sections enhanced at the same time; override with SLIM_DOC_MAX_CONCURRENCY
+_DEFAULT_MAX_CONCURRENCY = 5
+
+# Attempts made for a request that keeps failing with transient provider errors
+_MAX_ATTEMPTS = 5
+
+# Upper bound in seconds on the wait between attempts
+_MAX_RETRY_DELAY = 30
+
+# Seconds between status checks of a submitted batch job
+_BATCH_POLL_INTERVAL = 15
+
+# Default seconds to wait for a batch job before cancelling it and enhancing the sections directly
+_DEFAULT_BATCH_TIMEOUT = 60 * 60
+
+# Cached AI responses older than this many seconds are recomputed and removed
+_RESPONSE_CACHE_TTL = 30 * 24 * 60 * 60
+
+# Batch job states after which the job will make no further progress
+_BATCH_FINAL_STATES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
+def _response_cache_dir() -> str:
+    """
+    Get the directory of the on-disk AI response cache.
+    
+    Returns:
+        Path to the cache directory under the user's cache directory
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "slim-doc-generator", "ai")
+
+
+def _transient_errors() -> Tuple[type, ...]:
+    """
+    Get the provider exception types worth retrying.
+    
+    Returns:
+        Rate limit, connection, timeout and server error types of the OpenAI package, or an
+        empty tuple if it isn't installed
+    """
+    try:
+        from openai import APIConnectionError, InternalServerError, RateLimitError
+    except ImportError:
+        return ()
+    
+    # APITimeoutError is a subclass of APIConnectionError
+    return (RateLimitError, APIConnectionError, InternalServerError)
+
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """
+    Get the time to wait before retrying a failed request.
+    
+    Args:
+        error: Exception raised by the failed attempt
+        attempt: Number of the failed attempt, starting at 1
+        
+    Returns:
+        Seconds to wait; the provider's Retry-After header if it sent one, otherwise an
+        exponential backoff with jitter
+    """
+    response = getattr(error, "response", None)
+    retry_after = getattr(response, "headers", {}).get("retry-after") if response is not None else None
+    if retry_after:
+        try:
+            return min(float(retry_after), _MAX_RETRY_DELAY)
+        except ValueError:
+            pass
+    
+    return min(2 ** (attempt - 1), _MAX_RETRY_DELAY) + random.uniform(0, 1)
+
+
+def _max_tokens(messages: List[Dict[str, str]]) -> int:
+    """
+    Get the completion token limit for an enhancement request.
+    
+    Args:
+        messages: Chat messages for the enhancement request
+        
+    Returns:
+        Token limit sized from the length of the content being enhanced
+    """
+    # At roughly four characters per token this leaves room for the content to double
+    content = messages[-1]["content"]
+    return min(_MAX_MAX_TOKENS, max(_MIN_MAX_TOKENS, len(content) // 2 + 512))
+
+
+def _strip_code_fence(text: str) -> str:
+    """
+    Remove a markdown code fence wrapped around a response.
+    
+    Args:
+        text: Response text
+        
+    Returns:
+        Text inside the fence, or the stripped text if it isn't fenced
+    """
+    text = text.strip()
+    if text.startswith("```") and text.endswith("```"):
+        first_line_end = text.find("\n")
+        if first_line_end != -1:
+            return text[first_line_end + 1:-3].strip()
+    return text
+
+
+def _parse_json_object(text: str) -> Optional[Dict]:
+    """
+    Parse a response that should hold a single JSON object.
+    
+    Args:
+        text: Response text, optionally wrapped in a markdown code fence
+        
+    Returns:
+        Parsed object, or None if the text isn't a JSON object
+    """
+    try:
+        result = json.loads(_strip_code_fence(text))
+    except ValueError:
+        return None
+    return result if isinstance(result, dict) else None
+
+
+def _join_messages(messages: List[Dict[str, str]]) -> str:
+    """
+    Join chat messages into a single prompt for interfaces without roles.
+    
+    Args:
+        messages: Chat messages
+        
+    Returns:
+        Message contents separated by blank lines
+    """
+    return "\n\n".join(message["content"] for message in messages)
 
 
 class AIEnhancer:
@@ -12,16 +202,21 @@ class AIEnhancer:
     Enhances documentation content using AI.
     """
     
-    def __init__(self, model: str, logger: logging.Logger):
+    def __init__(self, model: str, logger: logging.Logger, use_cache: bool = True):
         """
         Initialize the AI enhancer.
         
         Args:
             model: AI model to use in format "provider/model_name"
             logger: Logger instance
+            use_cache: Whether to read and write cached responses from previous runs
         """
         self.model = model
         self.logger = logger
+        self.use_cache = use_cache
+        
+        # Stale cache entries are removed once per enhancer, on the first write
+        self._cache_pruned = False
         
         # Parse provider and model name
         try:
@@ -36,15 +231,26 @@ class AIEnhancer:
             self.logger.warning(f"Unsupported provider: {self.provider}. Falling back to openai.")
             self.provider = "openai"
         
+        # Import the provider's SDK once, so a missing package is reported before any content
+        # is generated
+        self._sdk, self._azure_identity = self._import_sdk()
+        
+        # Synchronous API client, created on first use and reused so its connection pool stays warm
+        # across sections; the lock keeps concurrent first calls from each creating one
+        self._client = None
+        self._client_lock = threading.Lock()
+        
         self.logger.info(f"Initialized AI enhancer with {self.provider}/{self.model_name}")
     
-    def enhance(self, content: str, section_name: str) -> str:
+    def enhance(self, content: str, section_name: str, prompt_cache_key: Optional[str] = None) -> str:
         """
         Enhance documentation content using AI.
         
         Args:
             content: Original content to enhance
             section_name: Name of the section being enhanced
+            prompt_cache_key: Optional key shared by requests that start with the same content,
+                which OpenAI uses to route them to its cached copy of that prefix
             
         Returns:
             Enhanced content
@@ -53,18 +259,10 @@ class AIEnhancer:
             self.logger.info(f"Enhancing {section_name} content with AI")
             
             # Get enhancement prompt for the section
-            prompt = self._get_enhancement_prompt(content, section_name)
+            messages = self._get_enhancement_messages(content, section_name)
             
             # Generate enhanced content using selected provider/model
-            if self.provider == "openai":
-                enhanced_content = self._enhance_with_openai(prompt)
-            elif self.provider == "azure":
-                enhanced_content = self._enhance_with_azure(prompt)
-            elif self.provider == "ollama":
-                enhanced_content = self._enhance_with_ollama(prompt)
-            else:
-                self.logger.warning(f"Unsupported provider: {self.provider}")
-                return content
+            enhanced_content = self._complete(messages, section_name, prompt_cache_key)
             
             # If enhancement failed, return original content
             if not enhanced_content:
@@ -77,7 +275,101 @@ class AIEnhancer:
             self.logger.error(f"Error during AI enhancement: {str(e)}")
             return content  # Return original content if enhancement fails
     
-    def _get_enhancement_prompt(self, content: str, section_name: str) -> str:
+    def enhance_tasks(self, shared_context: str, tasks: List[Dict[str, str]]) -> Optional[Dict[str, str]]:
+        """
+        Carry out several related content updates with a single AI request.
+        
+        The shared context is sent once for all tasks instead of once per task.
+        
+        Args:
+            shared_context: Source material that applies to every task
+            tasks: Tasks, each with an "id" and the "instructions" for its update
+            
+        Returns:
+            Updated content keyed by task ID, or None if the request failed or its response
+            could not be parsed. Tasks missing from the response are left out.
+        """
+        try:
+            self.logger.info(f"Running {len(tasks)} AI tasks in a single request")
+            
+            request = json.dumps({"shared_context": shared_context, "tasks": tasks}, ensure_ascii=False, indent=2)
+            messages = [
+                {"role": "system", "content": _TASKS_SYSTEM_CONTEXT},
+                {"role": "user", "content": request}
+            ]
+            
+            # Only responses that parse are cached, so a malformed reply is requested again
+            # next time instead of being reused
+            response = self._complete(
+                messages, "multi-task update",
+                validate=lambda text: _parse_json_object(text) is not None
+            )
+            if not response:
+                self.logger.warning("AI request for multiple tasks failed or its response is not a JSON object")
+                return None
+            
+            results = _parse_json_object(response)
+            
+            # Results that are themselves JSON (e.g. maps of values to update) may come back
+            # as nested objects rather than strings
+            task_ids = {task["id"] for task in tasks}
+            return {
+                task_id: result if isinstance(result, str) else json.dumps(result, ensure_ascii=False)
+                for task_id, result in results.items()
+                if task_id in task_ids and isinstance(result, (str, dict, list)) and result
+            }
+            
+        except Exception as e:
+            self.logger.warning(f"Error running AI tasks in a single request: {str(e)}")
+            return None
+    
+    def _complete(
+        self,
+        messages: List[Dict[str, str]],
+        section_name: str,
+        prompt_cache_key: Optional[str] = None,
+        validate: Optional[Callable[[str], bool]] = None
+    ) -> Optional[str]:
+        """
+        Get the model's response to chat messages, reusing a cached response if there is one.
+        
+        Args:
+            messages: Chat messages for the request
+            section_name: Name of the section the request is for, used in log messages
+            prompt_cache_key: Optional OpenAI prompt cache key for the request
+            validate: Optional check a response must pass to be used and cached
+            
+        Returns:
+            Response text, or None if the request failed or its response was rejected
+        """
+        # Identical prompts were already answered on an earlier run
+        cache_key = self._cache_key(messages)
+        cached = self._cache_get(cache_key)
+        if cached and (validate is None or validate(cached)):
+            self.logger.info(f"Using cached AI enhancement for {section_name}")
+            return cached
+        
+        # Generate the response using selected provider/model
+        if self.provider == "openai":
+            response = self._enhance_with_openai(messages, prompt_cache_key)
+        elif self.provider == "azure":
+            response = self._enhance_with_azure(messages)
+        elif self.provider == "ollama":
+            response = self._enhance_with_ollama(messages)
+        else:
+            self.logger.warning(f"Unsupported provider: {self.provider}")
+            return None
+        
+        if response and validate is not None and not validate(response):
+            self.logger.warning(f"Discarding invalid AI response for {section_name}")
+            return None
+        
+        if response:
+            self._cache_put(cache_key, response)
+        return response
+    
+    @staticmethod
+    def _get_enhancement_prompt(content: str, section_name: str) -> Tuple[str, str]:
         """
         Get the enhancement prompt for a specific section.
         
@@ -86,115 +378,434 @@ class AIEnhancer:
             section_name: Name of the section being enhanced
             
         Returns:
-            Enhancement prompt
+            Tuple of the system prompt, which is the same for every section, and the user prompt
+            holding the section instructions and content
         """
-        prompt_templates = {
-            "overview": "Format markdown. Fix errors. Enhance this project overview to be more comprehensive and user-friendly "
-                      "while maintaining accuracy. Add clear sections for features, use cases, and key "
-                      "concepts if they're not already present: ",
-            
-            "installation": "Format markdown. Fix errors. Improve this installation guide by adding clear prerequisites, "
-                          "troubleshooting tips, and platform-specific instructions while "
-                          "maintaining accuracy: ",
+        # Nothing section-specific goes into the system prompt, so providers can reuse their
+        # cached prefix across all sections
+        return _SYSTEM_CONTEXT, f"{_PROMPT_TEMPLATES.get(section_name, _DEFAULT_PROMPT)}\n\n{content}"
+    
+    def _get_enhancement_messages(self, content: str, section_name: str) -> List[Dict[str, str]]:
+        """
+        Get the chat messages for enhancing a specific section.
+        
+        Args:
+            content: Original content to enhance
+            section_name: Name of the section being enhanced
             
-            "api": "Format markdown. Fix errors. Enhance this API documentation by adding more detailed descriptions, usage "
-                  "examples, and parameter explanations while maintaining technical accuracy: ",
+        Returns:
+            System and user messages for the chat API
+        """
+        system_prompt, user_prompt = self._get_enhancement_prompt(content, section_name)
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
+    
+    def enhance_all(self, contents: Dict[str, str]) -> Dict[str, str]:
+        """
+        Enhance several sections concurrently.
+        
+        The requests are I/O bound, so they are issued together on an asyncio event loop
+        and the total time is that of the slowest section rather than the sum.
+        
+        Args:
+            contents: Original content keyed by section name
             
-            "development": "Format markdown. Fix errors. Improve this development guide by adding more context, best practices, "
-                         "and workflow descriptions while maintaining accuracy: ",
+        Returns:
+            Enhanced content keyed by section name
+        """
+        if not contents:
+            return {}
+        return asyncio.run(self._enhance_all(contents))
+    
+    async def _enhance_all(self, contents: Dict[str, str]) -> Dict[str, str]:
+        """
+        Enhance several sections concurrently with a shared asynchronous client.
+        
+        Args:
+            contents: Original content keyed by section name
             
-            "contributing": "Format markdown. Fix errors. Enhance these contributing guidelines by adding more specific examples, "
-                          "workflow descriptions, and best practices while maintaining accuracy: "
-        }
+        Returns:
+            Enhanced content keyed by section name
+        """
+        # Asynchronous clients are tied to the event loop, so one is created per batch
+        client = self._create_client(use_async=True)
         
-        # Get specific prompt for the section, or use a generic one
-        prompt = prompt_templates.get(
-            section_name, 
-            "Enhance this documentation while maintaining accuracy and improving clarity: "
-        )
+        # Limit the requests in flight so lower provider tiers aren't pushed over their rate limits
+        semaphore = asyncio.Semaphore(self._max_concurrency())
         
-        # Add system context to the prompt
-        system_context = (
-            "You are a technical documentation specialist helping to improve software documentation. "
-            "Your job is to enhance the provided documentation while maintaining factual accuracy. "
-            "Improve clarity, organization, and comprehensiveness. "
-            "Add examples where helpful. Format using markdown." \
-            "Fix any error for docusaurus website."
-        )
+        async def enhance_section(content: str, section_name: str) -> str:
+            async with semaphore:
+                return await self.aenhance(content, section_name, client)
         
-        # Return full prompt
-        return f"{system_context}\n\n{prompt}\n\n{content}"
+        try:
+            enhanced = await asyncio.gather(*(
+                enhance_section(content, section_name) for section_name, content in contents.items()
+            ))
+        finally:
+            close = getattr(client, "close", None)
+            if close is not None:
+                result = close()
+                if inspect.isawaitable(result):
+                    await result
+        
+        return dict(zip(contents, enhanced))
     
-    def _enhance_with_openai(self, prompt: str) -> Optional[str]:
+    def enhance_batch(self, items: List[Tuple[str, str]], timeout: Optional[float] = None) -> Dict[str, str]:
         """
-        Enhance content using OpenAI API.
+        Enhance several sections with a single OpenAI Batch API job.
+        
+        Batch jobs cost half as much as live requests but may take a long time to complete,
+        so this is only used when requested. Providers without a batch API, and jobs that
+        don't finish in time, fall back to enhance_all.
         
         Args:
-            prompt: Enhancement prompt
+            items: Pairs of section name and original content
+            timeout: Seconds to wait for the batch job before cancelling it; defaults to an hour
             
         Returns:
-            Enhanced content or None if enhancement failed
+            Enhanced content keyed by section name; sections that could not be enhanced keep
+            their original content
         """
+        contents = dict(items)
+        if not contents:
+            return {}
+        
+        if self.provider != "openai":
+            self.logger.info(f"Batch enhancement is not supported for {self.provider}; enhancing sections directly")
+            return self.enhance_all(contents)
+        
+        enhanced = dict(contents)
+        
+        # Only sections without a cached response are submitted
+        requests = {}
+        for section_name, content in contents.items():
+            messages = self._get_enhancement_messages(content, section_name)
+            cache_key = self._cache_key(messages)
+            cached = self._cache_get(cache_key)
+            if cached:
+                self.logger.info(f"Using cached AI enhancement for {section_name}")
+                enhanced[section_name] = cached
+            else:
+                requests[section_name] = (messages, cache_key)
+        
+        if not requests:
+            return enhanced
+        
+        client = self._get_client()
+        if client is None:
+            return enhanced
+        
         try:
-            self.logger.debug("Using OpenAI for enhancement")
+            self.logger.info(f"Submitting batch job to enhance {len(requests)} sections with AI")
+            
+            # One chat completion request per line, identified by section name
+            lines = []
+            for section_name, (messages, _) in requests.items():
+                lines.append(json.dumps({
+                    "custom_id": section_name,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": self.model_name,
+                        "messages": messages,
+                        "temperature": _TEMPERATURE,
+                        "max_tokens": _max_tokens(messages)
+                    }
+                }))
             
-            # Try to import OpenAI
+            batch_file = client.files.create(
+                file=("sections.jsonl", "\n".join(lines).encode('utf-8')),
+                purpose="batch"
+            )
+            batch = client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            
+            # Wait for the job to finish, cancelling it if it takes too long or the run is interrupted
+            timeout = _DEFAULT_BATCH_TIMEOUT if timeout is None else float(timeout)
+            deadline = time.monotonic() + timeout
             try:
-                from openai import OpenAI
-            except ImportError:
-                self.logger.error("OpenAI package not installed. Install with: pip install openai")
-                return None
+                while batch.status not in _BATCH_FINAL_STATES:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.logger.warning(
+                            f"AI batch job {batch.id} did not finish within {timeout:g} seconds. "
+                            "Cancelling it and enhancing sections directly."
+                        )
+                        self._cancel_batch(client, batch.id)
+                        enhanced.update(self.enhance_all({
+                            section_name: contents[section_name] for section_name in requests
+                        }))
+                        return enhanced
+                    
+                    time.sleep(min(_BATCH_POLL_INTERVAL, remaining))
+                    batch = client.batches.retrieve(batch.id)
+            except KeyboardInterrupt:
+                self.logger.warning(f"Interrupted while waiting for AI batch job {batch.id}. Cancelling it.")
+                self._cancel_batch(client, batch.id)
+                raise
             
-            # Check for API key
-            api_key = os.environ.get("OPENAI_API_KEY")
-            if not api_key:
-                self.logger.error("OPENAI_API_KEY environment variable not set")
-                return None
+            if batch.status != "completed" or not batch.output_file_id:
+                self.logger.warning(f"AI batch job {batch.id} ended with status {batch.status}. Using original content.")
+                return enhanced
             
-            # Initialize client
-            client = OpenAI(api_key=api_key)
+            # Collect the responses
+            output = client.files.content(batch.output_file_id).text
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                
+                result = json.loads(line)
+                section_name = result.get("custom_id")
+                if section_name not in requests:
+                    continue
+                
+                response = result.get("response") or {}
+                choices = (response.get("body") or {}).get("choices") or []
+                enhanced_content = choices[0].get("message", {}).get("content") if choices else None
+                if response.get("status_code") != 200 or not enhanced_content:
+                    self.logger.warning(f"AI enhancement failed. Using original content for {section_name}.")
+                    continue
+                
+                self._cache_put(requests[section_name][1], enhanced_content)
+                enhanced[section_name] = enhanced_content
             
-            # Make API call
-            response = client.chat.completions.create(
-                model=self.model_name,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                max_tokens=4096
-            )
+        except Exception as e:
+            self.logger.error(f"Error during batch AI enhancement: {str(e)}")
+        
+        return enhanced
+    
+    def _cancel_batch(self, client, batch_id: str) -> None:
+        """
+        Cancel a submitted batch job so it isn't billed for work no one will collect.
+        
+        Args:
+            client: Synchronous OpenAI client
+            batch_id: ID of the batch job
+        """
+        try:
+            client.batches.cancel(batch_id)
+        except Exception as e:
+            self.logger.warning(f"Could not cancel AI batch job {batch_id}: {str(e)}")
+    
+    def _max_concurrency(self) -> int:
+        """
+        Get the maximum number of sections to enhance at the same time.
+        
+        Returns:
+            Value of the SLIM_DOC_MAX_CONCURRENCY environment variable, or the default if it is
+            unset or invalid
+        """
+        value = os.environ.get("SLIM_DOC_MAX_CONCURRENCY")
+        if not value:
+            return _DEFAULT_MAX_CONCURRENCY
+        
+        try:
+            limit = int(value)
+        except ValueError:
+            limit = 0
+        
+        if limit < 1:
+            self.logger.warning(f"Invalid SLIM_DOC_MAX_CONCURRENCY: {value}. Using {_DEFAULT_MAX_CONCURRENCY}.")
+            return _DEFAULT_MAX_CONCURRENCY
+        
+        return limit
+    
+    async def aenhance(self, content: str, section_name: str, client=None) -> str:
+        """
+        Enhance documentation content using AI without blocking the event loop.
+        
+        Args:
+            content: Original content to enhance
+            section_name: Name of the section being enhanced
+            client: Optional asynchronous client for the provider, as created by _create_client
             
-            # Extract and return content
-            if response.choices and response.choices[0].message:
-                return response.choices[0].message.content
+        Returns:
+            Enhanced content
+        """
+        try:
+            self.logger.info(f"Enhancing {section_name} content with AI")
             
-            return None
+            # Get enhancement prompt for the section
+            messages = self._get_enhancement_messages(content, section_name)
+            
+            # Identical prompts were already answered on an earlier run
+            cache_key = self._cache_key(messages)
+            cached = self._cache_get(cache_key)
+            if cached:
+                self.logger.info(f"Using cached AI enhancement for {section_name}")
+                return cached
+            
+            # Generate enhanced content using selected provider/model
+            if self.provider in {"openai", "azure"}:
+                enhanced_content = await self._aenhance_with_openai(messages, client)
+            elif self.provider == "ollama":
+                enhanced_content = await self._aenhance_with_ollama(messages, client)
+            else:
+                self.logger.warning(f"Unsupported provider: {self.provider}")
+                return content
+            
+            # If enhancement failed, return original content
+            if not enhanced_content:
+                self.logger.warning(f"AI enhancement failed. Using original content for {section_name}.")
+                return content
+            
+            self._cache_put(cache_key, enhanced_content)
+            return enhanced_content
             
         except Exception as e:
-            self.logger.error(f"Error using OpenAI: {str(e)}")
-            return None
+            self.logger.error(f"Error during AI enhancement: {str(e)}")
+            return content  # Return original content if enhancement fails
     
-    def _enhance_with_azure(self, prompt: str) -> Optional[str]:
+    def _cache_key(self, messages: List[Dict[str, str]]) -> str:
         """
-        Enhance content using Azure OpenAI API.
+        Get the response cache key for a request.
         
         Args:
-            prompt: Enhancement prompt
+            messages: Chat messages for the enhancement request
             
         Returns:
-            Enhanced content or None if enhancement failed
+            Hex digest identifying the model, messages and sampling settings
+        """
+        payload = json.dumps(
+            {"model": self.model, "messages": messages, "temperature": _TEMPERATURE},
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def _cache_get(self, key: str) -> Optional[str]:
         """
+        Load a cached response.
+        
+        Args:
+            key: Cache key from _cache_key
+            
+        Returns:
+            Cached response, or None on a cache miss, for an expired entry or if caching is off
+        """
+        if not self.use_cache:
+            return None
+        
         try:
-            self.logger.debug("Using Azure OpenAI for enhancement")
+            with open(os.path.join(_response_cache_dir(), f"{key}.json"), 'r', encoding='utf-8') as f:
+                if time.time() - os.fstat(f.fileno()).st_mtime > _RESPONSE_CACHE_TTL:
+                    return None
+                return json.load(f).get("content")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.debug(f"Ignoring unreadable AI response cache entry: {str(e)}")
+        
+        return None
+    
+    def _cache_put(self, key: str, value: str) -> None:
+        """
+        Store a response in the cache.
+        
+        Args:
+            key: Cache key from _cache_key
+            value: Response to store
+        """
+        if not self.use_cache:
+            return
+        
+        try:
+            cache_dir = _response_cache_dir()
+            os.makedirs(cache_dir, exist_ok=True)
+            
+            if not self._cache_pruned:
+                self._cache_pruned = True
+                self._prune_cache(cache_dir)
+            
+            # Write to a temporary file first so concurrent runs never read a partial entry
+            path = os.path.join(cache_dir, f"{key}.json")
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"model": self.model, "content": value}, f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            self.logger.debug(f"Could not write AI response cache: {str(e)}")
+    
+    def _prune_cache(self, cache_dir: str) -> None:
+        """
+        Remove expired entries from the response cache.
+        
+        Args:
+            cache_dir: Directory of the response cache
+        """
+        expiry = time.time() - _RESPONSE_CACHE_TTL
+        try:
+            with os.scandir(cache_dir) as entries:
+                for entry in entries:
+                    try:
+                        if entry.name.endswith('.json') and entry.stat().st_mtime < expiry:
+                            os.remove(entry.path)
+                    except OSError:
+                        # Another run may have removed or replaced the entry
+                        continue
+        except OSError as e:
+            self.logger.debug(f"Could not prune AI response cache: {str(e)}")
+    
+    def _import_sdk(self):
+        """
+        Import the SDK of the configured provider.
+        
+        Returns:
+            Tuple of the openai or ollama module and, for Azure, the azure.identity module.
+            The ollama module is None if it isn't installed, in which case the ollama CLI is used.
             
-            # Try to import required packages
+        Raises:
+            ImportError: If a package required by the OpenAI or Azure provider is not installed
+        """
+        if self.provider == "ollama":
             try:
-                from azure.identity import DefaultAzureCredential
-                from openai import AzureOpenAI
+                import ollama
             except ImportError:
-                self.logger.error("Azure packages not installed. Install with: pip install azure-identity openai")
+                self.logger.info("Ollama package not installed. Falling back to the ollama command.")
+                return None, None
+            
+            return ollama, None
+        
+        try:
+            import openai
+        except ImportError:
+            raise ImportError("OpenAI package not installed. Install with: pip install openai")
+        
+        if self.provider != "azure":
+            return openai, None
+        
+        try:
+            import azure.identity
+        except ImportError:
+            raise ImportError("Azure packages not installed. Install with: pip install azure-identity openai")
+        
+        return openai, azure.identity
+    
+    def _create_client(self, use_async: bool = False):
+        """
+        Create an API client for the configured provider.
+        
+        Args:
+            use_async: Whether to create an asyncio client
+            
+        Returns:
+            Client instance, or None if the provider's package or credentials are missing
+        """
+        if self.provider == "openai":
+            # Check for API key
+            api_key = os.environ.get("OPENAI_API_KEY")
+            if not api_key:
+                self.logger.error("OPENAI_API_KEY environment variable not set")
                 return None
             
+            client_class = self._sdk.AsyncOpenAI if use_async else self._sdk.OpenAI
+            return client_class(api_key=api_key)
+        
+        if self.provider == "azure":
             # Check for required environment variables
             endpoint = os.environ.get("AZURE_OPENAI_ENDPOINT")
             api_key = os.environ.get("AZURE_OPENAI_API_KEY")
@@ -203,47 +814,205 @@ class AIEnhancer:
                 self.logger.error("AZURE_OPENAI_ENDPOINT environment variable not set")
                 return None
             
-            # Initialize client
+            client_class = self._sdk.AsyncAzureOpenAI if use_async else self._sdk.AzureOpenAI
             if api_key:
-                client = AzureOpenAI(
+                return client_class(
                     api_key=api_key,
                     api_version="2023-05-15",
                     azure_endpoint=endpoint
                 )
-            else:
-                # Use default Azure credentials
-                client = AzureOpenAI(
-                    azure_ad_token_provider=DefaultAzureCredential(),
-                    api_version="2023-05-15",
-                    azure_endpoint=endpoint
-                )
             
-            # Make API call
-            response = client.chat.completions.create(
-                model=self.model_name,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                max_tokens=4096
+            # Use default Azure credentials
+            return client_class(
+                azure_ad_token_provider=self._azure_identity.DefaultAzureCredential(),
+                api_version="2023-05-15",
+                azure_endpoint=endpoint
             )
+        
+        if self.provider == "ollama" and self._sdk is not None:
+            return self._sdk.AsyncClient() if use_async else self._sdk.Client()
+        
+        # Without the ollama package the subprocess fallback is used
+        return None
+    
+    def _get_client(self):
+        """
+        Get the synchronous API client, creating it on first use.
+        
+        Returns:
+            Client instance, or None if it couldn't be created
+        """
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self._create_client()
+        return self._client
+    
+    def _enhance_with_openai(
+        self,
+        messages: List[Dict[str, str]],
+        prompt_cache_key: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Enhance content using OpenAI API.
+        
+        Args:
+            messages: Chat messages for the enhancement request
+            prompt_cache_key: Optional key for OpenAI's prompt cache
             
-            # Extract and return content
-            if response.choices and response.choices[0].message:
-                return response.choices[0].message.content
+        Returns:
+            Enhanced content or None if enhancement failed
+        """
+        try:
+            self.logger.debug("Using OpenAI for enhancement")
             
+            client = self._get_client()
+            if client is None:
+                return None
+            
+            return self._with_retries(self._stream_completion, client, messages, prompt_cache_key)
+            
+        except Exception as e:
+            self.logger.error(f"Error using OpenAI: {str(e)}")
             return None
+    
+    def _enhance_with_azure(self, messages: List[Dict[str, str]]) -> Optional[str]:
+        """
+        Enhance content using Azure OpenAI API.
+        
+        Args:
+            messages: Chat messages for the enhancement request
+            
+        Returns:
+            Enhanced content or None if enhancement failed
+        """
+        try:
+            self.logger.debug("Using Azure OpenAI for enhancement")
+            
+            client = self._get_client()
+            if client is None:
+                return None
+            
+            return self._with_retries(self._stream_completion, client, messages)
             
         except Exception as e:
             self.logger.error(f"Error using Azure OpenAI: {str(e)}")
             return None
     
-    def _enhance_with_ollama(self, prompt: str) -> Optional[str]:
+    def _stream_completion(
+        self,
+        client,
+        messages: List[Dict[str, str]],
+        prompt_cache_key: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Request a chat completion from the OpenAI or Azure OpenAI API.
+        
+        Args:
+            client: OpenAI or Azure OpenAI client
+            messages: Chat messages for the enhancement request
+            prompt_cache_key: Optional key for OpenAI's prompt cache
+            
+        Returns:
+            Completion text, or None if it was empty
+        """
+        # Passed through extra_body so SDK versions without the parameter still send it
+        extra_body = {"prompt_cache_key": prompt_cache_key} if prompt_cache_key else None
+        
+        # Stream the completion so it is received as it is generated
+        stream = client.chat.completions.create(
+            model=self.model_name,
+            messages=messages,
+            temperature=_TEMPERATURE,
+            max_tokens=_max_tokens(messages),
+            stream=True,
+            extra_body=extra_body
+        )
+        
+        parts = []
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+        
+        return "".join(parts) or None
+    
+    async def _astream_completion(self, client, messages: List[Dict[str, str]]) -> Optional[str]:
+        """
+        Request a chat completion from the OpenAI or Azure OpenAI API asynchronously.
+        
+        Args:
+            client: Asynchronous OpenAI or Azure OpenAI client
+            messages: Chat messages for the enhancement request
+            
+        Returns:
+            Completion text, or None if it was empty
+        """
+        # Stream the completion so it is received as it is generated
+        stream = await client.chat.completions.create(
+            model=self.model_name,
+            messages=messages,
+            temperature=_TEMPERATURE,
+            max_tokens=_max_tokens(messages),
+            stream=True
+        )
+        
+        parts = []
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+        
+        return "".join(parts) or None
+    
+    def _with_retries(self, request, *args):
+        """
+        Call a provider request, retrying it after transient errors.
+        
+        Args:
+            request: Function making the request
+            *args: Arguments for the request
+            
+        Returns:
+            Result of the first successful attempt
+        """
+        transient = _transient_errors()
+        for attempt in range(1, _MAX_ATTEMPTS + 1):
+            try:
+                return request(*args)
+            except transient as e:
+                if attempt == _MAX_ATTEMPTS:
+                    raise
+                delay = _retry_delay(e, attempt)
+                self.logger.warning(f"Transient AI provider error: {str(e)}. Retrying in {delay:.1f}s")
+                time.sleep(delay)
+    
+    async def _awith_retries(self, request, *args):
+        """
+        Await a provider request, retrying it after transient errors.
+        
+        Args:
+            request: Coroutine function making the request
+            *args: Arguments for the request
+            
+        Returns:
+            Result of the first successful attempt
+        """
+        transient = _transient_errors()
+        for attempt in range(1, _MAX_ATTEMPTS + 1):
+            try:
+                return await request(*args)
+            except transient as e:
+                if attempt == _MAX_ATTEMPTS:
+                    raise
+                delay = _retry_delay(e, attempt)
+                self.logger.warning(f"Transient AI provider error: {str(e)}. Retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+    
+    def _enhance_with_ollama(self, messages: List[Dict[str, str]]) -> Optional[str]:
         """
         Enhance content using Ollama (local models).
         
         Args:
-            prompt: Enhancement prompt
+            messages: Chat messages for the enhancement request
             
         Returns:
             Enhanced content or None if enhancement failed
@@ -251,32 +1020,86 @@ class AIEnhancer:
         try:
             self.logger.debug("Using Ollama for enhancement")
             
-            # Try to import Ollama client
-            try:
-                import ollama
-            except ImportError:
+            client = self._get_client()
+            if client is None:
                 # If ollama package is not available, try using subprocess
-                return self._enhance_with_ollama_subprocess(prompt)
+                return self._enhance_with_ollama_subprocess(_join_messages(messages))
             
-            # Make API call
-            response = ollama.chat(
+            # Make API call, streaming the response so it is received as it is generated
+            stream = client.chat(
                 model=self.model_name,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
+                messages=messages,
+                stream=True
             )
             
             # Extract and return content
-            if response and "message" in response and "content" in response["message"]:
-                return response["message"]["content"]
+            parts = []
+            for chunk in stream:
+                if chunk and "message" in chunk and "content" in chunk["message"]:
+                    parts.append(chunk["message"]["content"])
             
-            return None
+            return "".join(parts) or None
             
         except Exception as e:
             self.logger.error(f"Error using Ollama: {str(e)}")
             
             # Fall back to subprocess method
-            return self._enhance_with_ollama_subprocess(prompt)
+            return self._enhance_with_ollama_subprocess(_join_messages(messages))
+    
+    async def _aenhance_with_openai(self, messages: List[Dict[str, str]], client) -> Optional[str]:
+        """
+        Enhance content using the OpenAI or Azure OpenAI API asynchronously.
+        
+        Args:
+            messages: Chat messages for the enhancement request
+            client: Asynchronous OpenAI or Azure OpenAI client
+            
+        Returns:
+            Enhanced content or None if enhancement failed
+        """
+        if client is None:
+            return None
+        
+        try:
+            return await self._awith_retries(self._astream_completion, client, messages)
+            
+        except Exception as e:
+            self.logger.error(f"Error using {'Azure OpenAI' if self.provider == 'azure' else 'OpenAI'}: {str(e)}")
+            return None
+    
+    async def _aenhance_with_ollama(self, messages: List[Dict[str, str]], client) -> Optional[str]:
+        """
+        Enhance content using Ollama (local models) asynchronously.
+        
+        Args:
+            messages: Chat messages for the enhancement request
+            client: Asynchronous Ollama client, or None to use the subprocess fallback
+            
+        Returns:
+            Enhanced content or None if enhancement failed
+        """
+        if client is not None:
+            try:
+                stream = await client.chat(
+                    model=self.model_name,
+                    messages=messages,
+                    stream=True
+                )
+                
+                # Extract and return content
+                parts = []
+                async for chunk in stream:
+                    if chunk and "message" in chunk and "content" in chunk["message"]:
+                        parts.append(chunk["message"]["content"])
+                
+                return "".join(parts) or None
+                
+            except Exception as e:
+                self.logger.error(f"Error using Ollama: {str(e)}")
+        
+        # Fall back to the subprocess method on a worker thread
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._enhance_with_ollama_subprocess, _join_messages(messages))
     
     def _enhance_with_ollama_subprocess(self, prompt: str) -> Optional[str]:
         """
@@ -294,33 +1117,25 @@ class AIEnhancer:
             # Check if ollama is installed
             import subprocess
             
-            # Create a temporary file for the prompt
-            import tempfile
-            with tempfile.NamedTemporaryFile(mode="w+", delete=False) as temp:
-                temp.write(prompt)
-                temp_path = temp.name
-            
-            # Run ollama command
+            # Run ollama command, passing the prompt on stdin
             try:
                 result = subprocess.run(
-                    ["ollama", "run", self.model_name, temp_path],
+                    ["ollama", "run", self.model_name],
+                    input=prompt,
                     capture_output=True,
                     text=True,
-                    check=True
+                    check=True,
+                    timeout=300
                 )
                 
-                # Clean up temp file
-                os.unlink(temp_path)
-                
                 # Return output
                 return result.stdout.strip()
                 
             except subprocess.CalledProcessError as e:
                 self.logger.error(f"Ollama subprocess failed: {e}")
-                
-                # Clean up temp file
-                os.unlink(temp_path)
-                
+                return None
+            except subprocess.TimeoutExpired:
+                self.logger.error("Ollama subprocess timed out")
                 return None
                 
         except Exception as e:
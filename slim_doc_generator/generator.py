@@ -5,7 +5,9 @@ import logging
 import os
 import shutil
 import re
-from typing import Dict, List, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from slim_doc_generator.analyzer.repo_analyzer import RepoAnalyzer
 from slim_doc_generator.content.overview_generator import OverviewGenerator
@@ -19,6 +21,9 @@ from slim_doc_generator.template.config_updater import ConfigUpdater
 from slim_doc_generator.site_reviser import SiteReviser
 from slim_doc_generator.utils.helpers import load_config, escape_mdx_special_characters, clean_api_doc
 
+# Sidebar reference of the docs navbar item in docusaurus.config.js
+_SIDEBAR_ID_RE = re.compile(r'sidebarId:\s*"[^"]+"')
+
 
 class SlimDocGenerator:
     """
@@ -34,7 +39,8 @@ class SlimDocGenerator:
         config_file: Optional[str] = None,
         verbose: bool = False,
         template_only: bool = False,
-        revise_site: bool = False
+        revise_site: bool = False,
+        use_cache: bool = True
     ):
         """
         Initialize the SLIM documentation generator.
@@ -48,6 +54,7 @@ class SlimDocGenerator:
             verbose: Whether to enable verbose logging
             template_only: Whether to generate only the template structure without analyzing a repository
             revise_site: Whether to revise the site landing page based on documentation content
+            use_cache: Whether to reuse cached results from previous runs
         """
         # Set up logging
         self.logger = logging.getLogger("slim-doc-generator")
@@ -60,6 +67,7 @@ class SlimDocGenerator:
         self.verbose = verbose
         self.template_only = template_only
         self.revise_site = revise_site
+        self.use_cache = use_cache
         
         # Initialize the template manager first 
         # since it's needed regardless of whether we're analyzing a repo
@@ -67,10 +75,10 @@ class SlimDocGenerator:
         self.config_updater = ConfigUpdater(output_dir, self.logger)
         
         # Initialize site reviser if needed
-        self.site_reviser = SiteReviser(output_dir, self.logger) if revise_site else None
+        self.site_reviser = SiteReviser(output_dir, self.logger, use_cache=use_cache) if revise_site else None
         
         # Initialize AI enhancer if enabled
-        self.ai_enhancer = AIEnhancer(use_ai, self.logger) if use_ai else None
+        self.ai_enhancer = AIEnhancer(use_ai, self.logger, use_cache=use_cache) if use_ai else None
         
         # Only initialize repo-specific components if we have a target repo
         if target_repo_path:
@@ -87,7 +95,12 @@ class SlimDocGenerator:
             self.content_generators = {
                 "overview": OverviewGenerator(self.target_repo_path, self.logger),
                 "installation": InstallationGenerator(self.target_repo_path, self.logger),
-                "api": ApiGenerator(self.target_repo_path, self.logger),
+                "api": ApiGenerator(
+                    self.target_repo_path,
+                    self.logger,
+                    cache_dir=os.path.join(self.output_dir, '.cache'),
+                    use_cache=use_cache
+                ),
                 "development": DevelopmentGenerator(self.target_repo_path, self.logger),
                 "contributing": ContributingGenerator(self.target_repo_path, self.logger)
             }
@@ -231,15 +244,24 @@ class SlimDocGenerator:
             }
             
             api_doc_path = None  # Track the API doc path for special cleaning
+            written = set()  # Track the sections that were written to docs_dir
+            
+            # Generate content for all sections concurrently
+            contents = self._generate_sections(sections, repo_info)
+            
+            # Enhance with AI if enabled; the sections are enhanced concurrently, or submitted
+            # together as one cheaper batch job if the configuration asks for it
+            if self.ai_enhancer and contents:
+                if self.config.get("ai_batch"):
+                    contents = self.ai_enhancer.enhance_batch(
+                        list(contents.items()),
+                        timeout=self.config.get("ai_batch_timeout")
+                    )
+                else:
+                    contents = self.ai_enhancer.enhance_all(contents)
             
             for section_id, section_title in sections.items():
-                # Generate content
-                generator = self.content_generators[section_id]
-                content = generator.generate(repo_info)
-                
-                # Enhance with AI if enabled
-                if self.ai_enhancer and content:
-                    content = self.ai_enhancer.enhance(content, section_id)
+                content = contents.get(section_id)
                 
                 # Write to file if content was generated
                 if content:
@@ -247,14 +269,10 @@ class SlimDocGenerator:
                     content = escape_mdx_special_characters(content)
                     
                     file_path = os.path.join(docs_dir, f"{section_id}.md")
-                    with open(file_path, 'w') as f:
-                        # Add frontmatter
-                        f.write("---\n")
-                        f.write(f"id: {section_id}\n")
-                        f.write(f"title: {section_title}\n")
-                        f.write("---\n\n")
-                        f.write(content)
+                    # Add frontmatter
+                    Path(file_path).write_text(f"---\nid: {section_id}\ntitle: {section_title}\n---\n\n{content}")
                     self.logger.info(f"Generated {section_id} content")
+                    written.add(section_id)
                     
                     # Special handling for API doc - save path for additional cleaning
                     if section_id == "api":
@@ -266,16 +284,14 @@ class SlimDocGenerator:
                 self.logger.info("Applied additional cleaning to API documentation")
             
             # Step 5: Generate index.md
-            self._generate_index(repo_info, docs_dir)
+            self._generate_index(repo_info, docs_dir, written)
             
             # Step 6: Update configuration files - must come after content generation
             # so we know which sections were actually created
             self.config_updater.update_config(repo_info)
             
             # Step 7: Generate or update sidebars.js
-            sections_with_content = {section_id for section_id in sections if 
-                                    os.path.exists(os.path.join(docs_dir, f"{section_id}.md"))}
-            sections_with_content.add("index")  # Make sure index is always included
+            sections_with_content = written | {"index"}  # Make sure index is always included
             self.config_updater.update_sidebars(sections_with_content)
             
             # Step 8: Verify the structure is correct for Docusaurus
@@ -295,13 +311,70 @@ class SlimDocGenerator:
                 self.logger.debug(traceback.format_exc())
             return False
 
-    def _generate_index(self, repo_info: Dict, docs_dir: str) -> None:
+    def _generate_sections(self, section_ids: Iterable[str], repo_info: Dict) -> Dict[str, str]:
+        """
+        Generate the content of several sections.
+        
+        The generators are independent and mostly I/O bound, so they run on a thread pool,
+        one task per section.
+        
+        Args:
+            section_ids: IDs of the sections to generate
+            repo_info: Repository information dictionary
+            
+        Returns:
+            Generated content keyed by section ID, for sections that produced any
+        """
+        section_ids = list(section_ids)
+        if not section_ids:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(8, len(section_ids))) as executor:
+            futures = {
+                section_id: executor.submit(self._generate_section, section_id, repo_info)
+                for section_id in section_ids
+            }
+        
+        contents = {}
+        for section_id, future in futures.items():
+            content = future.result()
+            if content:
+                contents[section_id] = content
+        
+        return contents
+    
+    def _generate_section(self, section_id: str, repo_info: Dict) -> Optional[str]:
+        """
+        Generate the content of a single section.
+        
+        Args:
+            section_id: ID of the section to generate
+            repo_info: Repository information dictionary
+            
+        Returns:
+            Generated content
+        """
+        generator = self.content_generators[section_id]
+        if not hasattr(generator, 'prefetch'):
+            return generator.generate(repo_info)
+        
+        # Read the generator's source files up front; generation still works without them
+        try:
+            prefetched = generator.prefetch(repo_info)
+        except Exception as e:
+            self.logger.warning(f"Error prefetching sources for {section_id}: {str(e)}")
+            return generator.generate(repo_info)
+        
+        return generator.generate(repo_info, prefetched=prefetched)
+    
+    def _generate_index(self, repo_info: Dict, docs_dir: str, written: Set[str]) -> None:
         """
         Generate the index.md file.
         
         Args:
             repo_info: Repository information dictionary
             docs_dir: Directory where docs are being generated
+            written: IDs of the sections that were written to docs_dir
         """
         project_name = repo_info.get("project_name", os.path.basename(self.target_repo_path))
         description = repo_info.get("description", f"{project_name} documentation")
@@ -316,9 +389,9 @@ class SlimDocGenerator:
         ]
         
         # Add links to generated sections
-        if os.path.exists(os.path.join(docs_dir, "overview.md")):
+        if "overview" in written:
             content.append("- [Overview](overview.md)")
-        if os.path.exists(os.path.join(docs_dir, "installation.md")):
+        if "installation" in written:
             content.append("- [Installation](installation.md)")
         
         content.extend([
@@ -327,11 +400,11 @@ class SlimDocGenerator:
             ""
         ])
         
-        if os.path.exists(os.path.join(docs_dir, "api.md")):
+        if "api" in written:
             content.append("- [API Reference](api.md)")
-        if os.path.exists(os.path.join(docs_dir, "development.md")):
+        if "development" in written:
             content.append("- [Development](development.md)")
-        if os.path.exists(os.path.join(docs_dir, "contributing.md")):
+        if "contributing" in written:
             content.append("- [Contributing](contributing.md)")
         
         # Join content and escape special characters
@@ -340,12 +413,14 @@ class SlimDocGenerator:
         
         # Write to file
         with open(os.path.join(docs_dir, 'index.md'), 'w') as f:
-            f.write("---\n")
-            f.write("slug: /\n")
-            f.write("id: index\n")
-            f.write(f"title: {project_name} Documentation\n")
-            f.write("---\n\n")
-            f.write(index_content)
+            f.write(
+                "---\n"
+                "slug: /\n"
+                "id: index\n"
+                f"title: {project_name} Documentation\n"
+                "---\n\n"
+                f"{index_content}"
+            )
         
         self.logger.info("Generated index.md")
         
@@ -366,30 +441,34 @@ class SlimDocGenerator:
         if not os.path.exists(index_path):
             self.logger.warning("index.md not found in docs directory. Generating a basic one.")
             with open(index_path, 'w') as f:
-                f.write("---\n")
-                f.write("slug: /\n")
-                f.write("id: index\n")
-                f.write("title: Documentation\n")
-                f.write("---\n\n")
-                f.write("# Documentation\n\n")
-                f.write("Welcome to the documentation.\n")
+                f.write(
+                    "---\n"
+                    "slug: /\n"
+                    "id: index\n"
+                    "title: Documentation\n"
+                    "---\n\n"
+                    "# Documentation\n\n"
+                    "Welcome to the documentation.\n"
+                )
         
         # Check 2: Ensure the sidebars.js file exists and is properly formatted
         sidebars_path = os.path.join(self.output_dir, 'sidebars.js')
         if not os.path.exists(sidebars_path):
             self.logger.warning("sidebars.js not found. Generating a basic one.")
             with open(sidebars_path, 'w') as f:
-                f.write("/** @type {import('@docusaurus/plugin-content-docs').SidebarsConfig} */\n")
-                f.write("const sidebars = {\n")
-                f.write("  tutorialSidebar: [\n")
-                f.write("    {\n")
-                f.write("      type: 'doc',\n")
-                f.write("      id: 'index',\n")
-                f.write("      label: 'Home',\n")
-                f.write("    },\n")
-                f.write("  ],\n")
-                f.write("};\n\n")
-                f.write("module.exports = sidebars;\n")
+                f.write(
+                    "/** @type {import('@docusaurus/plugin-content-docs').SidebarsConfig} */\n"
+                    "const sidebars = {\n"
+                    "  tutorialSidebar: [\n"
+                    "    {\n"
+                    "      type: 'doc',\n"
+                    "      id: 'index',\n"
+                    "      label: 'Home',\n"
+                    "    },\n"
+                    "  ],\n"
+                    "};\n\n"
+                    "module.exports = sidebars;\n"
+                )
         
         # Check 3: Verify the docusaurus.config.js has the right sidebar ID
         config_path = os.path.join(self.output_dir, 'docusaurus.config.js')
@@ -401,14 +480,9 @@ class SlimDocGenerator:
                 # Make sure there's a reference to 'tutorialSidebar' in the navbar items
                 if 'sidebarId: "tutorialSidebar"' not in config_content:
                     self.logger.warning("tutorialSidebar not found in docusaurus.config.js. Attempting to fix.")
-                    if re.search(r'sidebarId:\s*"[^"]+"', config_content):
-                        # Replace the existing sidebarId
-                        config_content = re.sub(
-                            r'sidebarId:\s*"[^"]+"',
-                            'sidebarId: "tutorialSidebar"',
-                            config_content
-                        )
-                        
+                    # Replace the existing sidebarId
+                    config_content, replaced = _SIDEBAR_ID_RE.subn('sidebarId: "tutorialSidebar"', config_content)
+                    if replaced:
                         with open(config_path, 'w') as f:
                             f.write(config_content)
             except Exception as e:
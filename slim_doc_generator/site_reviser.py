@@ -1,23 +1,206 @@
 """
 Site revision module for updating landing page content based on docs/overview.md using AI enhancement.
 """
+import hashlib
+import json
 import logging
+import mmap
 import os
 import re
-import base64
-import requests
-from typing import Dict, Optional, Tuple
-from io import BytesIO
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 from slim_doc_generator.utils.helpers import load_config, extract_frontmatter
 
+# Patterns used on every revision, compiled once
+_IMPORT_LINE_RE = re.compile(r'^import .+?;?$', re.MULTILINE)
+_SITECFG_RE = re.compile(r'const\s*\{\s*siteConfig\s*\}')
+_CODE_BLOCK_RE = {
+    language: re.compile(rf"```(?:{language})?\n(.*?)```", re.DOTALL)
+    for language in ("javascript", "css", "json")
+}
+
+# Text the AI may change in landing page files, so prompts can carry it instead of whole files.
+# Each pattern's first non-empty group is the editable text.
+_EDITABLE_REGION_RES = {
+    "title": re.compile(r"""\btitle:\s*(?:'((?:[^'\\\n]|\\.)*)'|"((?:[^"\\\n]|\\.)*)")"""),
+    "tagline": re.compile(r"""\btagline:\s*(?:'((?:[^'\\\n]|\\.)*)'|"((?:[^"\\\n]|\\.)*)")"""),
+    "FeatureList": re.compile(r'\bFeatureList\s*=\s*\[([\s\S]*?)\];'),
+}
+
+# Line prefixes marking where code starts in AI responses without a code block
+_JS_STARTS = ('import', 'const', 'let', 'var', 'function', 'class', '/**')
+_CSS_STARTS = ('.', '/*', '*', '#', '@media', ':root')
+
+# Files larger than this many bytes are read through mmap
+_MMAP_THRESHOLD = 64 * 1024
+
+# Number of overview.md bullet points used as key features
+_MAX_FEATURES = 5
+
+
+def _parse_overview(text: str) -> Tuple[Optional[str], Optional[str], List[str]]:
+    """
+    Extract the title heading, description, and key features from overview.md in one pass.
+    
+    Args:
+        text: Content of overview.md without frontmatter
+        
+    Returns:
+        Tuple of (first level-one heading, first plain text line, first bullet points)
+    """
+    title = description = None
+    features = []
+    for line in text.splitlines():
+        stripped = line.strip()
+        if title is None and stripped.startswith('# '):
+            title = stripped[2:].strip()
+        elif stripped.startswith('- '):
+            if len(features) < _MAX_FEATURES:
+                features.append(stripped[2:].strip())
+        elif description is None and stripped and not stripped.startswith(('#', '-')):
+            description = stripped
+        
+        if title is not None and description is not None and len(features) >= _MAX_FEATURES:
+            break
+    
+    return title, description, features
+
+
+def _region_span(match: "re.Match") -> Tuple[int, int]:
+    """
+    Get the span of the editable text in a match of an _EDITABLE_REGION_RES pattern.
+    
+    Args:
+        match: Match of an editable region pattern
+        
+    Returns:
+        Start and end offsets of the editable text
+    """
+    group = next(i for i in range(1, match.re.groups + 1) if match.group(i) is not None)
+    return match.span(group)
+
+
+def _extract_editable_regions(source: str, names: Tuple[str, ...]) -> Dict[str, str]:
+    """
+    Extract the editable regions of a JavaScript source file.
+    
+    Args:
+        source: JavaScript source
+        names: Names of the regions to look for, keys of _EDITABLE_REGION_RES
+        
+    Returns:
+        Current text of each region found, keyed by region name
+    """
+    regions = {}
+    for name in names:
+        match = _EDITABLE_REGION_RES[name].search(source)
+        if match:
+            start, end = _region_span(match)
+            regions[name] = source[start:end]
+            
+            # String values are shown unescaped, the way they are returned
+            if source[start - 1] in ('"', "'"):
+                regions[name] = re.sub(r'\\(.)', r'\1', regions[name])
+    return regions
+
+
+def _splice_editable_regions(source: str, replacements: Dict[str, str]) -> str:
+    """
+    Replace the text of editable regions in a JavaScript source file.
+    
+    Args:
+        source: JavaScript source
+        replacements: New text keyed by region name
+        
+    Returns:
+        Source with the regions replaced; quotes in new string values are escaped
+    """
+    for name, value in replacements.items():
+        match = _EDITABLE_REGION_RES[name].search(source)
+        if not match:
+            continue
+        
+        start, end = _region_span(match)
+        quote = source[start - 1]
+        if quote in ('"', "'"):
+            value = value.replace('\\', '\\\\').replace(quote, '\\' + quote).replace('\n', ' ')
+        source = source[:start] + value + source[end:]
+    return source
+
+
+def _find_line_start(text: str, prefixes: Tuple[str, ...]) -> Optional[int]:
+    """
+    Find the first line that starts with one of the given prefixes.
+    
+    Args:
+        text: Text to search
+        prefixes: Prefixes to look for at the start of a line
+        
+    Returns:
+        Offset of the matching line in the text, or None if no line matches
+    """
+    offset = 0
+    while True:
+        if text.startswith(prefixes, offset):
+            return offset
+        newline = text.find('\n', offset)
+        if newline == -1:
+            return None
+        offset = newline + 1
+
+
+@lru_cache(maxsize=128)
+def _extract_code_block_cached(content: str, language: str) -> str:
+    """
+    Extract code from content, removing markdown code blocks and explanations.
+    
+    Cached because the same AI responses are extracted again when they come from a cache.
+    
+    Args:
+        content: Content possibly containing code blocks
+        language: Language of the code for markdown block detection
+        
+    Returns:
+        Clean code without markdown formatting
+    """
+    # Check if the content is already wrapped in a markdown code block
+    code_block_re = _CODE_BLOCK_RE.get(language)
+    if code_block_re is None:
+        code_block_re = re.compile(rf"```(?:{re.escape(language)})?\n(.*?)```", re.DOTALL)
+    code_match = code_block_re.search(content)
+    
+    if code_match:
+        # Extract just the code from the markdown code block
+        return code_match.group(1).strip()
+    
+    # If not in a code block, try to identify and remove any explanatory text
+    # This is a heuristic approach to find where the code starts
+    
+    # Look for common import statements at the start of JS files
+    if language == "javascript":
+        code_start = _find_line_start(content, _JS_STARTS)
+        if code_start is not None:
+            return content[code_start:].strip()
+    
+    # Look for CSS starting patterns
+    if language == "css":
+        code_start = _find_line_start(content, _CSS_STARTS)
+        if code_start is not None:
+            return content[code_start:].strip()
+    
+    # If we couldn't identify a clear pattern, just return the content as is
+    return content.strip()
+
 
 class SiteReviser:
     """
     Updates site landing page content based on docs/overview.md using AI enhancement.
     """
     
-    def __init__(self, output_dir: str, logger: logging.Logger, ai_enhancer=None):
+    def __init__(self, output_dir: str, logger: logging.Logger, ai_enhancer=None, use_cache: bool = True):
         """
         Initialize the site reviser.
         
@@ -25,10 +208,17 @@ class SiteReviser:
             output_dir: Directory where the documentation site is generated
             logger: Logger instance
             ai_enhancer: Optional AI enhancer for content improvement
+            use_cache: Whether to skip files already revised by earlier runs and record
+                this run's revisions
         """
         self.output_dir = output_dir
         self.logger = logger
         self.ai_enhancer = ai_enhancer
+        self.use_cache = use_cache
+        
+        # Image generation support doesn't change at runtime, so look it up once
+        self._generate_image = getattr(ai_enhancer, 'generate_image', None) if ai_enhancer else None
+        
         self.docs_dir = os.path.join(output_dir, 'docs')
         self.src_dir = os.path.join(output_dir, 'src')
         self.pages_dir = os.path.join(self.src_dir, 'pages')
@@ -36,6 +226,22 @@ class SiteReviser:
         self.static_dir = os.path.join(output_dir, 'static')
         self.img_dir = os.path.join(self.static_dir, 'img')
         
+        # Digests of files as left by earlier revisions, keyed by overview, content and task
+        self._revisions_path = os.path.join(output_dir, '.slim_cache', 'exact.json')
+        self._revisions = None
+        
+        # Digests of overview.md and the revised files after the last complete revision
+        self._overview_sidecar_path = os.path.join(output_dir, '.slim_cache', 'overview.sha')
+        
+        # overview.md split and parsed once per revision, see _cache_overview
+        self._overview_source = None
+        self._overview_frontmatter = {}
+        self._overview_body = ""
+        self._overview_parsed = (None, None, [])
+        
+        # Location of HomepageFeatures/index.js once discovered, see _find_homepage_features_index
+        self._homepage_features_index = None
+        
     def revise(self) -> bool:
         """
         Revise the site landing page content based on docs/overview.md using AI enhancement.
@@ -71,42 +277,89 @@ class SiteReviser:
             if not overview_content:
                 self.logger.warning("Could not read content from overview.md")
                 return False
+            self._cache_overview(overview_content)
+            
+            # Nothing to do if neither overview.md nor the revised files changed since the last revision
+            if not self._should_revise(overview_content):
+                self.logger.info("overview.md unchanged, skipping revise")
+                return True
             
             # Update landing page files using AI with overview.md as context
-            # Track overall success but continue even if some files fail
-            overall_success = True
+            # Track success but continue even if some files fail
+            files_success = True
+            figure_success = True
             
-            # Try updating each file independently to avoid one failure stopping the whole process
-            try:
-                if not self._update_index_js_with_ai(overview_content):
-                    overall_success = False
-            except Exception as e:
-                self.logger.error(f"Error updating index.js: {str(e)}")
-                overall_success = False
+            specs = self._update_specs()
             
-            try:
-                if not self._update_homepage_features_with_ai(overview_content):
-                    overall_success = False
-            except Exception as e:
-                self.logger.error(f"Error updating HomepageFeatures: {str(e)}")
-                overall_success = False
+            # Read the files up front so their updates can be sent to the AI in a single request
+            prepared = {}
+            up_to_date = set()
+            for task_id, spec in specs.items():
+                label = spec["label"]
+                try:
+                    update = spec["prepare"](overview_content)
+                    if not update:
+                        continue
+                    
+                    # Files already revised against this overview.md need neither a request nor a write
+                    if self.use_cache and self._revision_key(task_id, overview_content, update["current"]) in self._load_revisions():
+                        self.logger.info(f"Cache hit for {label}, skipping: already revised with this overview.md")
+                        up_to_date.add(task_id)
+                    else:
+                        prepared[task_id] = update
+                except Exception as e:
+                    self.logger.debug(f"Could not prepare {label} update: {str(e)}")
             
-            try:
-                if not self._update_docusaurus_config_with_ai(overview_content):
-                    overall_success = False
-            except Exception as e:
-                self.logger.error(f"Error updating docusaurus.config.js: {str(e)}")
-                overall_success = False
+            # The updates wait on network requests, so they run on a thread pool; the main figure
+            # doesn't depend on the files and is generated while they are updated
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                figure_future = executor.submit(self._update_main_figure_with_ai, overview_content)
                 
-            # NEW: Update the main project figure
-            try:
-                if not self._update_main_figure_with_ai(overview_content):
-                    overall_success = False
-            except Exception as e:
-                self.logger.error(f"Error updating main project figure: {str(e)}")
-                overall_success = False
+                results = self._enhance_updates_together(overview_content, prepared)
+                
+                # Try updating each file independently to avoid one failure stopping the whole process;
+                # files missing from the combined response are updated with their own request
+                futures = {}
+                for task_id, spec in specs.items():
+                    if task_id in up_to_date:
+                        continue
+                    if task_id in results:
+                        futures[task_id] = executor.submit(spec["apply"], prepared[task_id], results[task_id])
+                    else:
+                        futures[task_id] = executor.submit(
+                            self._ai_update_file, task_id, overview_content, prepared.get(task_id)
+                        )
+                
+                for task_id, spec in specs.items():
+                    if task_id not in futures:
+                        continue
+                    label = spec["label"]
+                    
+                    try:
+                        if not futures[task_id].result():
+                            files_success = False
+                        elif task_id in prepared:
+                            self._record_revision(task_id, overview_content, prepared[task_id]["path"])
+                    except Exception as e:
+                        self.logger.error(f"Error updating {label}: {str(e)}")
+                        files_success = False
+                
+                # NEW: Update the main project figure
+                try:
+                    if not figure_future.result():
+                        figure_success = False
+                except Exception as e:
+                    self.logger.error(f"Error updating main project figure: {str(e)}")
+                    figure_success = False
+            
+            if self.use_cache:
+                self._save_revisions()
+                
+                # A figure that can't be generated without an image generator isn't worth retrying
+                if files_success and (figure_success or self._generate_image is None):
+                    self._save_overview_sidecar(overview_content)
             
-            if overall_success:
+            if files_success and figure_success:
                 self.logger.info("Successfully revised site landing page content using AI with overview.md context")
                 return True
             else:
@@ -118,6 +371,202 @@ class SiteReviser:
             self.logger.error(f"Error revising site landing page: {str(e)}")
             return False
     
+    def _should_revise(self, overview_content: str) -> bool:
+        """
+        Check whether overview.md or any revised file changed since the last complete revision.
+        
+        Args:
+            overview_content: Content of overview.md
+            
+        Returns:
+            False if the sidecar matches overview.md and every revised file, True otherwise
+            or if caching is off
+        """
+        if not self.use_cache:
+            return True
+        
+        try:
+            with open(self._overview_sidecar_path, 'r', encoding='utf-8') as f:
+                sidecar = json.load(f)
+        except (OSError, ValueError):
+            return True
+        
+        if not isinstance(sidecar, dict):
+            return True
+        if sidecar.get("overview") != hashlib.blake2b(overview_content.encode('utf-8')).hexdigest():
+            return True
+        return sidecar.get("files") != self._output_digests()
+    
+    def _output_digests(self) -> Dict[str, Optional[str]]:
+        """
+        Get digests of the files the revision writes.
+        
+        Returns:
+            Digest of each file keyed by its path relative to the output directory,
+            None for files that don't exist
+        """
+        paths = [
+            os.path.join(self.pages_dir, 'index.js'),
+            self._find_homepage_features_index(warn=False),
+            os.path.join(self.output_dir, 'docusaurus.config.js'),
+            os.path.join(self.img_dir, '800x400.png')
+        ]
+        
+        digests = {}
+        for path in paths:
+            if not path:
+                continue
+            try:
+                with open(path, 'rb') as f:
+                    digest = hashlib.blake2b(f.read()).hexdigest()
+            except OSError:
+                digest = None
+            digests[os.path.relpath(path, self.output_dir)] = digest
+        return digests
+    
+    def _save_overview_sidecar(self, overview_content: str) -> None:
+        """
+        Record the digests of overview.md and the revised files after a complete revision.
+        
+        Args:
+            overview_content: Content of overview.md
+        """
+        sidecar = {
+            "overview": hashlib.blake2b(overview_content.encode('utf-8')).hexdigest(),
+            "files": self._output_digests()
+        }
+        
+        try:
+            os.makedirs(os.path.dirname(self._overview_sidecar_path), exist_ok=True)
+            self._write_text_atomic(self._overview_sidecar_path, json.dumps(sidecar))
+        except Exception as e:
+            self.logger.debug(f"Could not write overview sidecar: {str(e)}")
+    
+    def _revision_key(self, task_id: str, overview_content: str, current_content: str) -> str:
+        """
+        Get the key identifying a file's content revised against a given overview.md.
+        
+        Args:
+            task_id: ID of the file update
+            overview_content: Content of overview.md
+            current_content: Content of the file
+            
+        Returns:
+            Hex digest of the overview, the file content and the task ID
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(overview_content.encode('utf-8'))
+        digest.update(b'|')
+        digest.update(current_content.encode('utf-8'))
+        digest.update(b'|')
+        digest.update(task_id.encode('utf-8'))
+        return digest.hexdigest()
+    
+    def _load_revisions(self) -> Dict[str, str]:
+        """
+        Load the record of earlier revisions on first use.
+        
+        Returns:
+            Digests of revised file contents keyed by revision key
+        """
+        if self._revisions is None:
+            try:
+                with open(self._revisions_path, 'r', encoding='utf-8') as f:
+                    self._revisions = json.load(f)
+            except FileNotFoundError:
+                self._revisions = {}
+            except Exception as e:
+                self.logger.debug(f"Ignoring unreadable revision cache: {str(e)}")
+                self._revisions = {}
+        return self._revisions
+    
+    def _record_revision(self, task_id: str, overview_content: str, path: str) -> None:
+        """
+        Remember that a file has been revised against overview.md.
+        
+        Args:
+            task_id: ID of the file update
+            overview_content: Content of overview.md
+            path: Path of the revised file
+        """
+        try:
+            content = self._read_text(path)
+        except OSError:
+            return
+        
+        key = self._revision_key(task_id, overview_content, content)
+        self._load_revisions()[key] = hashlib.blake2b(content.encode('utf-8'), digest_size=20).hexdigest()
+    
+    def _save_revisions(self) -> None:
+        """
+        Write the record of revisions to disk.
+        """
+        if not self._revisions:
+            return
+        
+        try:
+            os.makedirs(os.path.dirname(self._revisions_path), exist_ok=True)
+            
+            # Write to a temporary file first so an interrupted run never leaves a partial record
+            tmp_path = f"{self._revisions_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._revisions, f)
+            os.replace(tmp_path, self._revisions_path)
+        except Exception as e:
+            self.logger.debug(f"Could not write revision cache: {str(e)}")
+    
+    def _read_text(self, path: str) -> str:
+        """
+        Read a UTF-8 text file, mapping it into memory when it is large.
+        
+        Args:
+            path: Path of the file
+            
+        Returns:
+            Content of the file
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            if os.fstat(f.fileno()).st_size <= _MMAP_THRESHOLD:
+                return f.read()
+            
+            # Decode straight from the mapping, translating newlines like text mode reads do
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return str(mapped, 'utf-8').replace('\r\n', '\n').replace('\r', '\n')
+    
+    def _write_text_atomic(self, path: str, content: str) -> None:
+        """
+        Write a UTF-8 text file so that readers never see it half-written.
+        
+        Args:
+            path: Path of the file
+            content: Content to write
+        """
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            if os.path.exists(path):
+                shutil.copymode(path, tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    
+    def _cache_overview(self, overview_content: str) -> None:
+        """
+        Split and parse overview.md, keeping the results on the instance for the update methods.
+        
+        Args:
+            overview_content: Content of overview.md
+        """
+        if self._overview_source is not None and self._overview_source == overview_content:
+            return
+        
+        self._overview_frontmatter, self._overview_body = extract_frontmatter(overview_content)
+        self._overview_parsed = _parse_overview(self._overview_body)
+        self._overview_source = overview_content
+    
     def _read_overview_content(self, overview_path: str) -> Optional[str]:
         """
         Read content from overview.md.
@@ -129,58 +578,188 @@ class SiteReviser:
             Content of overview.md or None if reading failed
         """
         try:
-            with open(overview_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Extract frontmatter and content
-            frontmatter, content_text = extract_frontmatter(content)
-            
             # Return full content including frontmatter for AI context
-            return content
+            return self._read_text(overview_path)
             
         except Exception as e:
             self.logger.error(f"Error reading content from overview.md: {str(e)}")
             return None
     
-    def _update_index_js_with_ai(self, overview_content: str) -> bool:
+    def _enhance_updates_together(self, overview_content: str, prepared: Dict[str, Dict]) -> Dict[str, str]:
         """
-        Update index.js using AI with overview.md as context.
+        Send several prepared file updates to the AI in a single request.
+        
+        overview.md is included once for all files instead of once per file.
         
         Args:
             overview_content: Content of overview.md
+            prepared: Prepared file updates keyed by task ID
             
         Returns:
-            True if update was successful, False otherwise
+            AI responses keyed by task ID; empty if the updates should be made one at a time
         """
-        index_js_path = os.path.join(self.pages_dir, 'index.js')
-        if not os.path.exists(index_js_path):
-            self.logger.warning(f"index.js not found at {index_js_path}")
-            return False
-            
-        try:
-            # Read current index.js
-            with open(index_js_path, 'r', encoding='utf-8') as f:
-                current_content = f.read()
-            
-            # Check if there's a reference to siteConfig (common issue)
-            uses_site_config = 'const { siteConfig }' in current_content or 'const {siteConfig}' in current_content
-            
-            # Check for imports to understand what's available
-            imports = ""
-            import_lines = re.findall(r'^import .+?;?$', current_content, re.MULTILINE)
-            if import_lines:
-                imports = "\n".join(import_lines)
+        if len(prepared) < 2 or not hasattr(self.ai_enhancer, 'enhance_tasks'):
+            return {}
+        
+        tasks = [
+            {"id": task_id, "instructions": f"{update['summary']}\n\n{update['details']}"}
+            for task_id, update in prepared.items()
+        ]
+        results = self.ai_enhancer.enhance_tasks(overview_content, tasks)
+        if not results:
+            self.logger.warning("Combined AI update failed. Updating landing page files one at a time.")
+            return {}
+        
+        return results
+    
+    def _build_prompt(self, shared: str, task_specific: str) -> str:
+        """
+        Build an AI prompt from overview.md and the instructions for one file.
+        
+        The overview comes first so that every file's prompt starts with the same text, which
+        providers can serve from their prompt cache.
+        
+        Args:
+            shared: Content of overview.md
+            task_specific: Instructions and current content of the file to update
             
-            # Create prompt for AI to update index.js content, with more guidance on React patterns
-            prompt = f"""
-Using the provided overview.md content as context, update ONLY the text content in this React component (index.js) while preserving its existing structure completely.
-
+        Returns:
+            Prompt for the AI enhancer
+        """
+        return f"""
 OVERVIEW.MD CONTENT (Use this as the source of information):
 ```
-{overview_content}
+{shared}
 ```
 
-CURRENT INDEX.JS IMPORTS:
+{task_specific}"""
+    
+    def _enhance_prompt(self, prompt: str, task_name: str, overview_content: str) -> Optional[str]:
+        """
+        Get the AI response to a prompt.
+        
+        The enhancer reuses its cached response while the prompt is exactly the same.
+        
+        Args:
+            prompt: Prompt for the AI enhancer
+            task_name: Name of the task, passed to the enhancer
+            overview_content: Content of overview.md the prompt is built from
+            
+        Returns:
+            AI response, or None if the request failed
+        """
+        response = self.ai_enhancer.enhance(
+            prompt,
+            task_name,
+            prompt_cache_key=self._prompt_cache_key(overview_content)
+        )
+        # The enhancer returns its input unchanged when the request fails
+        return response if response != prompt else None
+    
+    def _prompt_cache_key(self, overview_content: str) -> str:
+        """
+        Get the provider prompt cache key for requests that start with overview.md.
+        
+        Args:
+            overview_content: Content of overview.md
+            
+        Returns:
+            Key derived from a digest of the overview
+        """
+        digest = hashlib.blake2b(overview_content.encode('utf-8'), digest_size=16).hexdigest()
+        return f"slim-overview-{digest}"
+    
+    def _update_specs(self) -> Dict[str, Dict]:
+        """
+        Describe how each landing page file is updated.
+        
+        Returns:
+            Update specs keyed by task ID, each with the file's label, the function preparing its
+            update, the function applying the AI's response, and an optional fallback
+        """
+        return {
+            "index_js": {
+                "label": "index.js",
+                "prepare": self._prepare_index_js_update,
+                "apply": self._apply_index_js_update,
+                # Do a more targeted update if the full update fails
+                "fallback": lambda overview_content: self._update_index_js_text_only(
+                    overview_content, os.path.join(self.pages_dir, 'index.js')
+                )
+            },
+            "homepage_features": {
+                "label": "HomepageFeatures",
+                "prepare": self._prepare_homepage_features_update,
+                "apply": self._apply_homepage_features_update
+            },
+            "docusaurus_config": {
+                "label": "docusaurus.config.js",
+                "prepare": self._prepare_docusaurus_config_update,
+                "apply": self._apply_docusaurus_config_update
+            }
+        }
+    
+    def _ai_update_file(self, task_id: str, overview_content: str, update: Optional[Dict] = None) -> bool:
+        """
+        Update a landing page file using AI with overview.md as context.
+        
+        Args:
+            task_id: ID of the file update in _update_specs
+            overview_content: Content of overview.md
+            update: Update already prepared from the spec, prepared here if not given
+            
+        Returns:
+            True if update was successful, False otherwise
+        """
+        spec = self._update_specs()[task_id]
+        label = spec["label"]
+        try:
+            if update is None:
+                update = spec["prepare"](overview_content)
+            if not update:
+                self.logger.warning(f"{label} not found in {self.output_dir}")
+                return False
+            
+            prompt = self._build_prompt(overview_content, f"{update['summary']}\n\n{update['details']}")
+            task_name = f"{task_id}_update"
+            
+            # Use AI to update the content
+            self.logger.info(f"Enhancing {task_name} content with AI")
+            updated_content = self._enhance_prompt(prompt, task_name, overview_content)
+            
+            return spec["apply"](update, updated_content)
+            
+        except Exception as e:
+            self.logger.error(f"Error updating {label}: {str(e)}")
+            if spec.get("fallback"):
+                return spec["fallback"](overview_content)
+            return False
+    
+    def _prepare_index_js_update(self, overview_content: str) -> Optional[Dict]:
+        """
+        Read index.js and build the instructions for updating it.
+        
+        Args:
+            overview_content: Content of overview.md
+            
+        Returns:
+            Prepared update, or None if index.js doesn't exist
+        """
+        index_js_path = os.path.join(self.pages_dir, 'index.js')
+        if not os.path.exists(index_js_path):
+            return None
+        
+        # Read current index.js
+        current_content = self._read_text(index_js_path)
+        
+        # Check for imports to understand what's available
+        imports = ""
+        import_lines = _IMPORT_LINE_RE.findall(current_content)
+        if import_lines:
+            imports = "\n".join(import_lines)
+        
+        # Instructions for AI to update index.js content, with more guidance on React patterns
+        details = f"""CURRENT INDEX.JS IMPORTS:
 ```
 {imports}
 ```
@@ -206,45 +785,60 @@ Any structural changes could break the component.
 
 Return ONLY the complete, updated index.js code.
 """
+        
+        return {
+            "path": index_js_path,
+            "current": current_content,
+            "summary": "Using the provided overview.md content as context, update ONLY the text content in this React component (index.js) while preserving its existing structure completely.",
+            "details": details
+        }
+    
+    def _apply_index_js_update(self, update: Dict, updated_content: Optional[str]) -> bool:
+        """
+        Validate the AI's updated index.js and write it.
+        
+        Args:
+            update: Prepared update from _prepare_index_js_update
+            updated_content: Updated index.js returned by the AI
             
-            # Use AI to update the content
-            self.logger.info("Enhancing index_js_update content with AI")
-            updated_content = self.ai_enhancer.enhance(prompt, "index_js_update")
+        Returns:
+            True if update was successful, False otherwise
+        """
+        current_content = update["current"]
+        
+        # Check if there's a reference to siteConfig (common issue)
+        uses_site_config = _SITECFG_RE.search(current_content) is not None
+        import_lines = set(_IMPORT_LINE_RE.findall(current_content))
+        
+        if updated_content:
+            # Remove any markdown code blocks
+            updated_content = self._extract_code_block(updated_content, "javascript")
             
-            if updated_content:
-                # Remove any markdown code blocks
-                updated_content = self._extract_code_block(updated_content, "javascript")
-                
-                # Verify that we haven't broken the siteConfig reference if it exists
-                if uses_site_config and 'const { siteConfig }' not in updated_content and 'const {siteConfig}' not in updated_content:
-                    self.logger.warning("AI removed siteConfig reference - reverting to original index.js")
-                    return False
-                
-                # Safety check: make sure we have the same imports
-                if import_lines:
-                    for import_line in import_lines:
-                        if import_line not in updated_content:
-                            self.logger.warning(f"AI removed import - reverting to safe content: {import_line}")
-                            return False
-                
-                # Only write if the content changed
-                if updated_content != current_content:
-                    with open(index_js_path, 'w', encoding='utf-8') as f:
-                        f.write(updated_content)
-                    
-                    self.logger.info("Updated index.js content using AI with overview.md context")
-                else:
-                    self.logger.info("No changes needed for index.js")
+            # Verify that we haven't broken the siteConfig reference if it exists
+            if uses_site_config and not _SITECFG_RE.search(updated_content):
+                self.logger.warning("AI removed siteConfig reference - reverting to original index.js")
+                return False
+            
+            # Safety check: make sure we have the same imports
+            missing_imports = import_lines.difference(_IMPORT_LINE_RE.findall(updated_content))
+            if missing_imports:
+                self.logger.warning(
+                    f"AI removed imports - reverting to safe content: {', '.join(sorted(missing_imports))}"
+                )
+                return False
+            
+            # Only write if the content changed
+            if updated_content != current_content:
+                self._write_text_atomic(update["path"], updated_content)
                 
-                return True
+                self.logger.info("Updated index.js content using AI with overview.md context")
             else:
-                self.logger.warning("AI failed to generate updated index.js content")
-                return False
+                self.logger.info("No changes needed for index.js")
             
-        except Exception as e:
-            self.logger.error(f"Error updating index.js: {str(e)}")
-            # Do a more targeted update as a fallback
-            return self._update_index_js_text_only(overview_content, index_js_path)
+            return True
+        else:
+            self.logger.warning("AI failed to generate updated index.js content")
+            return False
     
     def _update_index_js_text_only(self, overview_content: str, index_js_path: str) -> bool:
         """
@@ -260,23 +854,15 @@ Return ONLY the complete, updated index.js code.
         try:
             self.logger.info("Using fallback method to update index.js with text-only changes")
             
-            with open(index_js_path, 'r', encoding='utf-8') as f:
-                current_content = f.read()
+            current_content = self._read_text(index_js_path)
             
             # Extract title and description from overview.md
-            frontmatter, content_text = extract_frontmatter(overview_content)
-            
-            title = frontmatter.get("title", "")
-            if not title:
-                # Try to find title from first heading
-                title_match = re.search(r'^#\s+(.+)$', content_text, re.MULTILINE)
-                if title_match:
-                    title = title_match.group(1).strip()
+            self._cache_overview(overview_content)
+            heading, description, _ = self._overview_parsed
             
-            description = ""
-            desc_match = re.search(r'^(?!#|\s*-)[^\n]+', content_text, re.MULTILINE)
-            if desc_match:
-                description = desc_match.group(0).strip()
+            # Fall back to the first heading when there is no frontmatter title
+            title = self._overview_frontmatter.get("title", "") or heading or ""
+            description = description or ""
             
             # Only proceed if we extracted some content
             if not title and not description:
@@ -316,63 +902,84 @@ ONLY list the exact text strings that should be replaced, not the entire compone
             self.logger.error(f"Error in fallback index.js update: {str(e)}")
             return False
     
-    def _update_homepage_features_with_ai(self, overview_content: str) -> bool:
+    def _find_homepage_features_index(self, warn: bool = True) -> Optional[str]:
         """
-        Update HomepageFeatures component using AI with overview.md as context.
+        Find the index.js file of the HomepageFeatures component.
         
         Args:
-            overview_content: Content of overview.md
+            warn: Whether to log a warning if it can't be found
             
         Returns:
-            True if update was successful, False otherwise
+            Path to HomepageFeatures/index.js, or None if it doesn't exist
         """
-        # Find the HomepageFeatures directory
+        # Reuse the path found by an earlier call while it still exists
+        if self._homepage_features_index and os.path.isfile(self._homepage_features_index):
+            return self._homepage_features_index
+        
+        # Find the HomepageFeatures directory, trying the default name before scanning the components
         homepage_features_dir = os.path.join(self.components_dir, 'HomepageFeatures')
-        features_found = False
-        
-        # If not found in the default location, search for it
-        if not os.path.exists(homepage_features_dir):
-            for root, dirs, _ in os.walk(self.components_dir):
-                for dir_name in dirs:
-                    if dir_name.lower() == 'homepagefeatures':
-                        homepage_features_dir = os.path.join(root, dir_name)
-                        features_found = True
-                        break
-                if features_found:
-                    break
-        else:
-            features_found = True
+        if not os.path.isdir(homepage_features_dir):
+            try:
+                with os.scandir(self.components_dir) as entries:
+                    homepage_features_dir = next(
+                        (entry.path for entry in entries
+                         if entry.name.lower() == 'homepagefeatures' and entry.is_dir()),
+                        None
+                    )
+            except OSError:
+                homepage_features_dir = None
         
-        if not features_found:
-            self.logger.warning("HomepageFeatures component not found")
-            return False
+        if not homepage_features_dir:
+            if warn:
+                self.logger.warning("HomepageFeatures component not found")
+            return None
         
         # Find the index.js file
-        index_js_path = None
-        for file in os.listdir(homepage_features_dir):
-            if file.lower() == 'index.js':
-                index_js_path = os.path.join(homepage_features_dir, file)
-                break
+        index_js_path = os.path.join(homepage_features_dir, 'index.js')
+        if not os.path.isfile(index_js_path):
+            with os.scandir(homepage_features_dir) as entries:
+                index_js_path = next(
+                    (entry.path for entry in entries if entry.name.lower() == 'index.js'),
+                    None
+                )
         
         if not index_js_path:
-            self.logger.warning("HomepageFeatures/index.js not found")
-            return False
+            if warn:
+                self.logger.warning("HomepageFeatures/index.js not found")
+            return None
         
-        try:
-            # Read current HomepageFeatures component
-            with open(index_js_path, 'r', encoding='utf-8') as f:
-                current_content = f.read()
+        self._homepage_features_index = index_js_path
+        return index_js_path
+    
+    def _prepare_homepage_features_update(self, overview_content: str) -> Optional[Dict]:
+        """
+        Read the HomepageFeatures component and build the instructions for updating it.
+        
+        Args:
+            overview_content: Content of overview.md
             
-            # Create prompt for AI to update HomepageFeatures content
-            prompt = f"""
-Using the provided overview.md content as context, update ONLY the feature descriptions in this React component (HomepageFeatures/index.js) while preserving its structure.
-
-OVERVIEW.MD CONTENT (Use this as the source of information):
-```
-{overview_content}
-```
-
-CURRENT COMPONENT:
+        Returns:
+            Prepared update, or None if the component doesn't exist
+        """
+        index_js_path = self._find_homepage_features_index(warn=False)
+        if not index_js_path:
+            return None
+        
+        # Read current HomepageFeatures component
+        current_content = self._read_text(index_js_path)
+        summary = "Using the provided overview.md content as context, update ONLY the feature descriptions in this React component (HomepageFeatures/index.js) while preserving its structure."
+        
+        # Send only the FeatureList array when there is one
+        regions = _extract_editable_regions(current_content, ("FeatureList",))
+        if regions:
+            return self._prepare_region_update(index_js_path, current_content, summary, regions, """1. FeatureList holds the JavaScript code of the items in the component's FeatureList array
+2. Update ONLY the feature titles and descriptions based on the Features section in overview.md
+3. DO NOT change the item structure, keys, images (Svg), JSX tags, or className values
+4. DO NOT add or remove features - only update existing ones
+5. If overview.md doesn't have relevant content for features, leave them unchanged""")
+        
+        # Instructions for AI to update HomepageFeatures content
+        details = f"""CURRENT COMPONENT:
 ```
 {current_content}
 ```
@@ -389,63 +996,72 @@ INSTRUCTIONS:
 
 Return ONLY the updated component code.
 """
+        
+        return {
+            "path": index_js_path,
+            "current": current_content,
+            "summary": summary,
+            "details": details
+        }
+    
+    def _apply_homepage_features_update(self, update: Dict, updated_content: Optional[str]) -> bool:
+        """
+        Write the AI's updated HomepageFeatures component.
+        
+        Args:
+            update: Prepared update from _prepare_homepage_features_update
+            updated_content: Updated component returned by the AI
             
-            # Use AI to update the content
-            self.logger.info("Enhancing homepage_features_update content with AI")
-            updated_content = self.ai_enhancer.enhance(prompt, "homepage_features_update")
-            
-            if updated_content:
-                # Remove any markdown code blocks
-                updated_content = self._extract_code_block(updated_content, "javascript")
-                
-                # Only write if the content changed
-                if updated_content != current_content:
-                    with open(index_js_path, 'w', encoding='utf-8') as f:
-                        f.write(updated_content)
-                    
-                    self.logger.info("Updated HomepageFeatures content using AI with overview.md context")
-                else:
-                    self.logger.info("No changes needed for HomepageFeatures")
+        Returns:
+            True if update was successful, False otherwise
+        """
+        if updated_content and update.get("regions"):
+            updated_content = self._apply_region_values(update, updated_content)
+        elif updated_content:
+            # Remove any markdown code blocks
+            updated_content = self._extract_code_block(updated_content, "javascript")
+        
+        if updated_content:
+            # Only write if the content changed
+            if updated_content != update["current"]:
+                self._write_text_atomic(update["path"], updated_content)
                 
-                return True
+                self.logger.info("Updated HomepageFeatures content using AI with overview.md context")
             else:
-                self.logger.warning("AI failed to generate updated HomepageFeatures content")
-                return False
+                self.logger.info("No changes needed for HomepageFeatures")
             
-        except Exception as e:
-            self.logger.error(f"Error updating HomepageFeatures: {str(e)}")
+            return True
+        else:
+            self.logger.warning("AI failed to generate updated HomepageFeatures content")
             return False
     
-    def _update_docusaurus_config_with_ai(self, overview_content: str) -> bool:
+    def _prepare_docusaurus_config_update(self, overview_content: str) -> Optional[Dict]:
         """
-        Update docusaurus.config.js using AI with overview.md as context.
+        Read docusaurus.config.js and build the instructions for updating it.
         
         Args:
             overview_content: Content of overview.md
             
         Returns:
-            True if update was successful, False otherwise
+            Prepared update, or None if docusaurus.config.js doesn't exist
         """
         config_path = os.path.join(self.output_dir, 'docusaurus.config.js')
         if not os.path.exists(config_path):
-            self.logger.warning(f"docusaurus.config.js not found at {config_path}")
-            return False
+            return None
         
-        try:
-            # Read current config
-            with open(config_path, 'r', encoding='utf-8') as f:
-                current_config = f.read()
-            
-            # Create prompt for AI to update docusaurus.config.js content
-            prompt = f"""
-Using the provided overview.md content as context, update ONLY the title and tagline in this docusaurus.config.js file.
-
-OVERVIEW.MD CONTENT (Use this as the source of information):
-```
-{overview_content}
-```
-
-CURRENT CONFIG:
+        # Read current config
+        current_config = self._read_text(config_path)
+        summary = "Using the provided overview.md content as context, update ONLY the title and tagline in this docusaurus.config.js file."
+        
+        # Send only the title and tagline when both can be found
+        regions = _extract_editable_regions(current_config, ("title", "tagline"))
+        if len(regions) == 2:
+            return self._prepare_region_update(config_path, current_config, summary, regions, """1. The title should be based on the main heading or title from overview.md
+2. The tagline should be based on the first paragraph or description from overview.md
+3. Keep both short plain text without markup""")
+        
+        # Instructions for AI to update docusaurus.config.js content
+        details = f"""CURRENT CONFIG:
 ```
 {current_config}
 ```
@@ -462,33 +1078,108 @@ INSTRUCTIONS:
 
 Return ONLY the updated configuration code.
 """
+        
+        return {
+            "path": config_path,
+            "current": current_config,
+            "summary": summary,
+            "details": details
+        }
+    
+    def _apply_docusaurus_config_update(self, update: Dict, updated_config: Optional[str]) -> bool:
+        """
+        Write the AI's updated docusaurus.config.js.
+        
+        Args:
+            update: Prepared update from _prepare_docusaurus_config_update
+            updated_config: Updated configuration returned by the AI
             
-            # Use AI to update the content
-            self.logger.info("Enhancing docusaurus_config_update content with AI")
-            updated_config = self.ai_enhancer.enhance(prompt, "docusaurus_config_update")
-            
-            if updated_config:
-                # Remove any markdown code blocks
-                updated_config = self._extract_code_block(updated_config, "javascript")
-                
-                # Only write if the content changed
-                if updated_config != current_config:
-                    with open(config_path, 'w', encoding='utf-8') as f:
-                        f.write(updated_config)
-                    
-                    self.logger.info("Updated docusaurus.config.js content using AI with overview.md context")
-                else:
-                    self.logger.info("No changes needed for docusaurus.config.js")
+        Returns:
+            True if update was successful, False otherwise
+        """
+        if updated_config and update.get("regions"):
+            updated_config = self._apply_region_values(update, updated_config)
+        elif updated_config:
+            # Remove any markdown code blocks
+            updated_config = self._extract_code_block(updated_config, "javascript")
+        
+        if updated_config:
+            # Only write if the content changed
+            if updated_config != update["current"]:
+                self._write_text_atomic(update["path"], updated_config)
                 
-                return True
+                self.logger.info("Updated docusaurus.config.js content using AI with overview.md context")
             else:
-                self.logger.warning("AI failed to generate updated docusaurus.config.js content")
-                return False
+                self.logger.info("No changes needed for docusaurus.config.js")
             
-        except Exception as e:
-            self.logger.error(f"Error updating docusaurus.config.js: {str(e)}")
+            return True
+        else:
+            self.logger.warning("AI failed to generate updated docusaurus.config.js content")
             return False
     
+    def _prepare_region_update(self, path: str, current_content: str, summary: str,
+                               regions: Dict[str, str], instructions: str) -> Dict:
+        """
+        Build an update that sends only the editable regions of a file instead of all of it.
+        
+        Args:
+            path: Path of the file
+            current_content: Current content of the file
+            summary: Summary of the update
+            regions: Current text of the editable regions, keyed by region name
+            instructions: Numbered instructions for updating the regions
+            
+        Returns:
+            Prepared update whose response is a JSON map of new region values
+        """
+        details = f"""CURRENT VALUES:
+```json
+{json.dumps(regions, ensure_ascii=False, indent=2)}
+```
+
+INSTRUCTIONS:
+{instructions}
+
+Return ONLY a JSON object with the same keys, mapping each key to its updated value.
+"""
+        
+        return {
+            "path": path,
+            "current": current_content,
+            "summary": summary,
+            "details": details,
+            "regions": regions
+        }
+    
+    def _apply_region_values(self, update: Dict, response: str) -> Optional[str]:
+        """
+        Splice the AI's new region values into the current content of a file.
+        
+        Args:
+            update: Prepared update from _prepare_region_update
+            response: JSON map of new region values returned by the AI
+            
+        Returns:
+            Updated file content, or None if the response has no usable values
+        """
+        try:
+            values = json.loads(self._extract_code_block(response, "json"))
+        except ValueError:
+            self.logger.warning(f"AI response for {os.path.relpath(update['path'], self.output_dir)} is not valid JSON")
+            return None
+        
+        if not isinstance(values, dict):
+            return None
+        
+        replacements = {
+            name: value for name, value in values.items()
+            if name in update["regions"] and isinstance(value, str) and value.strip()
+        }
+        if not replacements:
+            return None
+        
+        return _splice_editable_regions(update["current"], replacements)
+    
     def _update_main_figure_with_ai(self, overview_content: str) -> bool:
         """
         Update the main project figure (800x400.png) using AI with overview.md as context.
@@ -514,26 +1205,13 @@ Return ONLY the updated configuration code.
         
         try:
             # Extract key information from overview.md to guide image generation
-            frontmatter, content_text = extract_frontmatter(overview_content)
-            
-            # Extract title, description, and features for image context
-            title = frontmatter.get("title", "")
+            self._cache_overview(overview_content)
             
-            if not title:
-                # Try to find title from first heading
-                title_match = re.search(r'^#\s+(.+)$', content_text, re.MULTILINE)
-                if title_match:
-                    title = title_match.group(1).strip()
-            
-            # Extract first paragraph as description
-            description = ""
-            desc_match = re.search(r'^(?!#|\s*-)[^\n]+', content_text, re.MULTILINE)
-            if desc_match:
-                description = desc_match.group(0).strip()
-            
-            # Extract any features or key points (bullet points)
-            features = re.findall(r'^\s*-\s+(.+)$', content_text, re.MULTILINE)
-            features_text = "\n".join([f"- {feature}" for feature in features[:5]])  # Limit to first 5 features
+            # Extract title, description, and features (bullet points) for image context
+            heading, description, features = self._overview_parsed
+            title = self._overview_frontmatter.get("title", "") or heading or ""
+            description = description or ""
+            features_text = "\n".join([f"- {feature}" for feature in features])
             
             # Check if we need to update the image
             needs_update = not os.path.exists(target_image_path)
@@ -608,15 +1286,16 @@ Please create a diagram or conceptual illustration that visually represents what
             # This is a placeholder. You'll need to replace this with your actual image generation logic.
             # If your AI enhancer doesn't support image generation, you might need to use a separate service.
             
-            # Example implementation if your AI enhancer has an image generation method:
-            if hasattr(self.ai_enhancer, 'generate_image'):
-                image_bytes = self.ai_enhancer.generate_image(prompt, "main_figure_generation")
-                return image_bytes
+            # Use the AI enhancer's image generation method if it has one
+            if self._generate_image is not None:
+                return self._generate_image(prompt, "main_figure_generation")
             
             # Alternative: Use a dedicated image generation API
             # This depends on what image generation service you're using
             # Example with a hypothetical API:
             """
+            import requests
+            
             response = requests.post(
                 "https://api.imagegeneration.com/generate",
                 json={
@@ -632,8 +1311,8 @@ Please create a diagram or conceptual illustration that visually represents what
                 return response.content
             """
             
-            # If no implementation is available, log a warning
-            self.logger.warning("Image generation with AI is not implemented")
+            # No implementation is available
+            self.logger.debug("Image generation with AI is not implemented")
             return None
             
         except Exception as e:
@@ -645,27 +1324,26 @@ Please create a diagram or conceptual illustration that visually represents what
         Save image data to the specified path.
         
         Args:
-            image_data: Image data in bytes
+            image_data: Image data in bytes, or a base64 data URL
             path: Path to save the image
             
         Returns:
             True if saving was successful, False otherwise
         """
         try:
-            # Check if the image_data is base64 encoded
-            try:
-                if isinstance(image_data, str) and image_data.startswith('data:image'):
-                    # Extract the base64 part
-                    image_data = image_data.split(',')[1]
-                    # Decode base64 to bytes
-                    image_data = base64.b64decode(image_data)
-            except:
-                # Not base64 or already bytes, continue
-                pass
+            if isinstance(image_data, (bytes, bytearray, memoryview)):
+                data = image_data
+            elif isinstance(image_data, str) and image_data.startswith('data:image'):
+                import base64
                 
+                # Decode the base64 part of the data URL
+                data = base64.b64decode(image_data.split(',', 1)[1])
+            else:
+                raise TypeError(f"Unsupported image data type: {type(image_data).__name__}")
+            
             # Save the image
             with open(path, 'wb') as f:
-                f.write(image_data)
+                f.write(data)
             
             return True
             
@@ -684,28 +1362,4 @@ Please create a diagram or conceptual illustration that visually represents what
         Returns:
             Clean code without markdown formatting
         """
-        # Check if the content is already wrapped in a markdown code block
-        code_block_pattern = rf"```(?:{language})?\n(.*?)```"
-        code_match = re.search(code_block_pattern, content, re.DOTALL)
-        
-        if code_match:
-            # Extract just the code from the markdown code block
-            return code_match.group(1).strip()
-        
-        # If not in a code block, try to identify and remove any explanatory text
-        # This is a heuristic approach to find where the code starts
-        
-        # Look for common import statements at the start of JS files
-        if language == "javascript":
-            import_match = re.search(r'^(?:import|const|let|var|function|class|\/\*\*)', content, re.MULTILINE)
-            if import_match:
-                return content[import_match.start():].strip()
-        
-        # Look for CSS starting patterns
-        if language == "css":
-            css_match = re.search(r'^(?:\.|\/\*|\*|#|@media|:root)', content, re.MULTILINE)
-            if css_match:
-                return content[css_match.start():].strip()
-        
-        # If we couldn't identify a clear pattern, just return the content as is
-        return content.strip()
\ No newline at end of file
+        return _extract_code_block_cached(content, language)
\ No newline at end of file
@@ -0,0 +1,106 @@
+"""
+Tests for the AI enhancer.
+"""
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from slim_doc_generator.enhancer.ai_enhancer import AIEnhancer
+
+
+class TestAIEnhancer(unittest.TestCase):
+    """Test cases for the AIEnhancer class."""
+    
+    def setUp(self):
+        """Set up an enhancer with an isolated response cache and no provider SDK."""
+        self.cache_home = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_home)
+        
+        env_patch = patch.dict(os.environ, {"XDG_CACHE_HOME": self.cache_home})
+        env_patch.start()
+        self.addCleanup(env_patch.stop)
+        
+        with patch.object(AIEnhancer, "_import_sdk", return_value=(None, None)):
+            self.enhancer = AIEnhancer("openai/test-model", logging.getLogger("test"))
+    
+    def test_enhance_tasks_does_not_cache_invalid_response(self):
+        """Test that a non-JSON response is neither returned nor reused on the next request."""
+        tasks = [{"id": "title", "instructions": "Write a title"}]
+        
+        with patch.object(AIEnhancer, "_enhance_with_openai", return_value="Sure, here is the title!") as mock_request:
+            self.assertIsNone(self.enhancer.enhance_tasks("Overview", tasks))
+            mock_request.assert_called_once()
+        
+        with patch.object(AIEnhancer, "_enhance_with_openai", return_value='{"title": "New Title"}') as mock_request:
+            self.assertEqual(self.enhancer.enhance_tasks("Overview", tasks), {"title": "New Title"})
+            mock_request.assert_called_once()
+        
+        # The valid response is cached now
+        with patch.object(AIEnhancer, "_enhance_with_openai") as mock_request:
+            self.assertEqual(self.enhancer.enhance_tasks("Overview", tasks), {"title": "New Title"})
+            mock_request.assert_not_called()
+
+    
+    def test_disabled_cache_is_bypassed(self):
+        """Test that an enhancer created without caching always asks the provider."""
+        with patch.object(AIEnhancer, "_import_sdk", return_value=(None, None)):
+            enhancer = AIEnhancer("openai/test-model", logging.getLogger("test"), use_cache=False)
+        
+        with patch.object(AIEnhancer, "_enhance_with_openai", return_value="Enhanced") as mock_request:
+            self.assertEqual(enhancer.enhance("Content", "overview"), "Enhanced")
+            self.assertEqual(enhancer.enhance("Content", "overview"), "Enhanced")
+            self.assertEqual(mock_request.call_count, 2)
+        
+        self.assertFalse(os.path.exists(os.path.join(self.cache_home, "slim-doc-generator", "ai")))
+    
+    def test_expired_response_is_not_reused(self):
+        """Test that cached responses past their lifetime are requested again."""
+        with patch.object(AIEnhancer, "_enhance_with_openai", return_value="Enhanced") as mock_request:
+            self.enhancer.enhance("Content", "overview")
+            
+            # Age every cache entry past the cache lifetime
+            cache_dir = os.path.join(self.cache_home, "slim-doc-generator", "ai")
+            for name in os.listdir(cache_dir):
+                os.utime(os.path.join(cache_dir, name), (0, 0))
+            
+            self.enhancer.enhance("Content", "overview")
+            self.assertEqual(mock_request.call_count, 2)
+
+    
+    def test_client_is_created_once_under_concurrency(self):
+        """Test that concurrent first requests share a single client."""
+        def create_client():
+            time.sleep(0.01)
+            return object()
+        
+        with patch.object(AIEnhancer, "_create_client", side_effect=create_client) as mock_create:
+            threads = [threading.Thread(target=self.enhancer._get_client) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        
+        mock_create.assert_called_once()
+
+    
+    def test_batch_timeout_cancels_job_and_falls_back(self):
+        """Test that a batch job still running at the timeout is cancelled and enhanced directly."""
+        client = MagicMock()
+        client.batches.create.return_value = MagicMock(id="batch_1", status="in_progress")
+        
+        with patch.object(AIEnhancer, "_get_client", return_value=client), \
+                patch.object(AIEnhancer, "enhance_all", return_value={"overview": "Enhanced"}) as mock_enhance_all:
+            result = self.enhancer.enhance_batch([("overview", "Content")], timeout=0)
+        
+        client.batches.cancel.assert_called_once_with("batch_1")
+        mock_enhance_all.assert_called_once_with({"overview": "Content"})
+        self.assertEqual(result, {"overview": "Enhanced"})
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
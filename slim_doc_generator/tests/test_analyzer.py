@@ -13,28 +13,30 @@ from slim_doc_generator.analyzer.repo_analyzer import RepoAnalyzer
 class TestRepoAnalyzer(unittest.TestCase):
     """Test cases for the RepoAnalyzer class."""
     
-    def setUp(self):
-        """Set up test environment."""
-        self.test_dir = tempfile.mkdtemp()
-        self.logger = logging.getLogger("test")
+    @classmethod
+    def setUpClass(cls):
+        """Set up the test repository shared by all tests."""
+        cls.test_dir = tempfile.mkdtemp()
+        cls.logger = logging.getLogger("test")
         
         # Create test files
-        os.makedirs(os.path.join(self.test_dir, "src"))
-        os.makedirs(os.path.join(self.test_dir, "docs"))
-        os.makedirs(os.path.join(self.test_dir, "tests"))
+        os.makedirs(os.path.join(cls.test_dir, "src"))
+        os.makedirs(os.path.join(cls.test_dir, "docs"))
+        os.makedirs(os.path.join(cls.test_dir, "tests"))
         
-        with open(os.path.join(self.test_dir, "README.md"), "w") as f:
+        with open(os.path.join(cls.test_dir, "README.md"), "w") as f:
             f.write("# Test Project\n\nThis is a test project.")
         
-        with open(os.path.join(self.test_dir, "src", "main.py"), "w") as f:
+        with open(os.path.join(cls.test_dir, "src", "main.py"), "w") as f:
             f.write("# Test Python file")
         
-        self.analyzer = RepoAnalyzer(self.test_dir, self.logger)
+        cls.analyzer = RepoAnalyzer(cls.test_dir, cls.logger)
     
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up test environment."""
         import shutil
-        shutil.rmtree(self.test_dir)
+        shutil.rmtree(cls.test_dir)
     
     def test_initialization(self):
         """Test analyzer initialization."""
@@ -74,9 +76,11 @@ class TestRepoAnalyzer(unittest.TestCase):
     @patch("slim_doc_generator.analyzer.content_extractor.extract_from_package_json")
     def test_package_json_extraction(self, mock_extract):
         """Test package.json extraction."""
-        # Create package.json
-        with open(os.path.join(self.test_dir, "package.json"), "w") as f:
+        # Create package.json, removing it again so the other tests see the shared repository unchanged
+        package_json_path = os.path.join(self.test_dir, "package.json")
+        with open(package_json_path, "w") as f:
             f.write('{"name": "test-project", "description": "Test description"}')
+        self.addCleanup(os.remove, package_json_path)
         
         self.analyzer.analyze()
         
@@ -87,8 +91,10 @@ class TestRepoAnalyzer(unittest.TestCase):
     def test_setup_py_extraction(self, mock_extract):
         """Test setup.py extraction."""
         # Create setup.py
-        with open(os.path.join(self.test_dir, "setup.py"), "w") as f:
+        setup_py_path = os.path.join(self.test_dir, "setup.py")
+        with open(setup_py_path, "w") as f:
             f.write('# Test setup.py')
+        self.addCleanup(os.remove, setup_py_path)
         
         self.analyzer.analyze()
         
@@ -99,11 +105,13 @@ class TestRepoAnalyzer(unittest.TestCase):
     def test_git_info_extraction(self, mock_extract):
         """Test git info extraction."""
         # Create .git directory to simulate git repo
-        os.makedirs(os.path.join(self.test_dir, ".git"))
+        git_dir = os.path.join(self.test_dir, ".git")
+        os.makedirs(git_dir)
+        self.addCleanup(os.rmdir, git_dir)
         
-        # Reinitialize analyzer to detect git repo
-        self.analyzer = RepoAnalyzer(self.test_dir, self.logger)
-        self.analyzer.analyze()
+        # Use a new analyzer to detect git repo
+        analyzer = RepoAnalyzer(self.test_dir, self.logger)
+        analyzer.analyze()
         
         # Check if extraction function was called
         mock_extract.assert_called_once()
@@ -0,0 +1,173 @@
+"""
+Tests for the API documentation generator.
+"""
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from slim_doc_generator.content import api_generator
+from slim_doc_generator.content.api_generator import ApiGenerator
+
+
+class TestApiGenerator(unittest.TestCase):
+    """Test cases for the ApiGenerator class."""
+    
+    def setUp(self):
+        """Set up an empty repository and an isolated cache directory."""
+        self.repo_dir = tempfile.mkdtemp()
+        self.cache_home = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.repo_dir)
+        self.addCleanup(shutil.rmtree, self.cache_home)
+        os.makedirs(os.path.join(self.repo_dir, "src"))
+        
+        # Keep the per-file element cache out of the user's cache directory
+        env_patch = patch.dict(os.environ, {"XDG_CACHE_HOME": self.cache_home})
+        env_patch.start()
+        self.addCleanup(env_patch.stop)
+        
+        self.logger = logging.getLogger("test")
+    
+    def _write(self, path, content):
+        """Write a file in the test repository."""
+        with open(os.path.join(self.repo_dir, path), "w") as f:
+            f.write(content)
+    
+    def _git(self, *args):
+        """Run a git command in the test repository."""
+        subprocess.check_call(
+            ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", "-C", self.repo_dir] + list(args),
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+    
+    @unittest.skipUnless(shutil.which("git"), "git is not installed")
+    def test_page_cache_sees_repeated_uncommitted_edits(self):
+        """Test that editing an already modified file invalidates the cached page."""
+        # Outside the repository, so writing the page cache doesn't change git's status
+        cache_dir = os.path.join(self.cache_home, "pages")
+        repo_info = {"src_dirs": ["src"]}
+        
+        self._git("init", "-q")
+        self._write(os.path.join("src", "module.py"), "def alpha():\n    pass\n")
+        self._git("add", "src")
+        self._git("commit", "-q", "-m", "Add module")
+        
+        self._write(os.path.join("src", "module.py"), "def beta():\n    pass\n")
+        content = ApiGenerator(self.repo_dir, self.logger, cache_dir=cache_dir).generate(repo_info)
+        self.assertIn("`beta()`", content)
+        
+        self._write(os.path.join("src", "module.py"), "def gamma():\n    pass\n")
+        content = ApiGenerator(self.repo_dir, self.logger, cache_dir=cache_dir).generate(repo_info)
+        self.assertIn("`gamma()`", content)
+        self.assertNotIn("`beta()`", content)
+    
+    def test_extract_section_ends_at_next_heading_of_same_level(self):
+        """Test that a section keeps its subsections and ends at the next heading of its level."""
+        content = "# Project\n\n## API\n\nIntro\n\n### Client\n\nDetails\n\n## License\n\nMIT\n"
+        generator = ApiGenerator(self.repo_dir, self.logger)
+        
+        self.assertEqual(
+            generator._extract_section(content, "API"),
+            "## API\n\nIntro\n\n### Client\n\nDetails"
+        )
+    
+    def test_extract_section_ignores_headings_in_code_blocks(self):
+        """Test that comment lines in fenced code blocks don't end a section."""
+        content = "## API\n\n```bash\n# Install\npip install project\n```\n\nUsage\n\n## License\n"
+        generator = ApiGenerator(self.repo_dir, self.logger)
+        
+        self.assertEqual(
+            generator._extract_section(content, "API"),
+            "## API\n\n```bash\n# Install\npip install project\n```\n\nUsage"
+        )
+    
+    def test_extract_python_elements(self):
+        """Test that top-level public definitions are extracted with their docstring summaries."""
+        content = (
+            b'class Client:\n    """Talks to the server."""\n    def method(self):\n        pass\n\n'
+            b'def run():\n    """Run it.\n\n    More details."""\n\n'
+            b'def _private():\n    pass\n'
+        )
+        self.assertEqual(
+            api_generator._extract_python_elements(content),
+            ([("Client", "Talks to the server.")], [("run", "Run it.")])
+        )
+    
+    def test_extract_python_elements_falls_back_to_patterns(self):
+        """Test that modules which don't parse are still documented."""
+        content = b'class Client:\n    """Talks to the server."""\n\ndef run(x):\n    """Run it."""\n    print "old syntax"\n'
+        with patch.object(api_generator, "_extract_python_elements_with_regex",
+                          wraps=api_generator._extract_python_elements_with_regex) as mock_fallback:
+            classes, functions = api_generator._extract_python_elements(content)
+        
+        mock_fallback.assert_called_once()
+        self.assertEqual(classes, [("Client", "Talks to the server.")])
+        self.assertEqual(functions, [("run", "Run it.")])
+    
+    def test_extract_java_elements(self):
+        """Test that Java classes and methods are returned with their JavaDoc summaries."""
+        content = (
+            b'/** Greets people. */\npublic class Greeter {\n'
+            b'    /** Says hello. */\n    public String hello(String name) {\n        return name;\n    }\n}\n'
+        )
+        self.assertEqual(
+            api_generator._extract_java_elements(content),
+            ([("Greeter", "Greets people.")], [("hello", "Says hello.")])
+        )
+    
+    def test_extract_javascript_methods_named_like_keywords(self):
+        """Test that JSDoc is matched to shorthand methods whose names start with a keyword."""
+        content = (
+            b'const api = {\n'
+            b'  /** Classifies input. */\n  classify: (x) => x,\n'
+            b'  /** Converts names. */\n  constantize: async (y) => y,\n'
+            b'  /** Returns one. */\n  other: () => 1,\n'
+            b'};\n'
+            b'/** Runs it. */\nfunction run() {}\n'
+        )
+        
+        self.assertEqual(
+            api_generator._extract_javascript_elements(content),
+            ([], [
+                ("classify", "Classifies input."),
+                ("constantize", "Converts names."),
+                ("other", "Returns one."),
+                ("run", "Runs it.")
+            ])
+        )
+    
+    def test_files_with_fewest_definitions_are_listed_compactly(self):
+        """Test that only the files with the most definitions get a detailed section."""
+        for index in range(1, 11):
+            self._write(os.path.join("src", f"module{index:02d}.py"), "def first():\n    pass\n\ndef second():\n    pass\n")
+        self._write(os.path.join("src", "module00.py"), "def only():\n    pass\n")
+        
+        content = ApiGenerator(self.repo_dir, self.logger).generate({"src_dirs": ["src"]})
+        
+        detailed, _, other_files = content.partition("### Other Files")
+        self.assertIn("### module10.py", detailed)
+        self.assertNotIn("module00.py", detailed)
+        self.assertIn("- `src/module00.py` (1 public definition)", other_files)
+
+    
+    def test_extraction_in_worker_processes(self):
+        """Test that extraction works in worker processes with a logger that can't be pickled."""
+        for index in range(5):
+            self._write(os.path.join("src", f"module{index}.py"), f"def function{index}():\n    pass\n")
+        
+        with patch.object(api_generator, "_MIN_FILES_FOR_PROCESS_POOL", 2), \
+                patch.object(api_generator.os, "cpu_count", return_value=2):
+            logger = MagicMock()
+            content = ApiGenerator(self.repo_dir, logger).generate({"src_dirs": ["src"]})
+        
+        # The pool ran rather than failing over to threads
+        logger.debug.assert_not_called()
+        for index in range(5):
+            self.assertIn(f"`function{index}()`", content)
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
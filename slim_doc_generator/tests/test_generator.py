@@ -5,6 +5,7 @@ import logging
 import os
 import tempfile
 import unittest
+from contextlib import ExitStack
 from unittest.mock import patch, MagicMock
 
 from slim_doc_generator.generator import SlimDocGenerator
@@ -13,30 +14,32 @@ from slim_doc_generator.generator import SlimDocGenerator
 class TestSlimDocGenerator(unittest.TestCase):
     """Test cases for the SlimDocGenerator class."""
     
-    def setUp(self):
-        """Set up test environment."""
-        self.test_repo = tempfile.mkdtemp()
-        self.output_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        """Set up the test repository and generator shared by all tests."""
+        cls.test_repo = tempfile.mkdtemp()
+        cls.output_dir = tempfile.mkdtemp()
         
         # Create test files in the test repo
-        with open(os.path.join(self.test_repo, "README.md"), "w") as f:
+        with open(os.path.join(cls.test_repo, "README.md"), "w") as f:
             f.write("# Test Project\n\nThis is a test project.")
         
-        os.makedirs(os.path.join(self.test_repo, "src"))
-        with open(os.path.join(self.test_repo, "src", "main.py"), "w") as f:
+        os.makedirs(os.path.join(cls.test_repo, "src"))
+        with open(os.path.join(cls.test_repo, "src", "main.py"), "w") as f:
             f.write("# Test Python file")
         
-        self.generator = SlimDocGenerator(
-            target_repo_path=self.test_repo,
-            output_dir=self.output_dir,
+        cls.generator = SlimDocGenerator(
+            target_repo_path=cls.test_repo,
+            output_dir=cls.output_dir,
             template_repo="https://github.com/NASA-AMMOS/slim-docsite-template.git"
         )
     
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up test environment."""
         import shutil
-        shutil.rmtree(self.test_repo)
-        shutil.rmtree(self.output_dir)
+        shutil.rmtree(cls.test_repo)
+        shutil.rmtree(cls.output_dir)
     
     def test_initialization(self):
         """Test generator initialization."""
@@ -71,38 +74,34 @@ class TestSlimDocGenerator(unittest.TestCase):
         mock_update_config.return_value = True
         mock_update_sidebars.return_value = True
         
-        # Create patches for content generators
-        patches = []
-        for section in ["overview", "installation", "api", "development", "contributing"]:
-            generator_path = f"slim_doc_generator.content.{section}_generator.{section.capitalize()}Generator.generate"
-            patch_obj = patch(generator_path)
-            mock_obj = patch_obj.start()
-            mock_obj.return_value = f"# Test {section.capitalize()} Content"
-            patches.append((patch_obj, mock_obj))
-        
-        # Run generate method
-        result = self.generator.generate()
-        
-        # Check result
-        self.assertTrue(result)
-        
-        # Verify mocks were called
-        mock_clone.assert_called_once()
-        mock_analyze.assert_called_once()
-        mock_update_config.assert_called_once()
-        mock_update_sidebars.assert_called_once()
-        
-        # Verify content generators were called
-        for _, mock_obj in patches:
-            mock_obj.assert_called_once()
-        
-        # Check if docs directory was created
-        docs_dir = os.path.join(self.output_dir, "docs")
-        self.assertTrue(os.path.exists(docs_dir))
-        
-        # Stop patches
-        for patch_obj, _ in patches:
-            patch_obj.stop()
+        # Patch the content generators; the stack stops the patches even if an assertion fails
+        with ExitStack() as stack:
+            generator_mocks = []
+            for section in ["overview", "installation", "api", "development", "contributing"]:
+                generator_path = f"slim_doc_generator.content.{section}_generator.{section.capitalize()}Generator.generate"
+                mock_obj = stack.enter_context(patch(generator_path))
+                mock_obj.return_value = f"# Test {section.capitalize()} Content"
+                generator_mocks.append(mock_obj)
+            
+            # Run generate method
+            result = self.generator.generate()
+            
+            # Check result
+            self.assertTrue(result)
+            
+            # Verify mocks were called
+            mock_clone.assert_called_once()
+            mock_analyze.assert_called_once()
+            mock_update_config.assert_called_once()
+            mock_update_sidebars.assert_called_once()
+            
+            # Verify content generators were called
+            for mock_obj in generator_mocks:
+                mock_obj.assert_called_once()
+            
+            # Check if docs directory was created
+            docs_dir = os.path.join(self.output_dir, "docs")
+            self.assertTrue(os.path.exists(docs_dir))
     
     @patch("slim_doc_generator.utils.helpers.run_command")
     def test_install_dependencies(self, mock_run):
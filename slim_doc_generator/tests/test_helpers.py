@@ -0,0 +1,96 @@
+"""
+Tests for the helper functions.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+from slim_doc_generator.utils.helpers import clean_api_doc, create_file_from_template, find_files_by_extension
+
+
+class TestCleanApiDoc(unittest.TestCase):
+    """Test cases for clean_api_doc."""
+    
+    def _clean(self, content):
+        """Clean content written to a temporary API doc and return the result."""
+        fd, path = tempfile.mkstemp(suffix=".md")
+        self.addCleanup(os.remove, path)
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        
+        clean_api_doc(path)
+        
+        with open(path) as f:
+            return f.read()
+    
+    def test_balanced_markup_is_kept(self):
+        """Test that tags with a closing tag or self-closing tags are not escaped."""
+        content = 'Use <a href="x">link</a> and <img src="y" />\n<b>bold</b> text\n'
+        self.assertEqual(self._clean(content), content)
+    
+    def test_type_parameters_are_escaped(self):
+        """Test that placeholder tags without a closing tag are escaped."""
+        self.assertEqual(self._clean("Returns <ES> tag\n"), "Returns \\<ES\\> tag\n")
+    
+    def test_unclosed_tags_are_escaped(self):
+        """Test that tags which are never closed are escaped."""
+        self.assertEqual(self._clean('Call <Foo bar="1"> here\n'), 'Call \\<Foo bar="1"> here\n')
+    
+    def test_closing_tag_of_escaped_tag_is_escaped(self):
+        """Test that escaping an opening tag doesn't leave its closing tag on a later line orphaned."""
+        content = '<Widget size="2">\ntext\n</Widget>\n'
+        self.assertEqual(self._clean(content), '\\<Widget size="2">\ntext\n\\</Widget>\n')
+    
+    def test_code_blocks_are_kept(self):
+        """Test that tags inside code blocks are not escaped."""
+        content = '```\n<Foo bar="1">\n```\n'
+        self.assertEqual(self._clean(content), content)
+
+
+
+class TestCreateFileFromTemplate(unittest.TestCase):
+    """Test cases for create_file_from_template."""
+    
+    def test_placeholders_are_replaced(self):
+        """Test that placeholders with or without spaces are replaced and unknown ones kept."""
+        output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, output_dir)
+        template_path = os.path.join(output_dir, "template.md")
+        output_path = os.path.join(output_dir, "docs", "page.md")
+        with open(template_path, "w") as f:
+            f.write("# {{name}}\n\n{{ description }} by {{ author }}\n")
+        
+        self.assertTrue(create_file_from_template(
+            template_path, output_path, {"name": "Project", "description": "A tool"}
+        ))
+        
+        with open(output_path) as f:
+            self.assertEqual(f.read(), "# Project\n\nA tool by {{ author }}\n")
+
+
+
+class TestFindFilesByExtension(unittest.TestCase):
+    """Test cases for find_files_by_extension."""
+    
+    def test_nested_directories_and_several_extensions(self):
+        """Test that files in nested directories are found for one or several extensions."""
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        for path in ["README.md", "docs/guide.md", "docs/api/index.mdx", "src/main.py", "src/notes.txt"]:
+            path = os.path.join(root, path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            open(path, "w").close()
+        
+        def found(extension):
+            return sorted(os.path.relpath(path, root) for path in find_files_by_extension(root, extension))
+        
+        self.assertEqual(found("md"), ["README.md", os.path.join("docs", "guide.md")])
+        self.assertEqual(
+            found(("md", "mdx", "py")),
+            ["README.md", os.path.join("docs", "api", "index.mdx"), os.path.join("docs", "guide.md"), os.path.join("src", "main.py")]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
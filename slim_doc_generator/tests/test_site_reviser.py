@@ -0,0 +1,72 @@
+"""
+Tests for the site reviser.
+"""
+import json
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+
+from slim_doc_generator.site_reviser import SiteReviser
+
+
+class FakeEnhancer:
+    """AI enhancer stand-in that answers combined landing page updates."""
+    
+    def __init__(self):
+        self.task_requests = 0
+    
+    def enhance(self, content, section_name, prompt_cache_key=None):
+        return content
+    
+    def enhance_tasks(self, shared_context, tasks):
+        self.task_requests += 1
+        return {
+            "index_js": "import React from 'react';\nexport default function Home() { return null; }\n",
+            "homepage_features": json.dumps({"FeatureList": "\n  {title: 'Fast'},\n"}),
+            "docusaurus_config": json.dumps({"title": "New Title", "tagline": "New tagline"})
+        }
+
+
+class TestSiteReviser(unittest.TestCase):
+    """Test cases for the SiteReviser class."""
+    
+    def setUp(self):
+        """Set up a minimal documentation site."""
+        self.site_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.site_dir)
+        self.logger = logging.getLogger("test")
+        
+        files = {
+            "docs/overview.md": "# Project\n\nA tool that does things.\n",
+            "src/pages/index.js": "import React from 'react';\nexport default function Home() {}\n",
+            "src/components/HomepageFeatures/index.js": "const FeatureList = [\n  {title: 'Old'},\n];\n",
+            "docusaurus.config.js": "const config = {\n  title: 'Old',\n  tagline: 'Old tagline',\n};\n"
+        }
+        for path, content in files.items():
+            path = os.path.join(self.site_dir, path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                f.write(content)
+    
+    def test_unchanged_site_is_not_revised_again(self):
+        """Test that a second revision with the same overview makes no AI request."""
+        enhancer = FakeEnhancer()
+        for _ in range(2):
+            self.assertTrue(SiteReviser(self.site_dir, self.logger, enhancer).revise())
+        
+        self.assertEqual(enhancer.task_requests, 1)
+    
+    def test_disabled_cache_revises_again(self):
+        """Test that a reviser created without caching revises every time and records nothing."""
+        enhancer = FakeEnhancer()
+        for _ in range(2):
+            self.assertTrue(SiteReviser(self.site_dir, self.logger, enhancer, use_cache=False).revise())
+        
+        self.assertEqual(enhancer.task_requests, 2)
+        self.assertFalse(os.path.exists(os.path.join(self.site_dir, ".slim_cache")))
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -4,10 +4,81 @@ Helper functions for the SLIM documentation generator.
 import logging
 import os
 import subprocess
-import yaml
 import re
+import shutil
+import tempfile
+import threading
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple, Union
 
+# Template variable placeholders like {{ name }}
+_TEMPLATE_VAR_RE = re.compile(r'\{\{\s*([\w.-]+)\s*\}\}')
+
+# Patterns used by the markdown helpers, compiled once
+_CODE_FENCE_RE = re.compile(r'^```(\w*)$')
+_HEADING_RE = re.compile(r'^#{1,6}\s')
+_BLOCKQUOTE_RE = re.compile(r'^>\s')
+_LIST_ITEM_RE = re.compile(r'^[-*+]\s')
+_INLINE_CODE_RE = re.compile(r'`[^`]+`')
+_HTML_TAG_RE = re.compile(r'<([A-Za-z][A-Za-z0-9_.-]*)(?:\s+[^>]*)?>')
+# Characters without which a line needs no MDX escaping
+_MDX_TRIGGER_CHARS = ('`', '<', '>', '{', '}')
+
+# Common HTML tags that MDX escaping preserves
+_COMMON_HTML_TAGS = frozenset({
+    # Block elements
+    'div', 'p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'footer', 'main', 'section', 'article',
+    'aside', 'nav', 'figure', 'figcaption', 'blockquote', 'pre', 'code', 'ul', 'ol', 'li', 'dl', 'dt',
+    'dd', 'table', 'thead', 'tbody', 'tr', 'td', 'th', 'form', 'fieldset', 'legend', 'hr',
+    
+    # Inline elements
+    'a', 'span', 'strong', 'em', 'i', 'b', 'u', 's', 'sub', 'sup', 'mark', 'q', 'cite', 'time',
+    'address', 'abbr', 'dfn', 'code', 'var', 'samp', 'kbd', 'data', 'small', 'br', 'wbr', 'img',
+    'picture', 'source', 'iframe', 'embed', 'object', 'param', 'audio', 'video', 'track', 'canvas',
+    'map', 'area', 'math', 'svg',
+    
+    # Form elements
+    'input', 'button', 'select', 'option', 'optgroup', 'textarea', 'label', 'datalist', 'output',
+    'progress', 'meter',
+})
+
+# Unescaped curly braces, and angle brackets that don't look like part of an HTML tag
+_SPECIAL_CHAR_RE = re.compile(r'(?<!\\)[{}]|(?<!\\)<(?![a-zA-Z\/])|(?<![a-zA-Z\/])(?<!\\)>')
+_TYPE_PARAM_RE = re.compile(r'(?<![a-zA-Z/="`])(<)([A-Za-z][A-Za-z0-9_]*)(>)')
+# Opening tags with attributes or without a closing ">", and closing tags
+_TAG_OPENING_RE = re.compile(r'(?<!\\)<([A-Za-z][A-Za-z0-9_]*)(?![A-Za-z0-9_])(?!\s*/?>)')
+_TAG_CLOSING_RE = re.compile(r'(?<!\\)</([A-Za-z][A-Za-z0-9_]*)\s*>')
+
+# Placeholder-like sequences in API docs that MDX would parse as tags, and their escaped forms
+_PROBLEMATIC_SEQUENCES = {
+    '<ES>': '\\<ES\\>',
+    '<Type>': '\\<Type\\>',
+    '<Generic>': '\\<Generic\\>',
+    '<Value>': '\\<Value\\>',
+    '<Key>': '\\<Key\\>',
+    '<Parameter>': '\\<Parameter\\>',
+    '<Class>': '\\<Class\\>',
+    '<Method>': '\\<Method\\>',
+    '<Function>': '\\<Function\\>',
+    '<Property>': '\\<Property\\>',
+}
+_PROBLEMATIC_SEQUENCE_RE = re.compile('|'.join(re.escape(seq) for seq in _PROBLEMATIC_SEQUENCES))
+
+
+@lru_cache(maxsize=None)
+def _yaml_safe_loader():
+    """
+    Get the fastest available safe YAML loader.
+    
+    PyYAML is imported here so that modules using only the lightweight helpers don't load it.
+    
+    Returns:
+        The libyaml-based CSafeLoader if PyYAML was built with it, SafeLoader otherwise
+    """
+    import yaml
+    
+    return getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 def load_config(config_file: str) -> Dict:
     """
@@ -19,10 +90,14 @@ def load_config(config_file: str) -> Dict:
     Returns:
         Configuration dictionary
     """
+    import yaml
+    
     try:
-        with open(config_file, 'r') as f:
-            config = yaml.safe_load(f)
-            return config or {}
+        # Hand the raw bytes to PyYAML, which detects the encoding itself
+        with open(config_file, 'rb') as f:
+            data = f.read()
+        config = yaml.load(data, Loader=_yaml_safe_loader())
+        return config or {}
     except Exception as e:
         logging.warning(f"Error loading configuration from {config_file}: {str(e)}")
         return {}
@@ -50,20 +125,26 @@ def run_command(cmd: list, cwd: str, logger: logging.Logger) -> bool:
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
-            bufsize=1,  # Line buffered
             universal_newlines=True
         )
         
+        # Drain stderr on a separate thread so a child writing a lot to it can't block
+        # on a full pipe while we wait for stdout
+        stderr_lines = []
+        stderr_reader = threading.Thread(target=lambda: stderr_lines.extend(process.stderr), daemon=True)
+        stderr_reader.start()
+        
         # Stream stdout in real-time
         for line in process.stdout:
             logger.info(line.strip())
         
         # Wait for process to complete
         process.wait()
+        stderr_reader.join()
         
-        # Read stderr if there was an error
+        # Log stderr if there was an error
         if process.returncode != 0:
-            for line in process.stderr:
+            for line in stderr_lines:
                 logger.error(line.strip())
             
             logger.error(f"Command failed with return code {process.returncode}")
@@ -98,15 +179,19 @@ def create_file_from_template(template_path: str, output_path: str, variables: D
         with open(template_path, 'r') as f:
             template_content = f.read()
         
-        # Replace variables
-        for var_name, var_value in variables.items():
-            template_content = template_content.replace(f"{{{{ {var_name} }}}}", str(var_value))
-        
-        # Create output directory if it doesn't exist
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        # Replace variables in a single pass; unknown placeholders are left as they are
+        template_content = _TEMPLATE_VAR_RE.sub(
+            lambda match: str(variables[match.group(1)]) if match.group(1) in variables else match.group(0),
+            template_content
+        )
         
-        # Write output file
-        with open(output_path, 'w') as f:
+        # Write output file, creating its directory only when it doesn't exist yet
+        try:
+            f = open(output_path, 'w')
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            f = open(output_path, 'w')
+        with f:
             f.write(template_content)
         
         return True
@@ -116,25 +201,90 @@ def create_file_from_template(template_path: str, output_path: str, variables: D
         return False
 
 
-def find_files_by_extension(directory: str, extension: str) -> list:
+def find_files_by_extension(directory: str, extension: Union[str, Tuple[str, ...]]) -> list:
     """
     Find all files with a specific extension in a directory (recursively).
     
     Args:
         directory: Directory to search in
-        extension: File extension to search for (without the dot)
+        extension: File extension to search for (without the dot), or a tuple of extensions
+            to find files with any of them in a single pass
         
     Returns:
         List of file paths
     """
+    extensions = (extension,) if isinstance(extension, str) else extension
+    suffixes = tuple(f".{ext}" for ext in extensions)
     files = []
-    for root, _, filenames in os.walk(directory):
-        for filename in filenames:
-            if filename.endswith(f".{extension}"):
-                files.append(os.path.join(root, filename))
+    
+    # Walk the tree with os.scandir, whose entries carry the file type from the directory listing,
+    # so most files need no separate stat call
+    stack = [directory]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    
+                    if is_dir:
+                        # Like os.walk, don't descend into symlinked directories
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif entry.name.endswith(suffixes):
+                        files.append(entry.path)
+        except OSError:
+            # Unreadable directories are skipped, as os.walk does
+            continue
+        
+        # Visit subdirectories in listing order, after the files of their parent
+        stack.extend(reversed(subdirs))
     return files
 
 
+def file_signature(paths: List[str]) -> Tuple:
+    """
+    Summarize the on-disk state of files so cached results derived from them can be validated.
+    
+    Args:
+        paths: Paths of files or directories
+        
+    Returns:
+        Tuple of (path, modification time, size) entries, with None values for missing paths
+    """
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            signature.append((path, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append((path, None, None))
+    return tuple(signature)
+
+
+def read_text_files(paths: List[str]) -> Dict[str, str]:
+    """
+    Read several UTF-8 text files, skipping any that can't be read.
+    
+    Args:
+        paths: Paths of the files to read
+        
+    Returns:
+        File contents keyed by path
+    """
+    contents = {}
+    for path in paths:
+        try:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                contents[path] = f.read()
+        except OSError:
+            continue
+    return contents
+
+
 def extract_frontmatter(content: str) -> tuple:
     """
     Extract frontmatter from markdown content.
@@ -145,17 +295,17 @@ def extract_frontmatter(content: str) -> tuple:
     Returns:
         Tuple of (frontmatter_dict, content_without_frontmatter)
     """
-    import re
     import yaml
     
-    # Match frontmatter between --- markers
-    frontmatter_match = re.match(r'^---\n(.*?)\n---\n', content, re.DOTALL)
+    # Find frontmatter between --- markers with plain string searches, so content without
+    # frontmatter costs only a prefix check
+    end = content.find('\n---\n', 4) if content.startswith('---\n') else -1
     
-    if frontmatter_match:
-        frontmatter_yaml = frontmatter_match.group(1)
+    if end >= 0:
+        frontmatter_yaml = content[4:end]
         try:
-            frontmatter = yaml.safe_load(frontmatter_yaml)
-            content_without_frontmatter = content[frontmatter_match.end():]
+            frontmatter = yaml.load(frontmatter_yaml, Loader=_yaml_safe_loader())
+            content_without_frontmatter = content[end + 5:]
             return frontmatter, content_without_frontmatter
         except Exception as e:
             logging.warning(f"Error parsing frontmatter: {str(e)}")
@@ -174,33 +324,26 @@ def escape_mdx_special_characters(content: str) -> str:
     Returns:
         Processed content with special characters escaped
     """
-    if not content:
+    # Content without any special characters needs no escaping, whatever its code blocks
+    if not content or not any(char in content for char in _MDX_TRIGGER_CHARS):
         return content
         
     # Keep track of code block state
     in_code_block = False
     
-    # Process content line by line
+    # Process content line by line, replacing lines in place rather than building a second list
     lines = content.split('\n')
-    processed_lines = []
     
-    for line in lines:
+    for i, line in enumerate(lines):
         # Check for code block delimiters (```javascript, ```python, etc.)
-        code_block_match = re.match(r'^```(\w*)$', line)
-        if code_block_match:
+        if line.startswith('```') and _CODE_FENCE_RE.match(line):
             in_code_block = not in_code_block  # Toggle code block state
-            processed_lines.append(line)
-            continue
-            
-        if not in_code_block:
+        elif not in_code_block:
             # Process line for potential HTML-like tags and other special characters
-            processed_line = _process_line(line)
-            processed_lines.append(processed_line)
-        else:
-            # In a code block - no need to escape special characters
-            processed_lines.append(line)
+            lines[i] = _process_line(line)
+        # In a code block - no need to escape special characters
     
-    return '\n'.join(processed_lines)
+    return '\n'.join(lines)
 
 
 def _process_line(line: str) -> str:
@@ -213,8 +356,12 @@ def _process_line(line: str) -> str:
     Returns:
         Processed line with special characters escaped
     """
+    # Most prose lines contain nothing that needs escaping
+    if not any(char in line for char in _MDX_TRIGGER_CHARS):
+        return line
+    
     # Skip processing for lines that are Markdown headings, links, etc.
-    if re.match(r'^#{1,6}\s', line) or re.match(r'^>\s', line) or re.match(r'^[-*+]\s', line):
+    if _HEADING_RE.match(line) or _BLOCKQUOTE_RE.match(line) or _LIST_ITEM_RE.match(line):
         return line
         
     # Handle inline code blocks first
@@ -222,7 +369,7 @@ def _process_line(line: str) -> str:
     current_pos = 0
     
     # Split by inline code (text wrapped in backticks)
-    for match in re.finditer(r'`[^`]+`', line):
+    for match in _INLINE_CODE_RE.finditer(line):
         start, end = match.span()
         
         # Add text before the code with escaped characters
@@ -252,7 +399,7 @@ def _process_text(text: str) -> str:
         Processed text with special characters escaped
     """
     # First, find any potential HTML-like tags
-    tag_matches = list(re.finditer(r'<([A-Za-z][A-Za-z0-9_.-]*)(?:\s+[^>]*)?>', text))
+    tag_matches = list(_HTML_TAG_RE.finditer(text))
     
     if not tag_matches:
         # No HTML-like tags, just escape special characters
@@ -301,16 +448,11 @@ def _escape_special_chars(text: str) -> str:
     Returns:
         Text with special characters escaped
     """
-    # Escape curly braces that aren't already escaped
-    text = re.sub(r'(?<!\\){', '\\{', text)
-    text = re.sub(r'(?<!\\)}', '\\}', text)
-    
-    # Escape angle brackets not followed by standard HTML tag patterns
-    # More careful approach to avoid double-escaping
-    text = re.sub(r'(?<!\\)<(?![a-zA-Z\/])', '\\<', text)
-    text = re.sub(r'(?<![a-zA-Z\/])(?<!\\)>', '\\>', text)
-    
-    return text
+    # Escape curly braces that aren't already escaped, and angle brackets not following
+    # standard HTML tag patterns, in a single pass. Escaping only inserts a backslash before
+    # the escaped character, so every lookbehind sees the same character it would have seen
+    # in separate passes.
+    return _SPECIAL_CHAR_RE.sub(r'\\\g<0>', text)
 
 
 def _is_common_html_tag(tag_name: str) -> bool:
@@ -323,25 +465,44 @@ def _is_common_html_tag(tag_name: str) -> bool:
     Returns:
         True if it's a common HTML tag, False otherwise
     """
-    common_tags = {
-        # Block elements
-        'div', 'p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'footer', 'main', 'section', 'article',
-        'aside', 'nav', 'figure', 'figcaption', 'blockquote', 'pre', 'code', 'ul', 'ol', 'li', 'dl', 'dt',
-        'dd', 'table', 'thead', 'tbody', 'tr', 'td', 'th', 'form', 'fieldset', 'legend', 'hr',
-        
-        # Inline elements
-        'a', 'span', 'strong', 'em', 'i', 'b', 'u', 's', 'sub', 'sup', 'mark', 'q', 'cite', 'time',
-        'address', 'abbr', 'dfn', 'code', 'var', 'samp', 'kbd', 'data', 'small', 'br', 'wbr', 'img',
-        'picture', 'source', 'iframe', 'embed', 'object', 'param', 'audio', 'video', 'track', 'canvas',
-        'map', 'area', 'math', 'svg',
+    # Check if it starts with uppercase (likely a React component) or if it's a common HTML tag
+    return bool(tag_name) and (tag_name[0].isupper() or tag_name.lower() in _COMMON_HTML_TAGS)
+
+
+def _escape_unbalanced_tags(text: str, escaped_tags: Dict[str, int]) -> str:
+    """
+    Escape opening tags in a line that MDX couldn't parse as balanced markup.
+    
+    Tags that close themselves with "/>" or whose closing tag follows on the same line are
+    left alone. The closing tags of tags escaped on earlier lines are escaped as well, so no
+    closing tag is left without its opening tag.
+    
+    Args:
+        text: Line of markdown outside code blocks
+        escaped_tags: Number of escaped opening tags still waiting for their closing tag, by
+            tag name; updated in place
         
-        # Form elements
-        'input', 'button', 'select', 'option', 'optgroup', 'textarea', 'label', 'datalist', 'output',
-        'progress', 'meter',
-    }
+    Returns:
+        Line with the unbalanced tags escaped
+    """
+    def escape_closing(match):
+        name = match.group(1)
+        if not escaped_tags.get(name):
+            return match.group(0)
+        escaped_tags[name] -= 1
+        return '\\' + match.group(0)
     
-    # Check if it's a common HTML tag or if it starts with uppercase (likely a React component)
-    return tag_name.lower() in common_tags or (tag_name[0].isupper() if tag_name else False)
+    def escape_opening(match):
+        name = match.group(1)
+        tag_end = text.find('>', match.end())
+        if tag_end >= 0 and (text[tag_end - 1] == '/' or f'</{name}>' in text[tag_end:]):
+            return match.group(0)
+        escaped_tags[name] = escaped_tags.get(name, 0) + 1
+        return '\\<' + name
+    
+    if escaped_tags:
+        text = _TAG_CLOSING_RE.sub(escape_closing, text)
+    return _TAG_OPENING_RE.sub(escape_opening, text)
 
 
 def clean_api_doc(api_doc_path: str) -> None:
@@ -354,57 +515,58 @@ def clean_api_doc(api_doc_path: str) -> None:
     """
     if not os.path.exists(api_doc_path):
         return
-        
+    
+    # Specific fixes for common API documentation issues
+    
+    tmp_path = None
     try:
-        # Read the file content
-        with open(api_doc_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # None of the fixes spans lines, so the file is cleaned one line at a time into a
+        # temporary file that then replaces it
+        with open(api_doc_path, 'r', encoding='utf-8') as source, tempfile.NamedTemporaryFile(
+            'w', encoding='utf-8', dir=os.path.dirname(os.path.abspath(api_doc_path)),
+            suffix='.tmp', delete=False
+        ) as cleaned:
+            tmp_path = cleaned.name
+            in_code_block = False
+            escaped_tags = {}
             
-        # Specific fixes for common API documentation issues
-        
-        # Fix 1: Replace angle brackets around type parameters (like <T> or <ES>)
-        # This handles cases like "Type<T>" or "<ES> tag"
-        content = re.sub(r'(?<![a-zA-Z/="`])(<)([A-Za-z][A-Za-z0-9_]*)(>)', r'\\<\2\\>', content)
-        
-        # Fix 2: Fix unclosed apparent HTML tags in text
-        # Look for potential unclosed tags in sentences (not in code blocks)
-        lines = content.split('\n')
-        in_code_block = False
-        for i, line in enumerate(lines):
-            if line.strip() == '```' or re.match(r'^```\w*$', line.strip()):
-                in_code_block = not in_code_block
-                continue
+            for line in source:
+                text = line.rstrip('\n')
+                newline = line[len(text):]
                 
-            if not in_code_block and '<' in line and '>' in line:
-                # Outside code blocks, escape any remaining angle brackets that look suspicious
-                lines[i] = re.sub(r'<([A-Za-z][A-Za-Z0-9_]*)(?!\s*[/>])(?!.*</\1>)', r'\\<\1', line)
-                lines[i] = re.sub(r'(?<!\\)<([A-Za-z][A-Za-Z0-9_]*)\s+', r'\\<\1 ', lines[i])
+                # Fix 1: Replace angle brackets around type parameters (like <T> or <ES>)
+                # This handles cases like "Type<T>" or "<ES> tag"; tags closed later on the
+                # line, like "<b>bold</b>", are markup and kept
+                text = _TYPE_PARAM_RE.sub(
+                    lambda match: match.group(0) if f'</{match.group(2)}>' in match.string[match.end():]
+                    else f'\\<{match.group(2)}\\>',
+                    text
+                )
                 
-        content = '\n'.join(lines)
-        
-        # Fix 3: Replace problematic character sequences
-        problematic_sequences = [
-            ('<ES>', '\\<ES\\>'),
-            ('<Type>', '\\<Type\\>'),
-            ('<Generic>', '\\<Generic\\>'),
-            ('<Value>', '\\<Value\\>'),
-            ('<Key>', '\\<Key\\>'),
-            ('<Parameter>', '\\<Parameter\\>'),
-            ('<Class>', '\\<Class\\>'),
-            ('<Method>', '\\<Method\\>'),
-            ('<Function>', '\\<Function\\>'),
-            ('<Property>', '\\<Property\\>'),
-        ]
-        
-        for seq, replacement in problematic_sequences:
-            content = content.replace(seq, replacement)
+                # Fix 2: Fix unclosed apparent HTML tags in text
+                # Look for potential unclosed tags in sentences (not in code blocks)
+                if _CODE_FENCE_RE.match(text.strip()):
+                    in_code_block = not in_code_block
+                elif not in_code_block and '<' in text:
+                    # Outside code blocks, escape tags that are never closed; balanced and
+                    # self-closing markup is kept
+                    text = _escape_unbalanced_tags(text, escaped_tags)
+                
+                # Fix 3: Replace problematic character sequences
+                text = _PROBLEMATIC_SEQUENCE_RE.sub(lambda match: _PROBLEMATIC_SEQUENCES[match.group(0)], text)
+                
+                cleaned.write(text + newline)
         
         # Write the cleaned content back
-        with open(api_doc_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-            
+        shutil.copymode(api_doc_path, tmp_path)
+        os.replace(tmp_path, api_doc_path)
+        tmp_path = None
+        
         logging.info(f"Cleaned API documentation for MDX compatibility")
             
     except Exception as e:
         logging.error(f"Error cleaning API documentation: {str(e)}")
-        # Continue with generation even if cleaning fails
\ No newline at end of file
+        # Continue with generation even if cleaning fails.
+    finally:
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
\ No newline at end of file